@@ -3,10 +3,44 @@ Logging configuration for TPC-C benchmark.
 Provides centralized logging setup for both console and file output.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
+
+# Background listener that owns the real handlers; see setup_logging()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background logging listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _write_directly_after_fork() -> None:
+    """Attach the listener's handlers to the root logger in a forked child.
+
+    The child inherits the QueueHandler but not the listener thread, so its
+    records would pile up in a queue nothing drains. Forked worker processes
+    (see TransactionExecutor.run_concurrent_benchmark) write their records
+    directly instead.
+    """
+    global _listener
+    if _listener is None:
+        return
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    for handler in _listener.handlers:
+        root_logger.addHandler(handler)
+    # The listener thread belongs to the parent; never stop it from here
+    _listener = None
 
 
 def setup_logging(
@@ -18,6 +52,10 @@ def setup_logging(
     """
     Configure logging to output to both console and file.
 
+    Records are handed to a QueueHandler on the root logger and written by a
+    background QueueListener, so callers never block on console or file I/O
+    (including log rotation).
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file. If None, uses default location
@@ -49,8 +87,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers and stop a listener from a previous call
     root_logger.handlers.clear()
+    _stop_listener()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -64,15 +103,25 @@ def setup_logging(
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
 
-    # Add handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Route records through a queue; the listener thread does the actual I/O
+    global _listener
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     # Log the configuration
     logger = logging.getLogger(__name__)
     logger.info(f"Logging configured: level={log_level}, file={log_file}")
 
 
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_write_directly_after_fork)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the specified name."""
     return logging.getLogger(name)
@@ -4,11 +4,14 @@ Refactored based on tpcc module's design for better maintainability.
 """
 
 import logging
-from typing import Dict, Any, Iterator
-from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from datetime import datetime
 import random
 import string
 
+import numpy as np
+
 from ..models import (
     Warehouse,
     District,
@@ -23,18 +26,74 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Rows drawn per vectorized batch; bounds the size of the temporary arrays
+BATCH_SIZE = 10000
+
+# ol_delivery_d of order lines that have not been delivered yet
+UNDELIVERED_TIMESTAMP = "1970-01-01 00:00:00"
+
+_ALNUM = tuple(string.ascii_letters + string.digits)
+_UPPER = tuple(string.ascii_uppercase)
+_UPPER_DIGITS = tuple(string.ascii_uppercase + string.digits)
+
+_CITY_NAMES = ("Springfield", "Rivertown", "Oakland", "Madison", "Lincoln", "Franklin")
+_STATE_CODES = ("CA", "NY", "TX", "FL", "IL", "PA", "OH", "GA", "NC", "MI")
+_PREFIXES = ("Red", "Blue", "Green", "Large", "Small", "Premium", "Standard")
+_PRODUCTS = ("Widget", "Gadget", "Tool", "Device", "Product", "Item")
+# Every "<prefix> <product>" pair, so an item name is a single choice
+_ITEM_TITLES = tuple(
+    f"{prefix} {product}" for prefix in _PREFIXES for product in _PRODUCTS
+)
+_FIRST = ("John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Edward", "Fiona")
+_SYLLABLES = (
+    "BAR",
+    "OUGHT",
+    "ABLE",
+    "PRI",
+    "PRES",
+    "ESE",
+    "ANTI",
+    "CALLY",
+    "ATION",
+    "EING",
+)
+
+
+def _compute_last_name(customer_id: int) -> str:
+    """Build a last name from the TPC-C syllables for a customer ID."""
+    if customer_id < 1000:
+        return _SYLLABLES[customer_id // 100]
+    return _SYLLABLES[customer_id % 1000 // 100] + _SYLLABLES[customer_id // 1000]
+
+
+# Every customer ID in a district (1-3000) maps to a fixed name; index 0 unused
+_LAST_NAMES = tuple(_compute_last_name(c_id) for c_id in range(3001))
+
+# Bound once so the scalar helpers call straight into the random module
+_randint = random.randint
+_uniform = random.uniform
+_choice = random.choice
+_choices = random.choices
+
+# Bound str.format methods for the fixed-layout scalar fields
+_ZIP_FMT = "{:d}{:d}".format
+_PHONE_FMT = "({:d}) {:d}-{:d}".format
+_STREET_FMT = "{:d} {} St".format
+
 
 class TpccDataGenerator:
     """Generates TPC-C compliant test data with proper scaling."""
 
-    def __init__(self, scale_factor: int = 1):
+    def __init__(self, scale_factor: int = 1, rng: Optional[random.Random] = None):
         """Initialize data generator with scale factor.
 
         Args:
             scale_factor: Number of warehouses to generate (default: 1)
+            rng: Private random.Random for the get_random_* helpers (default:
+                the random module's shared generator)
         """
         self.scale_factor = max(1, scale_factor)
-        self.random = RandomDataGenerator()
+        self.random = RandomDataGenerator(rng=rng)
 
         # TPC-C constants
         self.WAREHOUSES_PER_SCALE = 1
@@ -44,201 +103,358 @@ class TpccDataGenerator:
         self.ORDERS_PER_DISTRICT = 3000
         self.NEW_ORDERS_PER_DISTRICT = 900
 
+        # Per-column [low, high] of an order line's random draws: item ID,
+        # remote-supply percentile, remote supply warehouse and quantity
+        self._order_line_low = np.array([1, 0, 1, 1])
+        self._order_line_high = np.array([self.ITEMS_TOTAL, 99, self.scale_factor, 10])
+
+    # Column builders: each returns one batch of a table as a dict mapping model
+    # field names to equally sized NumPy arrays (structure of arrays).
+    def warehouse_columns(self) -> Dict[str, np.ndarray]:
+        """Generate all warehouses as column arrays."""
+        rng = self.random
+        n = self.WAREHOUSES_PER_SCALE * self.scale_factor
+        w_ids = np.arange(1, n + 1, dtype=np.int32)
+
+        return {
+            "w_id": w_ids,
+            "w_name": np.char.add("W", np.char.zfill(w_ids.astype(str), 2)),
+            "w_street_1": rng.generate_street_addresses(n),
+            "w_street_2": rng.generate_street_addresses(n),
+            "w_city": rng.generate_cities(n),
+            "w_state": rng.generate_states(n),
+            "w_zip": rng.generate_zips(n),
+            "w_tax": rng.generate_taxes(n),
+            "w_ytd": np.full(n, 300000.0),
+        }
+
+    def district_columns(self, w_id: int) -> Dict[str, np.ndarray]:
+        """Generate the districts of one warehouse as column arrays."""
+        rng = self.random
+        n = self.DISTRICTS_PER_WAREHOUSE
+        d_ids = np.arange(1, n + 1, dtype=np.int32)
+
+        return {
+            "d_id": d_ids,
+            "d_w_id": np.full(n, w_id, dtype=np.int32),
+            "d_name": np.char.add("D", np.char.zfill(d_ids.astype(str), 2)),
+            "d_street_1": rng.generate_street_addresses(n),
+            "d_street_2": rng.generate_street_addresses(n),
+            "d_city": rng.generate_cities(n),
+            "d_state": rng.generate_states(n),
+            "d_zip": rng.generate_zips(n),
+            "d_tax": rng.generate_taxes(n),
+            "d_ytd": np.full(n, 30000.0),
+            "d_next_o_id": np.full(n, 3001, dtype=np.int32),
+        }
+
+    def customer_columns(self, w_id: int, d_id: int) -> Dict[str, np.ndarray]:
+        """Generate the customers of one district as column arrays."""
+        rng = self.random
+        n = self.CUSTOMERS_PER_DISTRICT
+        c_ids = np.arange(1, n + 1, dtype=np.int32)
+
+        return {
+            "c_id": c_ids,
+            "c_d_id": np.full(n, d_id, dtype=np.int32),
+            "c_w_id": np.full(n, w_id, dtype=np.int32),
+            "c_first": rng.generate_first_names(n),
+            "c_middle": np.full(n, "OE"),
+            "c_last": rng.generate_last_names(c_ids),
+            "c_street_1": rng.generate_street_addresses(n),
+            "c_street_2": rng.generate_street_addresses(n),
+            "c_city": rng.generate_cities(n),
+            "c_state": rng.generate_states(n),
+            "c_zip": rng.generate_zips(n),
+            "c_phone": rng.generate_phones(n),
+            "c_since": rng.generate_timestamps(n),
+            "c_credit": np.where(rng.random_ints(0, 100, n) < 90, "GC", "BC"),
+            "c_credit_lim": np.full(n, 50000.0),
+            "c_discount": rng.generate_discounts(n),
+            "c_balance": np.full(n, 10.5),
+            "c_ytd_payment": np.full(n, 10.5),
+            "c_payment_cnt": np.ones(n, dtype=np.int32),
+            "c_delivery_cnt": np.zeros(n, dtype=np.int32),
+            "c_data": rng.generate_data_batch(n, 50, 300),
+        }
+
+    def item_columns(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Generate items [start, stop) as column arrays."""
+        rng = self.random
+        n = stop - start
+
+        return {
+            "i_id": np.arange(start, stop, dtype=np.int32),
+            "i_im_id": rng.random_ints(1, 10000, n).astype(np.int32),
+            "i_name": rng.generate_item_names(n),
+            "i_price": rng.generate_prices(n),
+            "i_data": rng.generate_original_data_batch(n, 26, 50),
+        }
+
+    def stock_columns(self, w_id: int, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Generate stock rows [start, stop) of a warehouse as column arrays.
+
+        Args:
+            w_id: Warehouse ID
+            start: First item ID of the batch
+            stop: Item ID one past the end of the batch
+
+        Returns:
+            Dict mapping Stock field names to equally sized arrays
+        """
+        rng = self.random
+        n = stop - start
+        # One draw covers all ten s_dist_xx columns of the batch
+        dist_info = np.reshape(rng.generate_dist_infos(n * 10), (n, 10))
+        zeros = np.zeros(n, dtype=np.int32)
+
+        columns = {
+            "s_i_id": np.arange(start, stop, dtype=np.int32),
+            "s_w_id": np.full(n, w_id, dtype=np.int32),
+            "s_quantity": rng.random_ints(10, 100, n).astype(np.int32),
+        }
+        for i in range(10):
+            columns[f"s_dist_{i + 1:02d}"] = dist_info[:, i]
+        columns["s_ytd"] = zeros
+        columns["s_order_cnt"] = zeros
+        columns["s_remote_cnt"] = zeros
+        columns["s_data"] = rng.generate_original_data_batch(n, 26, 50)
+        return columns
+
+    def order_columns(self, w_id: int, d_id: int) -> Dict[str, np.ndarray]:
+        """Generate the orders of one district as column arrays."""
+        rng = self.random
+        n = self.ORDERS_PER_DISTRICT
+        o_ids = np.arange(1, n + 1, dtype=np.int32)
+
+        return {
+            "o_id": o_ids,
+            "o_c_id": rng.random_ints(1, 3000, n).astype(np.int32),
+            "o_d_id": np.full(n, d_id, dtype=np.int32),
+            "o_w_id": np.full(n, w_id, dtype=np.int32),
+            "o_entry_d": rng.generate_timestamps(n),
+            "o_carrier_id": np.where(o_ids > 2100, 0, rng.random_ints(1, 10, n)),
+            "o_ol_cnt": np.full(n, 10, dtype=np.int32),
+            "o_all_local": np.ones(n, dtype=np.int32),
+        }
+
+    def new_order_columns(self, w_id: int, d_id: int) -> Dict[str, np.ndarray]:
+        """Generate the new orders of one district as column arrays."""
+        n = self.NEW_ORDERS_PER_DISTRICT
+
+        return {
+            "no_o_id": np.arange(2101, 2101 + n, dtype=np.int32),
+            "no_d_id": np.full(n, d_id, dtype=np.int32),
+            "no_w_id": np.full(n, w_id, dtype=np.int32),
+        }
+
+    def history_columns(self, w_id: int, d_id: int) -> Dict[str, np.ndarray]:
+        """Generate the history rows of one district as column arrays."""
+        n = self.CUSTOMERS_PER_DISTRICT
+        d_ids = np.full(n, d_id, dtype=np.int32)
+        w_ids = np.full(n, w_id, dtype=np.int32)
+
+        return {
+            "h_c_id": np.arange(1, n + 1, dtype=np.int32),
+            "h_c_d_id": d_ids,
+            "h_c_w_id": w_ids,
+            "h_d_id": d_ids,
+            "h_w_id": w_ids,
+            "h_date": self.random.generate_timestamps(n),
+            "h_amount": np.full(n, 10.0),  # Initial payment
+            "h_data": np.full(n, "Initial deposit"),
+        }
+
+    @cached_property
+    def _order_line_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-district (o_id, ol_number, delivered mask) arrays, built once."""
+        ol_cnt = 10
+        o_ids = np.repeat(
+            np.arange(1, self.ORDERS_PER_DISTRICT + 1, dtype=np.int32), ol_cnt
+        )
+        ol_numbers = np.tile(
+            np.arange(1, ol_cnt + 1, dtype=np.int32), self.ORDERS_PER_DISTRICT
+        )
+        # For orders <= 2100, delivery info is populated
+        delivered = np.arange(1, self.ORDERS_PER_DISTRICT + 1) <= 2100
+        return o_ids, ol_numbers, delivered
+
+    def order_line_columns(self, w_id: int, d_id: int) -> Dict[str, np.ndarray]:
+        """Generate the order lines of one district as column arrays.
+
+        Per-order values (the delivery date) are drawn once per order and
+        repeated across its lines; per-line values are drawn for the whole
+        district in one call each.
+
+        Args:
+            w_id: Warehouse ID
+            d_id: District ID
+
+        Returns:
+            Dict mapping OrderLine field names to equally sized arrays
+        """
+        rng = self.random
+        o_ids, ol_numbers, delivered = self._order_line_index
+        n = len(o_ids)
+        ol_cnt = n // self.ORDERS_PER_DISTRICT
+        quantities = rng.random_ints(1, 10, n).astype(np.int32)
+        delivery_d = np.where(
+            delivered,
+            rng.generate_timestamps(self.ORDERS_PER_DISTRICT),
+            UNDELIVERED_TIMESTAMP,
+        )
+
+        return {
+            "ol_o_id": o_ids,
+            "ol_d_id": np.full(n, d_id, dtype=np.int32),
+            "ol_w_id": np.full(n, w_id, dtype=np.int32),
+            "ol_number": ol_numbers,
+            "ol_i_id": rng.random_ints(1, self.ITEMS_TOTAL, n).astype(np.int32),
+            "ol_supply_w_id": np.full(n, w_id, dtype=np.int32),
+            "ol_delivery_d": np.repeat(delivery_d, ol_cnt),
+            "ol_quantity": quantities,
+            "ol_amount": quantities * rng.generate_prices(n),
+            "ol_dist_info": rng.generate_dist_infos(n),
+        }
+
+    @cached_property
+    def _warehouse_ids(self) -> range:
+        """Warehouse IDs covered by the scale factor, fixed at first use."""
+        return range(1, self.WAREHOUSES_PER_SCALE * self.scale_factor + 1)
+
+    @cached_property
+    def _district_ids(self) -> range:
+        """District IDs of one warehouse, fixed at first use."""
+        return range(1, self.DISTRICTS_PER_WAREHOUSE + 1)
+
+    @cached_property
+    def _item_slices(self) -> Tuple[Tuple[int, int], ...]:
+        """Half-open [start, stop) item ID bounds of each BATCH_SIZE batch."""
+        stop = self.ITEMS_TOTAL + 1
+        return tuple(
+            (start, min(start + BATCH_SIZE, stop))
+            for start in range(1, stop, BATCH_SIZE)
+        )
+
+    def _per_district(
+        self, build, warehouse_ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield build(w_id, d_id) for every district of the given warehouses."""
+        district_ids = self._district_ids
+        if warehouse_ids is None:
+            warehouse_ids = self._warehouse_ids
+        for w_id in warehouse_ids:
+            for d_id in district_ids:
+                yield build(w_id, d_id)
+
+    def _item_batches(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield the item catalog in BATCH_SIZE column batches."""
+        for start, stop in self._item_slices:
+            yield self.item_columns(start, stop)
+
+    def _stock_batches(
+        self, warehouse_ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield stock for the given warehouses in BATCH_SIZE column batches."""
+        item_slices = self._item_slices
+        if warehouse_ids is None:
+            warehouse_ids = self._warehouse_ids
+        for w_id in warehouse_ids:
+            for start, stop in item_slices:
+                yield self.stock_columns(w_id, start, stop)
+
+    def _warehouse_batches(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield all warehouses as a single column batch."""
+        yield self.warehouse_columns()
+
+    def _district_batches(
+        self, warehouse_ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield the districts of each warehouse as one column batch."""
+        if warehouse_ids is None:
+            warehouse_ids = self._warehouse_ids
+        for w_id in warehouse_ids:
+            yield self.district_columns(w_id)
+
+    def generate_all_columns(self) -> Dict[str, Iterator[Dict[str, np.ndarray]]]:
+        """Generate all TPC-C tables as iterators of column batches.
+
+        Bulk loaders use this to insert straight from the arrays without
+        building a model object per row. Keys match generate_all_data().
+        """
+        return {
+            "warehouses": self._warehouse_batches(),
+            "districts": self._district_batches(),
+            "customers": self._per_district(self.customer_columns),
+            "items": self._item_batches(),
+            "stock": self._stock_batches(),
+            "orders": self._per_district(self.order_columns),
+            "new_orders": self._per_district(self.new_order_columns),
+            "history": self._per_district(self.history_columns),
+            "order_lines": self._per_district(self.order_line_columns),
+        }
+
+    def generate_warehouse_columns(
+        self, warehouse_ids: Iterable[int]
+    ) -> Dict[str, Iterator[Dict[str, np.ndarray]]]:
+        """Generate the warehouse-scoped tables of some warehouses as column batches.
+
+        Covers every table except ``warehouses`` and ``items``, so disjoint
+        warehouse ranges can be generated and loaded independently.
+
+        Args:
+            warehouse_ids: Warehouse IDs to generate
+
+        Returns:
+            Dict with the same keys as generate_all_columns(), minus the two
+            global tables
+        """
+        warehouse_ids = list(warehouse_ids)
+        return {
+            "districts": self._district_batches(warehouse_ids),
+            "customers": self._per_district(self.customer_columns, warehouse_ids),
+            "stock": self._stock_batches(warehouse_ids),
+            "orders": self._per_district(self.order_columns, warehouse_ids),
+            "new_orders": self._per_district(self.new_order_columns, warehouse_ids),
+            "history": self._per_district(self.history_columns, warehouse_ids),
+            "order_lines": self._per_district(self.order_line_columns, warehouse_ids),
+        }
+
     def generate_warehouses(self) -> Iterator[Warehouse]:
         """Generate warehouse data."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            yield Warehouse(
-                w_id=w_id,
-                w_name=f"W{w_id:02d}",
-                w_street_1=self.random.generate_street_address(),
-                w_street_2=self.random.generate_street_address(),
-                w_city=self.random.generate_city(),
-                w_state=self.random.generate_state(),
-                w_zip=self.random.generate_zip(),
-                w_tax=self.random.generate_tax(),
-                w_ytd=300000.0,
-            )
+        return _materialize(Warehouse, self._warehouse_batches())
 
     def generate_districts(self) -> Iterator[District]:
         """Generate district data for all warehouses."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                yield District(
-                    d_id=d_id,
-                    d_w_id=w_id,
-                    d_name=f"D{d_id:02d}",
-                    d_street_1=self.random.generate_street_address(),
-                    d_street_2=self.random.generate_street_address(),
-                    d_city=self.random.generate_city(),
-                    d_state=self.random.generate_state(),
-                    d_zip=self.random.generate_zip(),
-                    d_tax=self.random.generate_tax(),
-                    d_ytd=30000.0,
-                    d_next_o_id=3001,
-                )
+        return _materialize(District, self._district_batches())
 
     def generate_customers(self) -> Iterator[Customer]:
         """Generate customer data for all districts."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                for c_id in range(1, self.CUSTOMERS_PER_DISTRICT + 1):
-                    credit = "GC" if self.random.random_int(0, 100) < 90 else "BC"
-
-                    yield Customer(
-                        c_id=c_id,
-                        c_d_id=d_id,
-                        c_w_id=w_id,
-                        c_first=self.random.generate_first_name(),
-                        c_middle="OE",
-                        c_last=self.random.generate_last_name(c_id),
-                        c_street_1=self.random.generate_street_address(),
-                        c_street_2=self.random.generate_street_address(),
-                        c_city=self.random.generate_city(),
-                        c_state=self.random.generate_state(),
-                        c_zip=self.random.generate_zip(),
-                        c_phone=self.random.generate_phone(),
-                        c_since=self.random.generate_timestamp(),
-                        c_credit=credit,
-                        c_credit_lim=50000.0,
-                        c_discount=self.random.generate_discount(),
-                        c_balance=10.5,
-                        c_ytd_payment=10.5,
-                        c_payment_cnt=1,
-                        c_delivery_cnt=0,
-                        c_data=self.random.generate_data(50, 300),
-                    )
+        return _materialize(Customer, self._per_district(self.customer_columns))
 
     def generate_items(self) -> Iterator[Item]:
         """Generate item catalog."""
-        for i_id in range(1, self.ITEMS_TOTAL + 1):
-            data = self.random.generate_data(26, 50)
-            if self.random.random_int(0, 100) < 10:
-                pos = self.random.random_int(0, len(data) - 8)
-                data = data[:pos] + "ORIGINAL" + data[pos + 8 :]
-
-            yield Item(
-                i_id=i_id,
-                i_im_id=self.random.random_int(1, 10000),
-                i_name=self.random.generate_item_name(),
-                i_price=self.random.generate_price(),
-                i_data=data,
-            )
+        return _materialize(Item, self._item_batches())
 
     def generate_stock(self) -> Iterator[Stock]:
         """Generate stock data for all items in all warehouses."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for i_id in range(1, self.ITEMS_TOTAL + 1):
-                data = self.random.generate_data(26, 50)
-                if self.random.random_int(0, 100) < 10:
-                    pos = self.random.random_int(0, len(data) - 8)
-                    data = data[:pos] + "ORIGINAL" + data[pos + 8 :]
-
-                yield Stock(
-                    s_i_id=i_id,
-                    s_w_id=w_id,
-                    s_quantity=self.random.random_int(10, 100),
-                    s_dist_01=self.random.generate_dist_info(),
-                    s_dist_02=self.random.generate_dist_info(),
-                    s_dist_03=self.random.generate_dist_info(),
-                    s_dist_04=self.random.generate_dist_info(),
-                    s_dist_05=self.random.generate_dist_info(),
-                    s_dist_06=self.random.generate_dist_info(),
-                    s_dist_07=self.random.generate_dist_info(),
-                    s_dist_08=self.random.generate_dist_info(),
-                    s_dist_09=self.random.generate_dist_info(),
-                    s_dist_10=self.random.generate_dist_info(),
-                    s_ytd=0,
-                    s_order_cnt=0,
-                    s_remote_cnt=0,
-                    s_data=data,
-                )
+        return _materialize(Stock, self._stock_batches())
 
     def generate_orders(self) -> Iterator[Orders]:
         """Generate order data."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                for o_id in range(1, self.ORDERS_PER_DISTRICT + 1):
-                    carrier_id = 0 if o_id > 2100 else self.random.random_int(1, 10)
-
-                    yield Orders(
-                        o_id=o_id,
-                        o_c_id=self.random.random_int(1, 3000),
-                        o_d_id=d_id,
-                        o_w_id=w_id,
-                        o_entry_d=self.random.generate_timestamp(),
-                        o_carrier_id=carrier_id,
-                        o_ol_cnt=10,
-                        o_all_local=1,
-                    )
+        return _materialize(Orders, self._per_district(self.order_columns))
 
     def generate_new_orders(self) -> Iterator[NewOrder]:
         """Generate new order data."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                for no_id in range(2101, 2101 + self.NEW_ORDERS_PER_DISTRICT):
-                    yield NewOrder(no_o_id=no_id, no_d_id=d_id, no_w_id=w_id)
+        return _materialize(NewOrder, self._per_district(self.new_order_columns))
 
     def generate_history(self) -> Iterator[History]:
         """Generate history data for all customers."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                for c_id in range(1, self.CUSTOMERS_PER_DISTRICT + 1):
-                    yield History(
-                        h_c_id=c_id,
-                        h_c_d_id=d_id,
-                        h_c_w_id=w_id,
-                        h_d_id=d_id,
-                        h_w_id=w_id,
-                        h_date=self.random.generate_timestamp(),
-                        h_amount=10.0,  # Initial payment
-                        h_data="Initial deposit",
-                    )
+        return _materialize(History, self._per_district(self.history_columns))
 
     def generate_order_lines(self) -> Iterator[OrderLine]:
         """Generate order line data for all orders."""
-        warehouse_count = self.WAREHOUSES_PER_SCALE * self.scale_factor
-
-        for w_id in range(1, warehouse_count + 1):
-            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                for o_id in range(1, self.ORDERS_PER_DISTRICT + 1):
-                    ol_cnt = 10
-
-                    for ol_number in range(1, ol_cnt + 1):
-                        i_id = self.random.random_int(1, self.ITEMS_TOTAL)
-                        quantity = self.random.random_int(1, 10)
-                        amount = quantity * self.random.generate_price()
-
-                        # For orders > 2100, delivery info is populated
-                        delivery_d = "1970-01-01 00:00:00"  # default value
-                        if o_id <= 2100:
-                            delivery_d = self.random.generate_timestamp()
-
-                        yield OrderLine(
-                            ol_o_id=o_id,
-                            ol_d_id=d_id,
-                            ol_w_id=w_id,
-                            ol_number=ol_number,
-                            ol_i_id=i_id,
-                            ol_supply_w_id=w_id,
-                            ol_delivery_d=delivery_d,
-                            ol_quantity=quantity,
-                            ol_amount=amount,
-                            ol_dist_info=self.random.generate_dist_info(),
-                        )
+        return _materialize(OrderLine, self._per_district(self.order_line_columns))
 
     def generate_all_data(self) -> Dict[str, Iterator[Any]]:
         """Generate all TPC-C data types as iterators."""
@@ -279,25 +495,45 @@ class TpccDataGenerator:
         """Get random quantity (1-10)."""
         return self.random.random_int(1, 10)
 
+    def get_random_order_lines(
+        self, w_id: int, count: int
+    ) -> tuple[list[int], list[int], list[int]]:
+        """Draw the item IDs, supply warehouses and quantities of order lines.
+
+        All lines are drawn with one vectorized call. A line is supplied by
+        w_id with 99% probability, otherwise by a random warehouse.
+
+        Returns:
+            (item IDs, supply warehouse IDs, quantities), each of ``count``
+        """
+        draws = self.random.random_ints(
+            self._order_line_low, self._order_line_high, (count, 4)
+        )
+        item_ids, percentiles, remote_w_ids, quantities = draws.T.tolist()
+        supply_w_ids = [
+            remote_w_id if percentile == 99 else w_id
+            for percentile, remote_w_id in zip(percentiles, remote_w_ids)
+        ]
+        return item_ids, supply_w_ids, quantities
+
     def get_payment_customer_warehouse(self, w_id: int, d_id: int) -> tuple[int, int]:
         """Get customer warehouse and district for payment transaction."""
+        randint = self.random.random_int
+
         # 85% chance customer is in same warehouse
-        if self.scale_factor == 1 or self.random.random_int(1, 100) <= 85:
+        if self.scale_factor == 1 or randint(1, 100) <= 85:
             c_w_id = w_id
             # 15% chance customer is in different district
-            if self.random.random_int(1, 100) <= 15:
-                c_d_id = self.random.random_int(1, self.DISTRICTS_PER_WAREHOUSE)
+            if randint(1, 100) <= 15:
+                c_d_id = randint(1, self.DISTRICTS_PER_WAREHOUSE)
             else:
                 c_d_id = d_id
         else:
-            # Customer in different warehouse
-            available_warehouses = [
-                id for id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1) if id != w_id
-            ]
-            if not available_warehouses:
-                raise ValueError("No alternative warehouses available")
-            c_w_id = random.choice(available_warehouses)
-            c_d_id = self.get_random_district_id()
+            # Customer in a different warehouse: draw uniformly from the other
+            # scale_factor - 1 warehouses by skipping over w_id
+            r = randint(1, self.scale_factor - 1)
+            c_w_id = r if r < w_id else r + 1
+            c_d_id = randint(1, self.DISTRICTS_PER_WAREHOUSE)
 
         return c_w_id, c_d_id
 
@@ -323,112 +559,250 @@ class TpccDataGenerator:
 class RandomDataGenerator:
     """Utility class for generating TPC-C compliant random data."""
 
-    def __init__(self, seed: int = None):
-        """Initialize random generator with optional seed for reproducibility."""
+    def __init__(self, seed: int = None, rng: Optional[random.Random] = None):
+        """Initialize random generator with optional seed for reproducibility.
+
+        Args:
+            seed: Seed for the random module and the vectorized generator
+            rng: Private random.Random backing random_int(), random_float()
+                and random_unit() instead of the random module, e.g. one per
+                benchmark thread
+        """
         if seed is not None:
             random.seed(seed)
-
-    def random_int(self, min_val: int, max_val: int) -> int:
-        """Generate random integer in range [min_val, max_val]."""
-        return random.randint(min_val, max_val)
-
-    def random_float(self, min_val: float, max_val: float) -> float:
-        """Generate random float in range [min_val, max_val]."""
-        return random.uniform(min_val, max_val)
-
-    def generate_string(
-        self, length: int, charset: str = string.ascii_letters + string.digits
-    ) -> str:
+        if rng is not None:
+            self.random_int = rng.randint
+            self.random_float = rng.uniform
+            self.random_unit = rng.random
+        # Vectorized generator backing the *_batch / plural helpers
+        self._rng = np.random.default_rng(seed)
+        # Shared reference time so every generated timestamp uses the same "now"
+        self._now = np.datetime64(datetime.now(), "s")
+        self._timestamp_table: Optional[np.ndarray] = None
+
+    # Direct aliases of the module functions: random_int(a, b) draws from
+    # [a, b] and random_float(a, b) from [a, b] without an extra Python frame.
+    random_int = staticmethod(random.randint)
+    random_float = staticmethod(random.uniform)
+    random_unit = staticmethod(random.random)
+
+    def generate_string(self, length: int, charset: Sequence[str] = _ALNUM) -> str:
         """Generate random string of given length."""
-        return "".join(random.choice(charset) for _ in range(length))
+        return "".join(_choices(charset, k=length))
 
     def generate_street_address(self) -> str:
         """Generate realistic street address."""
-        return f"{self.random_int(1, 9999)} {self.generate_string(5, string.ascii_uppercase)} St"
+        return _STREET_FMT(_randint(1, 9999), "".join(_choices(_UPPER, k=5)))
 
     def generate_city(self) -> str:
         """Generate city name."""
-        cities = [
-            "Springfield",
-            "Rivertown",
-            "Oakland",
-            "Madison",
-            "Lincoln",
-            "Franklin",
-        ]
-        return random.choice(cities)
+        return _choice(_CITY_NAMES)
 
     def generate_state(self) -> str:
         """Generate state code."""
-        states = ["CA", "NY", "TX", "FL", "IL", "PA", "OH", "GA", "NC", "MI"]
-        return random.choice(states)
+        return _choice(_STATE_CODES)
 
     def generate_zip(self) -> str:
         """Generate ZIP code."""
-        return f"{self.random_int(10000, 99999)}{self.random_int(1000, 9999)}"
+        return _ZIP_FMT(_randint(10000, 99999), _randint(1000, 9999))
 
     def generate_phone(self) -> str:
         """Generate phone number."""
-        return f"({self.random_int(100, 999)}) {self.random_int(100, 999)}-{self.random_int(1000, 9999)}"
+        return _PHONE_FMT(_randint(100, 999), _randint(100, 999), _randint(1000, 9999))
 
     def generate_tax(self) -> float:
         """Generate tax rate (0-20%)."""
-        return round(self.random_float(0, 2000) / 10000, 4)
+        return round(_uniform(0, 2000) / 10000, 4)
 
     def generate_discount(self) -> float:
         """Generate discount rate (0-50%)."""
-        return round(self.random_float(0, 5000) / 10000, 4)
+        return round(_uniform(0, 5000) / 10000, 4)
 
     def generate_price(self) -> float:
         """Generate item price ($1.00-$100.00)."""
-        return round(self.random_float(100, 10000) / 100, 2)
+        return round(_uniform(100, 10000) / 100, 2)
 
     def generate_item_name(self) -> str:
         """Generate item name."""
-        prefixes = ["Red", "Blue", "Green", "Large", "Small", "Premium", "Standard"]
-        items = ["Widget", "Gadget", "Tool", "Device", "Product", "Item"]
-        return f"{random.choice(prefixes)} {random.choice(items)}"
+        return _choice(_ITEM_TITLES)
 
     def generate_data(self, min_len: int, max_len: int) -> str:
         """Generate random data string within length range."""
-        length = self.random_int(min_len, max_len)
-        return self.generate_string(length)
+        return "".join(_choices(_ALNUM, k=_randint(min_len, max_len)))
 
     def generate_dist_info(self) -> str:
         """Generate district information."""
-        return self.generate_string(24, string.ascii_uppercase + string.digits)
+        return "".join(_choices(_UPPER_DIGITS, k=24))
 
     def generate_last_name(self, customer_id: int) -> str:
         """Generate last name based on customer ID (TPC-C specific)."""
-        syllables = [
-            "BAR",
-            "OUGHT",
-            "ABLE",
-            "PRI",
-            "PRES",
-            "ESE",
-            "ANTI",
-            "CALLY",
-            "ATION",
-            "EING",
-        ]
-
-        if customer_id < 1000:
-            last_name = syllables[customer_id // 100]
-        else:
-            last_name = (
-                syllables[customer_id % 1000 // 100] + syllables[customer_id // 1000]
-            )
-
-        return last_name
+        if 0 <= customer_id < len(_LAST_NAMES):
+            return _LAST_NAMES[customer_id]
+        return _compute_last_name(customer_id)
 
     def generate_first_name(self) -> str:
         """Generate first name."""
-        names = ["John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Edward", "Fiona"]
-        return random.choice(names)
+        return _choice(_FIRST)
 
     def generate_timestamp(self) -> str:
         """Generate random timestamp within last 2 years in format 'YYYY-MM-DD HH:MM:SS'."""
-        days_ago = self.random_int(0, 730)
-        timestamp = datetime.now() - timedelta(days=days_ago)
-        return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        return str(self._timestamps()[_randint(0, 730)])
+
+    # Vectorized helpers used for bulk data loading. Each returns a NumPy array
+    # with one entry per row so a whole column is drawn in a single C-level call.
+    def random_ints(self, min_val: int, max_val: int, size: int) -> np.ndarray:
+        """Generate an array of random integers in range [min_val, max_val]."""
+        return self._rng.integers(min_val, max_val + 1, size)
+
+    def random_floats(self, min_val: float, max_val: float, size: int) -> np.ndarray:
+        """Generate an array of random floats in range [min_val, max_val]."""
+        return self._rng.uniform(min_val, max_val, size)
+
+    def generate_strings(
+        self, count: int, length: int, charset: Sequence[str] = _ALNUM
+    ) -> np.ndarray:
+        """Generate an array of random strings of the given length."""
+        return _bytes_to_strings(self._random_bytes(count, length, charset))
+
+    def _random_bytes(
+        self, count: int, length: int, charset: Sequence[str]
+    ) -> np.ndarray:
+        """Draw a (count, length) uint8 matrix of characters from an ASCII charset."""
+        table = _charset_bytes(charset)
+        return table[self._rng.integers(0, len(table), (count, length), np.uint8)]
+
+    def generate_street_addresses(self, count: int) -> np.ndarray:
+        """Generate an array of street addresses."""
+        numbers = self.random_ints(1, 9999, count).astype(str)
+        names = self.generate_strings(count, 5, _UPPER)
+        return np.char.add(np.char.add(np.char.add(numbers, " "), names), " St")
+
+    def generate_cities(self, count: int) -> np.ndarray:
+        """Generate an array of city names."""
+        return self._rng.choice(_CITIES, count)
+
+    def generate_states(self, count: int) -> np.ndarray:
+        """Generate an array of state codes."""
+        return self._rng.choice(_STATES, count)
+
+    def generate_zips(self, count: int) -> np.ndarray:
+        """Generate an array of ZIP codes."""
+        zips = self.random_ints(10000, 99999, count) * 10000
+        return (zips + self.random_ints(1000, 9999, count)).astype(str)
+
+    def generate_phones(self, count: int) -> np.ndarray:
+        """Generate an array of phone numbers."""
+        phones = np.char.add("(", self.random_ints(100, 999, count).astype(str))
+        phones = np.char.add(phones, ") ")
+        phones = np.char.add(phones, self.random_ints(100, 999, count).astype(str))
+        phones = np.char.add(phones, "-")
+        return np.char.add(phones, self.random_ints(1000, 9999, count).astype(str))
+
+    def generate_taxes(self, count: int) -> np.ndarray:
+        """Generate an array of tax rates (0-20%)."""
+        return np.round(self.random_floats(0, 2000, count) / 10000, 4)
+
+    def generate_discounts(self, count: int) -> np.ndarray:
+        """Generate an array of discount rates (0-50%)."""
+        return np.round(self.random_floats(0, 5000, count) / 10000, 4)
+
+    def generate_prices(self, count: int) -> np.ndarray:
+        """Generate an array of item prices ($1.00-$100.00)."""
+        return np.round(self.random_floats(100, 10000, count) / 100, 2)
+
+    def generate_item_names(self, count: int) -> np.ndarray:
+        """Generate an array of item names."""
+        prefixes = np.char.add(self._rng.choice(_ITEM_PREFIXES, count), " ")
+        return np.char.add(prefixes, self._rng.choice(_ITEM_NAMES, count))
+
+    def generate_data_batch(
+        self, count: int, min_len: int, max_len: int, original: bool = False
+    ) -> np.ndarray:
+        """Generate an array of random data strings within length range.
+
+        Args:
+            count: Number of strings to generate
+            min_len: Minimum string length
+            max_len: Maximum string length
+            original: Splice "ORIGINAL" into roughly 10% of the strings
+
+        Returns:
+            Array of strings
+        """
+        # Character draws, the "ORIGINAL" splice and length truncation all
+        # operate on one (count, max_len) byte matrix
+        matrix = self._random_bytes(count, max_len, _ALNUM)
+        lengths = self.random_ints(min_len, max_len, count)
+
+        if original:
+            rows = np.flatnonzero(self.random_ints(0, 100, count) < 10)
+            # Same placement as the scalar path: pos in [0, len - 8]
+            pos = (self._rng.random(len(rows)) * (lengths[rows] - 7)).astype(np.intp)
+            matrix[rows[:, None], pos[:, None] + np.arange(8)] = _ORIGINAL_BYTES
+
+        # NUL padding is dropped when NumPy hands the strings back
+        matrix[np.arange(max_len) >= lengths[:, None]] = 0
+        return _bytes_to_strings(matrix)
+
+    def generate_original_data_batch(
+        self, count: int, min_len: int, max_len: int
+    ) -> np.ndarray:
+        """Generate data strings with "ORIGINAL" spliced into ~10% of them."""
+        return self.generate_data_batch(count, min_len, max_len, original=True)
+
+    def generate_dist_infos(self, count: int) -> np.ndarray:
+        """Generate an array of district information strings."""
+        return self.generate_strings(count, 24, _UPPER_DIGITS)
+
+    def generate_last_names(self, customer_ids: np.ndarray) -> np.ndarray:
+        """Generate the last names for an array of customer IDs (1-3000)."""
+        return _LAST_NAMES_ARRAY[customer_ids]
+
+    def generate_first_names(self, count: int) -> np.ndarray:
+        """Generate an array of first names."""
+        return self._rng.choice(_FIRST_NAMES, count)
+
+    def generate_timestamps(self, count: int) -> np.ndarray:
+        """Generate an array of timestamps within the last 2 years."""
+        return self._timestamps()[self.random_ints(0, 730, count)]
+
+    def _timestamps(self) -> np.ndarray:
+        """Return the 731 possible 'YYYY-MM-DD HH:MM:SS' strings, built once."""
+        if self._timestamp_table is None:
+            days_ago = np.arange(731).astype("timedelta64[D]")
+            iso = (self._now - days_ago).astype("U19")
+            self._timestamp_table = np.char.replace(iso, "T", " ")
+        return self._timestamp_table
+
+
+_CITIES = np.array(_CITY_NAMES)
+_STATES = np.array(_STATE_CODES)
+_ITEM_PREFIXES = np.array(_PREFIXES)
+_ITEM_NAMES = np.array(_PRODUCTS)
+_FIRST_NAMES = np.array(_FIRST)
+_LAST_NAMES_ARRAY = np.array(_LAST_NAMES)
+_ORIGINAL_BYTES = np.frombuffer(b"ORIGINAL", dtype=np.uint8)
+
+
+def _iter_rows(columns: Dict[str, np.ndarray]) -> Iterator[tuple]:
+    """Iterate column arrays row by row as tuples of Python scalars."""
+    return zip(*(column.tolist() for column in columns.values()))
+
+
+def _materialize(model: type, batches: Iterator[Dict[str, np.ndarray]]) -> Iterator:
+    """Build one model instance per row of each column batch."""
+    for columns in batches:
+        for row in _iter_rows(columns):
+            yield model(*row)
+
+
+@lru_cache(maxsize=None)
+def _charset_bytes(charset: Sequence[str]) -> np.ndarray:
+    """Return an ASCII charset as a uint8 lookup table (cached per charset)."""
+    return np.frombuffer("".join(charset).encode("ascii"), dtype=np.uint8)
+
+
+def _bytes_to_strings(matrix: np.ndarray) -> np.ndarray:
+    """Convert a (rows, length) matrix of ASCII bytes into an array of strings."""
+    matrix = np.ascontiguousarray(matrix)
+    return matrix.view(f"S{matrix.shape[-1]}")[:, 0].astype(f"U{matrix.shape[-1]}")
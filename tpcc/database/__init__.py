@@ -3,14 +3,23 @@ Database layer for TPC-C benchmark.
 Supports custom RMDB protocol with pipe-delimited response format.
 """
 
-from .database_connection import DatabaseConnection
+from .database_connection import DatabaseConnection, PreparedStatement
+from .connection_pool import ConnectionPool
 from .schema_manager import SchemaManager
-from .rmdb_cursor import RMDBCursor, RMDBCursorAdapter, RMDBQueryExecutor
+from .rmdb_cursor import (
+    QueryAborted,
+    RMDBCursor,
+    RMDBCursorAdapter,
+    RMDBQueryExecutor,
+)
 
 __all__ = [
     "DatabaseConnection",
+    "PreparedStatement",
+    "ConnectionPool",
     "SchemaManager",
     "RMDBCursor",
     "RMDBCursorAdapter",
     "RMDBQueryExecutor",
+    "QueryAborted",
 ]
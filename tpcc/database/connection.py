@@ -6,6 +6,8 @@ from tpcc.config import HOST, PORT
 
 class Client:
     MAX_MEM_BUFFER_SIZE = 8192
+    # 首条响应的数据不含 '\0' 时, 等待其余部分的最长秒数; 超时则视为服务端不分帧
+    FRAMING_GRACE = 0.2
 
     sockfd = None
 
@@ -23,6 +25,11 @@ class Client:
         # else:
         #     self.sockfd = self.__init_tcp_sock(self.HOST, args.p)
 
+        # 已收到但尚未读取的字节 (下一条响应的开头), 见 _recv_reply()
+        self._pending = b""
+        # 服务端是否以 '\0' 结束每条响应; None 表示尚未确定
+        self._framed = None
+
         self.sockfd = self.__init_tcp_sock(HOST, PORT)
 
         if self.sockfd is None:
@@ -61,13 +68,7 @@ class Client:
             try:
                 self.sockfd.settimeout(300)  # 300 second timeout for operations
                 self.sockfd.sendall(cmd.encode())
-                recv_buf = self.sockfd.recv(self.MAX_MEM_BUFFER_SIZE)
-                if not recv_buf:
-                    print("Connection has been closed")
-                    raise ConnectionError("Database connection closed unexpectedly")
-                else:
-                    # print(recv_buf.decode(), end="")
-                    return recv_buf.decode()
+                return self._recv_reply()
             except socket.timeout:
                 print("Socket timeout occurred during database operation")
                 raise
@@ -75,6 +76,56 @@ class Client:
                 print(f"Connection was broken: {str(e)}")
                 raise ConnectionError(f"Database connection error: {str(e)}")
 
+    def submit_only(self, cmd):
+        # 只发送, 不等待结果; 与 recv_response 配合实现流水线.
+        # 请求以 '\0' 结尾 (与 rmdb_client 相同), 以便服务端拆分连续到达的请求
+        try:
+            self.sockfd.settimeout(300)
+            self.sockfd.sendall(cmd.encode() + b"\0")
+        except Exception as e:
+            print(f"Connection was broken: {str(e)}")
+            raise ConnectionError(f"Database connection error: {str(e)}")
+
+    def recv_response(self):
+        # 读取 submit_only 发出的下一条语句的响应
+        try:
+            return self._recv_reply()
+        except socket.timeout:
+            print("Socket timeout occurred during database operation")
+            raise
+
+    def _recv_reply(self):
+        # 读取一条完整响应; 服务端以 '\0' 结尾, 多余字节留给下一条.
+        # 若首条响应在 FRAMING_GRACE 内未出现 '\0', 视为服务端不分帧,
+        # 此后每次 recv 即一条响应
+        buf = self._pending
+        while b"\0" not in buf:
+            if buf and not self._framed:
+                chunk = self._recv_more() if self._framed is None else b""
+                if not chunk:
+                    self._framed = False
+                    return buf.decode()
+            else:
+                chunk = self.sockfd.recv(self.MAX_MEM_BUFFER_SIZE)
+                if not chunk:
+                    print("Connection has been closed")
+                    raise ConnectionError("Database connection closed unexpectedly")
+            buf += chunk
+        self._framed = True
+        response, _, self._pending = buf.partition(b"\0")
+        return response.decode()
+
+    def _recv_more(self):
+        # 在 FRAMING_GRACE 内读取更多数据, 超时返回 b""
+        timeout = self.sockfd.gettimeout()
+        self.sockfd.settimeout(self.FRAMING_GRACE)
+        try:
+            return self.sockfd.recv(self.MAX_MEM_BUFFER_SIZE)
+        except socket.timeout:
+            return b""
+        finally:
+            self.sockfd.settimeout(timeout)
+
     def start_shell_client(self):
         # 启动shell client, 在命令行中输入sql命令那种形式
         # while 循环反复获取input
@@ -0,0 +1,100 @@
+"""
+Connection pool for the TPC-C benchmark.
+Hands out independent RMDB connections to concurrent workers.
+"""
+
+import logging
+import queue
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from tpcc.database.database_connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """Fixed-size pool of connected DatabaseConnection instances.
+
+    Each RMDB connection is a single socket that serves one statement at a
+    time, so concurrent workers must each hold their own connection. The pool
+    keeps them in a LIFO queue so the most recently used (warm) connection is
+    handed out first.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        slow_query_ms: Optional[float] = None,
+        pipeline_window: int = 1,
+    ):
+        """Open ``size`` connections.
+
+        Args:
+            size: Number of connections to keep
+            host: RMDB server host
+            port: RMDB server port
+            slow_query_ms: Slow statement threshold for every connection
+            pipeline_window: Pipeline window of every connection (see
+                DatabaseConnection)
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.size = size
+        self._connections: List[DatabaseConnection] = []
+        self._idle: "queue.LifoQueue[DatabaseConnection]" = queue.LifoQueue()
+
+        try:
+            for _ in range(size):
+                connection = DatabaseConnection(
+                    host,
+                    port,
+                    pipeline_window=pipeline_window,
+                    slow_query_ms=slow_query_ms,
+                )
+                connection.connect()
+                self._connections.append(connection)
+                self._idle.put(connection)
+        except Exception:
+            self.close()
+            raise
+
+        logger.info("Connection pool opened with %d connections", size)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[DatabaseConnection]:
+        """Borrow a connection for the duration of the with-block.
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+        """
+        connection = self._idle.get(timeout=timeout)
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def get_cursor(self):
+        """Borrow a connection and yield a cursor on it."""
+        with self.acquire() as connection:
+            with connection.get_cursor() as cursor:
+                yield cursor
+
+    def close(self) -> None:
+        """Close every connection owned by the pool."""
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+        self._idle = queue.LifoQueue()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
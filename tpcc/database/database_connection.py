@@ -4,30 +4,108 @@ Refactored from the original connection.py to provide better abstraction.
 Supports custom RMDB protocol with pipe-delimited response format.
 """
 
+import csv
 import logging
+import os
+import tempfile
+import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from tpcc.database.connection import Client
-from tpcc.database.rmdb_cursor import RMDBCursorAdapter
+from tpcc.database.rmdb_cursor import (
+    QueryAborted,
+    RMDBCursor,
+    RMDBCursorAdapter,
+    insert_prefix,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bound once so the per-query timing avoids the attribute lookup
+_time = time.time
+
+
+@lru_cache(maxsize=64)
+def _count_sql(table: str) -> str:
+    """COUNT(*) query for a table, built once per table name."""
+    return f"SELECT COUNT(*) FROM {table}"
+
+
+@lru_cache(maxsize=16)
+def _union_count_sql(tables: Tuple[str, ...]) -> str:
+    """Single query returning (table, count) rows for several tables."""
+    return " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+    )
+
+
+class PreparedStatement:
+    """A statement split around its placeholders once, for repeated execution.
+
+    RMDB has no server-side prepare, so this is client-side: binding a row
+    only formats and interleaves the values (see RMDBCursor.execute_prepared).
+    """
+
+    __slots__ = ("db", "sql", "parts")
+
+    def __init__(self, db: "DatabaseConnection", sql: str):
+        self.db = db
+        self.sql = sql
+        self.parts = RMDBCursor._prepare(sql)
+
+    def query(self, params: tuple = ()) -> list:
+        """Execute as a SELECT and return its rows."""
+        return self.db._execute_prepared(self, params, True)
+
+    def update(self, params: tuple = ()) -> int:
+        """Execute as an INSERT/UPDATE/DELETE and return affected rows."""
+        return self.db._execute_prepared(self, params, False)
+
 
 class DatabaseConnection:
     """Manages database connections with proper resource management for RMDB."""
 
-    def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        pipeline_window: int = 1,
+        slow_query_ms: Optional[float] = None,
+    ):
         """Initialize database connection.
 
         Args:
             host: RMDB server host
             port: RMDB server port
+            pipeline_window: Maximum statements in flight in execute_pipelined().
+                Pipelined requests are NUL-terminated, like those of the RMDB
+                shell client. The stock RMDB server reads one request per
+                socket read, so values above 1 are only safe against servers
+                that split back-to-back requests at the NUL and queue them.
+            slow_query_ms: Log statements slower than this many milliseconds.
+                None disables timing altogether.
         """
         self.host = host
         self.port = port
+        self.pipeline_window = max(1, pipeline_window)
+        self.slow_query_ms = slow_query_ms
         self.client: Optional[Client] = None
         self._connected = False
+        # Cleared the first time the server rejects a multi-row INSERT
+        self._multi_row_insert = True
+        # Cleared the first time the server rejects a UNION ALL count query
+        self._union_counts = True
+        # Nesting depth of quiet_output() blocks
+        self._quiet_depth = 0
+        # Nesting depth of transaction() blocks
+        self._txn_depth = 0
+        # Cleared the first time the server rejects a LOAD statement
+        self._bulk_load = True
+        # prepare() results by SQL text, reused for the connection's lifetime
+        self._statements: Dict[str, PreparedStatement] = {}
 
     def connect(self) -> None:
         """Establish database connection to RMDB."""
@@ -56,61 +134,386 @@ class DatabaseConnection:
         cursor = RMDBCursorAdapter(self.client)
         try:
             yield cursor
+        except QueryAborted:
+            # A transaction conflict, not a failure; left to the caller
+            raise
         except Exception as e:
             logger.error(f"Database operation failed: {e}")
             raise
         finally:
             cursor.close()
 
+    @contextmanager
+    def transaction(self):
+        """Context manager running the block in one transaction.
+
+        BEGIN is sent on entry and COMMIT on normal exit, or ROLLBACK if the
+        block raises. A nested block joins the enclosing transaction.
+        """
+        self._txn_depth += 1
+        if self._txn_depth > 1:
+            try:
+                yield
+            finally:
+                self._txn_depth -= 1
+            return
+
+        try:
+            self.execute_update("BEGIN")
+            yield
+        except BaseException:
+            try:
+                self.execute_update("ROLLBACK")
+            except Exception as e:
+                logger.error("Rollback failed: %s", e)
+            raise
+        else:
+            self.execute_update("COMMIT")
+        finally:
+            self._txn_depth -= 1
+
+    @contextmanager
+    def quiet_output(self):
+        """Context manager that turns off the server's result file output.
+
+        RMDB writes every result to its output file in addition to replying;
+        read-only sessions such as validation don't need that copy, so it is
+        disabled for the block ("set output_file off") and restored after.
+        Servers that reject the setting are left as they are.
+        """
+        self._quiet_depth += 1
+        if self._quiet_depth == 1:
+            self._set_output_file("off")
+        try:
+            yield
+        finally:
+            self._quiet_depth -= 1
+            if self._quiet_depth == 0:
+                self._set_output_file("on")
+
+    def _set_output_file(self, state: str) -> None:
+        """Send "set output_file <state>", logging instead of raising on failure."""
+        if not self.client:
+            return
+        try:
+            RMDBCursor(self.client).execute(f"set output_file {state}")
+        except Exception as e:
+            logger.debug("set output_file %s not applied: %s", state, e)
+
+    def _check_slow(self, kind: str, query: str, start_time: float) -> None:
+        """Warn when a statement started at start_time exceeded slow_query_ms."""
+        elapsed_ms = (_time() - start_time) * 1000.0
+        if elapsed_ms > self.slow_query_ms:
+            logger.warning("Slow %s took %.0fms: %s...", kind, elapsed_ms, query[:100])
+
     def execute_query(self, query: str, params: tuple = ()) -> list:
         """Execute a SELECT query and return results."""
-        import time
-
-        start_time = time.time()
+        timed = self.slow_query_ms is not None
+        if timed:
+            start_time = _time()
         try:
-            logger.debug(f"Executing query: {query[:100]}...")  # Log first 100 chars
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing query: %s...", query[:100])
             with self.get_cursor() as cursor:
                 cursor.execute(query, params)
                 result = cursor.fetchall()
-                execution_time = time.time() - start_time
+                if timed:
+                    self._check_slow("query", query, start_time)
+                return result
+        except QueryAborted:
+            raise
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            logger.error("Failed query: %s", query)
+            raise
+
+    def try_query(self, query: str, params: tuple = ()) -> Optional[list]:
+        """Execute a SELECT query, returning None if the server rejects it.
+
+        Unlike execute_query(), an "Error"/"failure" reply is told apart from
+        an empty result, for callers that fall back to simpler SQL.
+        """
+        timed = self.slow_query_ms is not None
+        if timed:
+            start_time = _time()
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            result = cursor.last_result or ""
+        if timed:
+            self._check_slow("query", query, start_time)
+        if result.startswith(("Error", "failure")):
+            return None
+        return rows
+
+    def prepare(self, query: str) -> PreparedStatement:
+        """Prepare a parameterized statement for repeated execution.
 
-                if execution_time > 10.0:  # Log slow queries
-                    logger.warning(
-                        f"Slow query took {execution_time:.2f}s: {query[:100]}..."
-                    )
+        Statements are cached per connection, so preparing the same SQL again
+        (e.g. once per transaction) returns the existing statement.
+
+        Args:
+            query: SQL with ``?``/``%s`` placeholders
 
-                logger.debug(
-                    f"Query returned {len(result)} rows in {execution_time:.2f}s"
-                )
+        Returns:
+            Statement whose query()/update() bind parameters on this connection
+        """
+        statement = self._statements.get(query)
+        if statement is None:
+            statement = self._statements[query] = PreparedStatement(self, query)
+        return statement
+
+    def _execute_prepared(
+        self, statement: PreparedStatement, params: tuple, fetch: bool
+    ):
+        """Execute a prepared statement; returns rows if fetch else rowcount."""
+        timed = self.slow_query_ms is not None
+        if timed:
+            start_time = _time()
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing prepared: %s...", statement.sql[:100])
+            with self.get_cursor() as cursor:
+                cursor.execute_prepared(statement.parts, params)
+                result = cursor.fetchall() if fetch else cursor.rowcount
+                if timed:
+                    self._check_slow("query", statement.sql, start_time)
                 return result
+        except QueryAborted:
+            raise
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"Query execution failed after {execution_time:.2f}s: {e}")
-            logger.error(f"Failed query: {query}")
+            logger.error("Query execution failed: %s", e)
+            logger.error("Failed query: %s", statement.sql)
             raise
 
+    def execute_scalar(self, query: str, params: tuple = ()) -> Optional[str]:
+        """Execute a single-value query (COUNT/SUM/MAX) and return its first cell."""
+        timed = self.slow_query_ms is not None
+        if timed:
+            start_time = _time()
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing scalar query: %s...", query[:100])
+            with self.get_cursor() as cursor:
+                value = cursor.execute_scalar(query, params)
+                if timed:
+                    self._check_slow("query", query, start_time)
+                return value
+        except QueryAborted:
+            raise
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            logger.error("Failed query: %s", query)
+            raise
+
+    def count_rows(self, tables: Sequence[str]) -> Dict[str, int]:
+        """Count the rows of several tables, in one round-trip when possible.
+
+        All tables are counted with one UNION ALL query; if the server rejects
+        it, this and later calls count each table separately.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Dictionary mapping table names to row counts; tables whose count
+            failed are omitted
+        """
+        counts = {}
+        if self._union_counts:
+            query = _union_count_sql(tuple(tables))
+            try:
+                counts = {name: int(count) for name, count in self.execute_query(query)}
+            except Exception as e:
+                logger.debug("UNION ALL table count failed: %s", e)
+            if counts.keys() != set(tables):
+                logger.info("UNION ALL counts not supported; counting per table")
+                self._union_counts = False
+                counts = {}
+
+        for table in tables:
+            if table in counts:
+                continue
+            try:
+                counts[table] = int(self.execute_scalar(_count_sql(table)))
+            except Exception as e:
+                logger.error("Failed to count %s: %s", table, e)
+        return counts
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE query and return affected rows."""
+        timed = self.slow_query_ms is not None
+        if timed:
+            start_time = _time()
         try:
-            import time
-
-            start_time = time.time()
-            logger.debug(f"Executing update: {query[:100]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing update: %s...", query[:100])
 
             with self.get_cursor() as cursor:
                 cursor.execute(query, params)
-                execution_time = time.time() - start_time
-
-                if execution_time > 5.0:  # Log slow queries
-                    logger.warning(
-                        f"Slow update query took {execution_time:.2f}s: {query[:100]}..."
-                    )
-
+                if timed:
+                    self._check_slow("update", query, start_time)
                 return cursor.rowcount
+        except QueryAborted:
+            raise
         except Exception as e:
-            logger.error(f"Update execution failed: {e}")
-            logger.error(f"Failed update: {query}")
+            logger.error("Update execution failed: %s", e)
+            logger.error("Failed update: %s", query)
+            raise
+
+    def execute_many(
+        self, base_query: str, params_seq: Iterable[tuple], chunk: int = 1000
+    ) -> int:
+        """Execute an INSERT for many rows using multi-row VALUES statements.
+
+        Rows are rendered once and packed into ``INSERT ... VALUES (...), (...)``
+        statements of at most ``chunk`` rows and MAX_STATEMENT_BYTES bytes. If
+        the server rejects the multi-row form, the remaining rows are sent one
+        statement per row.
+
+        Args:
+            base_query: Single-row INSERT with ``?`` placeholders in VALUES
+            params_seq: Iterable of parameter tuples, one per row
+            chunk: Maximum number of rows per statement
+
+        Returns:
+            Number of rows sent
+        """
+        prefix = insert_prefix(base_query)
+        if not prefix:
+            raise ValueError("execute_many requires an INSERT ... VALUES query")
+
+        with self.get_cursor() as cursor:
+            total, self._multi_row_insert = cursor.insert_many(
+                prefix, params_seq, chunk=chunk, multi_row=self._multi_row_insert
+            )
+        return total
+
+    def insert_rows(
+        self, base_query: str, rows: Iterable[str], chunk: int = 1000
+    ) -> int:
+        """Like execute_many(), for rows already rendered as ``(...)`` tuples.
+
+        Args:
+            base_query: Single-row INSERT with ``?`` placeholders in VALUES
+            rows: Rendered VALUES rows, e.g. from load_executor.render_rows()
+            chunk: Maximum number of rows per statement
+
+        Returns:
+            Number of rows sent
+        """
+        prefix = insert_prefix(base_query)
+        if not prefix:
+            raise ValueError("insert_rows requires an INSERT ... VALUES query")
+
+        with self.get_cursor() as cursor:
+            total, self._multi_row_insert = cursor.insert_rendered(
+                prefix, rows, chunk=chunk, multi_row=self._multi_row_insert
+            )
+        return total
+
+    def bulk_load(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+        directory: Optional[str] = None,
+    ) -> bool:
+        """Load rows with RMDB's ``load <file> into <table>`` statement.
+
+        The rows are written to a CSV file (with a header line of column
+        names) that the server reads directly, skipping SQL parsing of every
+        row. The file must therefore be visible to the server under the same
+        path, e.g. in a directory shared with it.
+
+        Args:
+            table: Target table
+            columns: Column names, in table order
+            rows: Row tuples
+            directory: Directory for the CSV file (defaults to the temp dir)
+
+        Returns:
+            True if the server loaded the file; False if it rejected the
+            statement (or did so before), in which case nothing was loaded
+        """
+        if not self._bulk_load:
+            return False
+
+        fd, path = tempfile.mkstemp(suffix=".csv", prefix=f"{table}_", dir=directory)
+        try:
+            with os.fdopen(fd, "w", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(columns)
+                writer.writerows(rows)
+            with self.get_cursor() as cursor:
+                cursor.execute(f"load {os.path.abspath(path)} into {table}")
+                result = cursor.last_result or ""
+            if result.startswith(("Error", "failure")):
+                logger.warning("Server rejected LOAD; using INSERT statements")
+                self._bulk_load = False
+                return False
+            return True
+        finally:
+            os.unlink(path)
+
+    def execute_pipelined(
+        self, statements: Sequence[Tuple[str, tuple]], window: Optional[int] = None
+    ) -> List[list]:
+        """Execute several statements, keeping up to ``window`` of them in flight.
+
+        All requests of a window are written before any response is read, so a
+        batch costs one round-trip per window instead of one per statement.
+        Responses are matched to requests in order. With a window of 1 this is
+        equivalent to executing the statements one after another, which is
+        also what happens if the server does not NUL-terminate its replies.
+
+        If a statement is aborted, the statements after it that were not sent
+        yet are skipped, and the replies still owed for those in flight are
+        read and discarded before QueryAborted is re-raised. Statements already
+        in flight behind an aborted one are still executed by the server.
+
+        Args:
+            statements: Sequence of (sql, params) pairs
+            window: Outstanding-request limit (defaults to pipeline_window)
+
+        Returns:
+            Result rows of each statement, in order
+        """
+        if not self.client:
+            raise RuntimeError("Database not connected")
+
+        window = max(1, window or self.pipeline_window)
+        cursor = RMDBCursor(self.client)
+        results = []
+
+        # Pipelined replies can only be told apart if the server ends each one
+        # with a NUL byte (see Client._recv_reply())
+        if window == 1 or self.client._framed is False:
+            for sql, params in statements:
+                cursor.execute(sql, params)
+                results.append(cursor.fetchall())
+            return results
+
+        in_flight = deque()
+        try:
+            for sql, params in statements:
+                if len(in_flight) >= window:
+                    in_flight.popleft()
+                    cursor._handle_result(self.client.recv_response())
+                    results.append(cursor.fetchall())
+                self.client.submit_only(cursor.render(sql, params))
+                in_flight.append(sql)
+
+            while in_flight:
+                in_flight.popleft()
+                cursor._handle_result(self.client.recv_response())
+                results.append(cursor.fetchall())
+        except QueryAborted:
+            # Keep the connection in step with the server's replies
+            for _ in in_flight:
+                self.client.recv_response()
             raise
+        return results
 
     def execute_script(self, sql_script: str) -> None:
         """Execute multiple SQL statements."""
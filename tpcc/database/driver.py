@@ -1,4 +1,3 @@
-import re
 import time
 from pathlib import Path
 
@@ -451,9 +450,7 @@ class Driver:
                 return SQLState.ABORT
             ol_amount = ol_quantity[i] * i_price
             brand_generic = (
-                "B"
-                if re.search("ORIGINAL", i_data) and re.search("ORIGINAL", s_data)
-                else "G"
+                "B" if "ORIGINAL" in i_data and "ORIGINAL" in s_data else "G"
             )
 
             try:
@@ -3,29 +3,208 @@ RMDB cursor implementation for TPC-C benchmark.
 Adapts the custom RMDB protocol to a cursor-like interface.
 """
 
-from typing import List, Tuple, Optional, Iterator
+import logging
+import re
+import sys
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Deque, Iterable, List, Tuple, Optional, Iterator
 from enum import Enum
 
 from tpcc.database.connection import Client
 
+logger = logging.getLogger(__name__)
+
+# Positional placeholders accepted in SQL passed to RMDBCursor.execute
+_PARAM_RE = re.compile(r"%s|\?")
+
+# Single-row INSERT whose VALUES tuple is made only of placeholders
+_INSERT_RE = re.compile(
+    r"\s*(INSERT\s+INTO\s+.+?)\s+VALUES\s*"
+    r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)[\s;]*",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# One statement of a script: runs of non-";" text and quoted literals, so a
+# ";" inside '...' (with '' escapes) does not end the statement
+_STATEMENT_RE = re.compile(r"(?:[^;']|'(?:[^']|'')*')+")
+
+# RMDB reads each request into a fixed-size buffer, so a multi-row INSERT
+# must stay below this many bytes.
+MAX_STATEMENT_BYTES = Client.MAX_MEM_BUFFER_SIZE
+
+
+class QueryAborted(Exception):
+    """The server aborted the statement's transaction (an "abort" reply).
+
+    Raised instead of matching on error text, so callers can tell
+    transaction conflicts from other failures by type.
+    """
+
 
 class SQLState(Enum):
     SUCCESS = 7
     ABORT = 3
 
 
+def _quote(value: str) -> str:
+    """Quote a string literal, escaping single quotes by doubling them."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+# Exact-type dispatch for format_param; covers every value the generators
+# and transactions produce without walking an isinstance chain.
+_FORMATTERS = {
+    int: int.__str__,
+    float: float.__repr__,
+    str: _quote,
+    type(None): lambda _: "NULL",
+    bool: bool.__str__,
+    datetime: lambda value: _quote(str(value)),
+    date: lambda value: _quote(str(value)),
+    Decimal: Decimal.__str__,
+}
+
+
+def format_param(param) -> str:
+    """Render a Python value as an RMDB SQL literal.
+
+    Args:
+        param: Value to render
+
+    Returns:
+        SQL literal; strings are quoted with single quotes doubled
+    """
+    formatter = _FORMATTERS.get(type(param))
+    if formatter is not None:
+        return formatter(param)
+    # Subclasses such as numpy.str_
+    if isinstance(param, str):
+        return _quote(param)
+    return str(param)
+
+
+@lru_cache(maxsize=256)
+def _parse_header(line: str) -> Tuple[str, ...]:
+    """Column names of a result header line, interned and cached per header."""
+    return tuple(sys.intern(col.strip()) for col in line.strip().strip("|").split("|"))
+
+
+def split_statements(script: str) -> List[str]:
+    """Split a SQL script on semicolons that are outside string literals."""
+    return [stmt for stmt in map(str.strip, _STATEMENT_RE.findall(script)) if stmt]
+
+
+def first_cell(result: Optional[str]) -> Optional[str]:
+    """Return the first cell of the first data row of a raw RMDB response.
+
+    Only the header and the first data line are scanned; nothing else of the
+    response is split or stripped. An empty or NULL cell (e.g. MIN or SUM
+    over no rows) is returned as None, like a missing row.
+    """
+    if not result:
+        return None
+    header = result.find("|")
+    if header < 0:
+        return None
+    row = result.find("\n|", header)
+    if row < 0:
+        return None
+    end = result.find("|", row + 2)
+    if end < 0:
+        return None
+    cell = result[row + 2 : end].strip()
+    return None if cell in ("", "NULL") else cell
+
+
+def insert_prefix(sql: str) -> Optional[str]:
+    """Return ``INSERT INTO ... VALUES `` for a single-row placeholder INSERT.
+
+    Args:
+        sql: Statement such as ``INSERT INTO t VALUES (?, ?)``
+
+    Returns:
+        Normalized statement prefix, or None if sql is not such an INSERT
+    """
+    match = _INSERT_RE.fullmatch(sql)
+    if not match:
+        return None
+    return " ".join(match.group(1).split()) + " VALUES "
+
+
+def values_row(params: Tuple) -> str:
+    """Render one parameter tuple as a parenthesized VALUES row."""
+    return "(" + ", ".join(map(format_param, params)) + ")"
+
+
+def pack_rows(rows: Iterable[str], budget: int) -> Iterator[List[str]]:
+    """Group rendered VALUES rows so each group joins to at most budget bytes.
+
+    Rows are measured in UTF-8 bytes, as sent to the server; ASCII rows (the
+    usual case) skip the encoding. A row larger than the budget is still
+    yielded, alone.
+    """
+    batch, size = [], 0
+    for row in rows:
+        row_size = (len(row) if row.isascii() else len(row.encode())) + 2
+        if batch and size + row_size > budget:
+            yield batch
+            batch, size = [], 0
+        batch.append(row)
+        size += row_size
+    if batch:
+        yield batch
+
+
+def _build_where(where) -> Tuple[str, list]:
+    """Build a WHERE clause from (column, operator, value) conditions.
+
+    Args:
+        where: List of condition tuples (a single tuple is also accepted)
+
+    Returns:
+        Tuple of (clause, parameter list); the clause is "" without conditions
+    """
+    if not where:
+        return "", []
+    if isinstance(where, tuple):
+        where = [where]
+    clause = "WHERE " + " AND ".join(f"{col}{op}%s" for col, op, _ in where)
+    return clause, [value for _, _, value in where]
+
+
+def _build_set(row) -> Tuple[str, list]:
+    """Build a SET clause from (column, value) pairs (or a single pair)."""
+    if isinstance(row, tuple):
+        row = [row]
+    return ",".join(f"{col}=%s" for col, _ in row), [value for _, value in row]
+
+
 class RMDBCursor:
     """
     A cursor-like interface for RMDB database that mimics SQLite cursor behavior.
     Parses the custom pipe-delimited response format from RMDB.
     """
 
+    __slots__ = (
+        "client",
+        "last_result",
+        "rows",
+        "description",
+        "rowcount",
+        "arraysize",
+    )
+
     def __init__(self, client: Client):
         """Initialize cursor with RMDB client."""
         self.client = client
         self.last_result: Optional[str] = None
-        self.rows: List[Tuple] = []
-        self.description: Optional[List[Tuple]] = None
+        # Unfetched rows; a deque so fetchone() pops from the front in O(1)
+        self.rows: Deque[Tuple] = deque()
+        self.description: Optional[Tuple[str, ...]] = None
         self.rowcount: int = 0
         self.arraysize: int = 1
 
@@ -37,32 +216,171 @@ class RMDBCursor:
             sql: SQL query string
             parameters: Query parameters (will be substituted into SQL)
         """
-        # Substitute parameters into SQL
-        query = sql + ";"
+        # Substitute parameters into SQL and send query to RMDB
+        self._handle_result(self.client.send_cmd(self.render(sql, parameters)))
 
-        for param in parameters:
-            # Handle string parameters with proper quoting and escaping
-            if isinstance(param, str):
-                # Escape single quotes by doubling them
-                escaped_param = param.replace("'", "''")
-                formatted_param = f"'{escaped_param}'"
-            elif param is None:
-                formatted_param = "NULL"
-            else:
-                formatted_param = str(param)
+    def execute_scalar(self, sql: str, parameters: Tuple = ()) -> Optional[str]:
+        """
+        Execute a single-value query (COUNT, SUM, ...) without parsing rows.
+
+        Args:
+            sql: SQL query string
+            parameters: Query parameters (will be substituted into SQL)
+
+        Returns:
+            First cell of the first row, or None if there is no row or the
+            cell is NULL
+        """
+        result = self.client.send_cmd(self.render(sql, parameters))
+        self.last_result = result
+        if result and result.startswith("abort"):
+            raise QueryAborted(f"Query aborted: {result}")
+        self.rows = deque()
+        self.description = None
+        self.rowcount = 0
+        if not result or result.startswith("Error"):
+            return None
+        return first_cell(result)
+
+    def fetchscalar(self) -> Optional[str]:
+        """Return the first cell of the last result without consuming rows."""
+        return first_cell(self.last_result)
+
+    def execute_prepared(self, parts: Tuple[str, ...], parameters: Tuple) -> None:
+        """
+        Execute a statement template returned by _prepare().
+
+        Args:
+            parts: SQL segments around each placeholder
+            parameters: One value per placeholder
+        """
+        query = self._bind(parts, parameters)
+        if query is None:
+            raise ValueError(
+                f"Statement takes {len(parts) - 1} parameters, got {len(parameters)}"
+            )
+        self._handle_result(self.client.send_cmd(query))
+
+    def insert_many(
+        self,
+        prefix: str,
+        params_seq: Iterable[Tuple],
+        chunk: int = 256,
+        multi_row: bool = True,
+    ) -> Tuple[int, bool]:
+        """
+        Insert many rows with multi-row ``VALUES (...), (...)`` statements.
 
+        Rows are packed into statements of at most ``chunk`` rows and
+        MAX_STATEMENT_BYTES bytes. If the server rejects the multi-row form,
+        the remaining rows are sent one statement per row.
+
+        Args:
+            prefix: Statement prefix from insert_prefix()
+            params_seq: Iterable of parameter tuples, one per row
+            chunk: Maximum number of rows per statement
+            multi_row: False to send one statement per row from the start
+
+        Returns:
+            Tuple of (rows sent, whether multi-row statements are still usable)
+        """
+        return self.insert_rendered(
+            prefix, map(values_row, params_seq), chunk, multi_row
+        )
+
+    def insert_rendered(
+        self,
+        prefix: str,
+        rows: Iterable[str],
+        chunk: int = 256,
+        multi_row: bool = True,
+    ) -> Tuple[int, bool]:
+        """
+        Insert rows already rendered as ``(...)`` VALUES tuples.
+
+        Same packing and fallback as insert_many(), for callers that render
+        rows in bulk (e.g. a column at a time) instead of per parameter.
+
+        Args:
+            prefix: Statement prefix from insert_prefix()
+            rows: Rendered rows such as ``(1, 'a')``
+            chunk: Maximum number of rows per statement
+            multi_row: False to send one statement per row from the start
+
+        Returns:
+            Tuple of (rows sent, whether multi-row statements are still usable)
+        """
+        budget = MAX_STATEMENT_BYTES - len(prefix) - 1
+        total = 0
+        rows_iter = iter(rows)
+        while True:
+            rows = list(islice(rows_iter, chunk))
+            if not rows:
+                return total, multi_row
+            total += len(rows)
+
+            batches = pack_rows(rows, budget) if multi_row else [rows]
+            for batch in batches:
+                if multi_row:
+                    self.execute(prefix + ", ".join(batch))
+                    result = self.last_result or ""
+                    if len(batch) == 1 or not result.startswith(("Error", "failure")):
+                        continue
+                    logger.warning(
+                        "Server rejected multi-row INSERT; using single rows"
+                    )
+                    multi_row = False
+                for row in batch:
+                    self.execute(prefix + row)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _prepare(sql: str) -> Tuple[str, ...]:
+        """Split terminated SQL around its placeholders, cached per SQL string."""
+        return tuple(_PARAM_RE.split(sql + ";"))
+
+    @staticmethod
+    def _bind(parts: Tuple[str, ...], parameters: Tuple) -> Optional[str]:
+        """Interleave formatted parameters with template parts.
+
+        Returns:
+            The statement, or None if the parameter count does not match
+        """
+        if len(parts) != len(parameters) + 1:
+            return None
+        formatted = [format_param(param) for param in parameters]
+        formatted.append("")
+        # Values are never rescanned for placeholders
+        return "".join(chain.from_iterable(zip(parts, formatted)))
+
+    @classmethod
+    def render(cls, sql: str, parameters: Tuple = ()) -> str:
+        """Substitute parameters into SQL and terminate the statement."""
+        if not parameters:
+            return sql + ";"
+
+        query = cls._bind(cls._prepare(sql), parameters)
+        if query is not None:
+            return query
+
+        # Placeholder count differs from the parameters: legacy substitution
+        formatted = [format_param(param) for param in parameters]
+        query = sql + ";"
+        for formatted_param in formatted:
             query = query.replace("%s", formatted_param, 1)
             query = query.replace("?", formatted_param, 1)
+        return query
 
-        # Send query to RMDB
-        result = self.client.send_cmd(query)
+    def _handle_result(self, result: str) -> None:
+        """Store and parse a raw server response for the statement just sent."""
         self.last_result = result
 
-        if result.startswith("abort"):
-            raise Exception(f"Query aborted: {result}")
+        if result and result.startswith("abort"):
+            raise QueryAborted(f"Query aborted: {result}")
 
-        if result.startswith("Error") or result is None or result == "":
-            self.rows = []
+        # Errors and non-tabular replies (INSERT/UPDATE/DELETE) carry no rows
+        if not result or "|" not in result or result.startswith("Error"):
+            self.rows = deque()
             self.description = None
             self.rowcount = 0
             return
@@ -71,68 +389,68 @@ class RMDBCursor:
         self._parse_result(result)
 
     def _parse_result(self, result: str) -> None:
-        """Parse RMDB pipe-delimited response format."""
-        lines = result.strip().split("\n")
+        """Parse RMDB pipe-delimited response format.
 
-        if not lines:
-            self.rows = []
-            return
-
-        # Find the header line (starts with |)
-        header_line = None
-        for line in lines:
-            if line.startswith("|"):
-                header_line = line
-                break
+        The first "|"-prefixed line is the header; every later one is a data row.
+        """
+        pipe_lines = [line for line in result.splitlines() if line[:1] == "|"]
 
-        if not header_line:
-            self.rows = []
+        if not pipe_lines:
+            self.rows = deque()
             return
 
         # Parse column names from header
-        columns = [col.strip() for col in header_line.split("|") if col.strip()]
-        self.description = [col for col in columns]
-
-        # Parse data rows
-        data_rows = []
-        data_started = False
-
-        for line in lines:
-            if line.startswith("|"):
-                if data_started:  # This is a data row
-                    values = [val.strip() for val in line.split("|") if val.strip()]
-                    if len(values) == len(columns):
-                        data_rows.append(tuple(values))
-                else:  # This is the header
-                    data_started = True
+        columns = _parse_header(pipe_lines[0])
+        self.description = columns
+        ncols = len(columns)
+
+        # Fast path: tokenize the whole body with one split. Rows are
+        # "| c1 | ... | cN |", so joined lines yield N cells plus one empty
+        # separator token per row (and one trailing token).
+        data_lines = pipe_lines[1:]
+        strip = str.strip
+        step = ncols + 1
+        cells = list(map(strip, "".join(data_lines).split("|")))
+        if len(cells) == len(data_lines) * step + 1 and not any(cells[::step]):
+            self.rows = deque(
+                tuple(cells[i : i + ncols]) for i in range(1, len(cells) - 1, step)
+            )
+            self.rowcount = len(self.rows)
+            return
 
-        self.rows = data_rows
-        self.rowcount = len(data_rows)
+        # Irregular rows: parse line by line, dropping any whose cell count does
+        # not match the header. map(str.strip) keeps the per-cell work in C.
+        self.rows = deque(
+            values
+            for values in (
+                tuple(map(strip, line.strip().strip("|").split("|")))
+                for line in islice(pipe_lines, 1, None)
+            )
+            if len(values) == ncols
+        )
+        self.rowcount = len(self.rows)
 
     def fetchone(self) -> Optional[Tuple]:
         """Fetch the next row of a query result set."""
-        if not self.rows:
-            return None
-        return self.rows.pop(0)
+        return self.rows.popleft() if self.rows else None
 
     def fetchmany(self, size: int = None) -> List[Tuple]:
         """Fetch the next set of rows of a query result set."""
         if size is None:
             size = self.arraysize
 
-        result = self.rows[:size]
-        self.rows = self.rows[size:]
-        return result
+        rows = self.rows
+        return [rows.popleft() for _ in range(min(size, len(rows)))]
 
     def fetchall(self) -> List[Tuple]:
         """Fetch all remaining rows of a query result set."""
-        result = self.rows
-        self.rows = []
+        result = list(self.rows)
+        self.rows.clear()
         return result
 
     def close(self) -> None:
         """Close the cursor."""
-        self.rows = []
+        self.rows.clear()
         self.description = None
         self.last_result = None
 
@@ -144,7 +462,7 @@ class RMDBCursor:
         """Iterator protocol support."""
         if not self.rows:
             raise StopIteration
-        return self.rows.pop(0)
+        return self.rows.popleft()
 
 
 class RMDBCursorAdapter:
@@ -152,6 +470,12 @@ class RMDBCursorAdapter:
     Adapter class that provides SQLite-like cursor interface for RMDB.
     """
 
+    # Send placeholder-free scripts in one request. Off by default: the stock
+    # RMDB parser accepts the first statement of a request and drops the rest.
+    MULTI_STATEMENT_SCRIPTS = False
+
+    __slots__ = ("client", "_cursor")
+
     def __init__(self, client: Client):
         self.client = client
         self._cursor = RMDBCursor(client)
@@ -160,10 +484,56 @@ class RMDBCursorAdapter:
         """Execute SQL query."""
         return self._cursor.execute(sql, parameters)
 
+    def execute_prepared(self, parts: Tuple[str, ...], parameters: Tuple) -> None:
+        """Execute a statement template returned by RMDBCursor._prepare()."""
+        return self._cursor.execute_prepared(parts, parameters)
+
+    def execute_scalar(self, sql: str, parameters: Tuple = ()) -> Optional[str]:
+        """Execute a single-value query and return its first cell."""
+        return self._cursor.execute_scalar(sql, parameters)
+
+    def fetchscalar(self) -> Optional[str]:
+        """Return the first cell of the last result."""
+        return self._cursor.fetchscalar()
+
     def executemany(self, sql: str, seq_of_parameters: List[Tuple]) -> None:
-        """Execute SQL query with multiple parameter sets."""
+        """Execute SQL query with multiple parameter sets.
+
+        Placeholder-only INSERT statements are batched into multi-row
+        statements; anything else is executed once per parameter set.
+        """
+        cursor = self._cursor
+        prefix = insert_prefix(sql)
+        if prefix:
+            cursor.insert_many(prefix, seq_of_parameters)
+            return
+
+        parts = cursor._prepare(sql)
         for parameters in seq_of_parameters:
-            self._cursor.execute(sql, parameters)
+            if len(parameters) + 1 == len(parts):
+                cursor.execute_prepared(parts, parameters)
+            else:
+                cursor.execute(sql, parameters)
+
+    def insert_many(
+        self,
+        prefix: str,
+        params_seq: Iterable[Tuple],
+        chunk: int = 256,
+        multi_row: bool = True,
+    ) -> Tuple[int, bool]:
+        """Insert many rows with multi-row statements (see RMDBCursor.insert_many)."""
+        return self._cursor.insert_many(prefix, params_seq, chunk, multi_row)
+
+    def insert_rendered(
+        self,
+        prefix: str,
+        rows: Iterable[str],
+        chunk: int = 256,
+        multi_row: bool = True,
+    ) -> Tuple[int, bool]:
+        """Insert pre-rendered VALUES rows (see RMDBCursor.insert_rendered)."""
+        return self._cursor.insert_rendered(prefix, rows, chunk, multi_row)
 
     def executescript(self, script: str) -> None:
         """Execute a SQL script with multiple statements.
@@ -171,15 +541,20 @@ class RMDBCursorAdapter:
         Args:
             script: SQL script containing multiple statements separated by semicolons
         """
-        # Split script into individual statements
-        statements = [stmt.strip() for stmt in script.split(";") if stmt.strip()]
-
-        for statement in statements:
-            # Skip empty statements
-            if not statement:
-                continue
-
-            # Execute each statement without parameters
+        if (
+            self.MULTI_STATEMENT_SCRIPTS
+            and len(script.encode()) < MAX_STATEMENT_BYTES
+            and not _PARAM_RE.search(script)
+        ):
+            self._cursor._handle_result(self.client.send_cmd(script))
+            result = self._cursor.last_result or ""
+            if not result.startswith(("Error", "failure")):
+                return
+            logger.warning("Server rejected multi-statement script; splitting it")
+
+        # Split script into individual statements and execute each without
+        # parameters
+        for statement in split_statements(script):
             self._cursor.execute(statement)
 
     def fetchone(self) -> Optional[Tuple]:
@@ -208,6 +583,11 @@ class RMDBCursorAdapter:
         """Return affected row count."""
         return self._cursor.rowcount
 
+    @property
+    def last_result(self) -> Optional[str]:
+        """Return the raw server response of the last statement."""
+        return self._cursor.last_result
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -223,17 +603,40 @@ class RMDBQueryExecutor:
     Backward compatibility class that mimics the original sql.py functions.
     """
 
+    # Reject SELECT * so callers only fetch and parse the columns they use
+    STRICT_COLUMNS = True
+
     def __init__(self, client: Client):
         self.client = client
+        # One cursor serves every call; each method drains it before returning
+        self._cursor = RMDBCursor(client)
+        # Cleared the first time the server rejects a multi-row INSERT
+        self._multi_row_insert = True
 
-    def select(self, table, col="*", where=None, order_by=None, asc=False):
+    def _reset_cursor(self) -> RMDBCursor:
+        """Return the shared cursor with any rows left by an aborted call dropped."""
+        cursor = self._cursor
+        cursor.rows.clear()
+        cursor.description = None
+        return cursor
+
+    def select(self, table, col=None, where=None, order_by=None, asc=False):
         """
         Execute SELECT query with RMDB format.
 
+        Args:
+            col: Column name or list of column names; "*" (or None) is only
+                accepted when STRICT_COLUMNS is off
+
         Returns:
             List of tuples for success, SQLState for abort/error
         """
-        cursor = RMDBCursor(self.client)
+        if col is None or col == "*":
+            if self.STRICT_COLUMNS:
+                raise ValueError(f"SELECT on {table} needs an explicit column list")
+            col = "*"
+
+        cursor = self._reset_cursor()
 
         # Build SQL
         if isinstance(table, list):
@@ -241,25 +644,12 @@ class RMDBQueryExecutor:
         else:
             table_str = table
 
-        if isinstance(col, list):
-            col_str = ",".join(col)
+        if isinstance(col, (list, tuple)):
+            col_str = ",".join(dict.fromkeys(col))
         else:
             col_str = col
 
-        # Build WHERE clause
-        where_clause = ""
-        params = []
-        if where:
-            if not isinstance(where, list):
-                where = [where]
-            conditions = []
-            for condition in where:
-                if len(condition) == 3:
-                    col_name, operator, value = condition
-                    conditions.append(f"{col_name}{operator}%s")
-                    params.append(value)
-            if conditions:
-                where_clause = "WHERE " + " AND ".join(conditions)
+        where_clause, params = _build_where(where)
 
         # Build ORDER BY clause
         order_clause = ""
@@ -270,16 +660,20 @@ class RMDBQueryExecutor:
         sql = f"SELECT {col_str} FROM {table_str} {where_clause} {order_clause};"
 
         try:
-            cursor.execute(sql, tuple(params))
+            cursor.execute(sql, params)
             return cursor.fetchall()
-        except Exception as e:
-            if "abort" in str(e).lower():
-                return SQLState.ABORT
+        except QueryAborted:
+            return SQLState.ABORT
+        except Exception:
             return []
 
+    def select_cols(self, table, cols, **kwargs):
+        """Execute SELECT of the given columns; kwargs are passed to select()."""
+        return self.select(table, list(cols), **kwargs)
+
     def insert(self, table, rows):
         """Execute INSERT query."""
-        cursor = RMDBCursor(self.client)
+        cursor = self._reset_cursor()
 
         if not isinstance(rows[0], list):
             rows = [rows]
@@ -288,71 +682,65 @@ class RMDBQueryExecutor:
         sql = f"INSERT INTO {table} VALUES ({placeholders});"
 
         try:
+            parts = cursor._prepare(sql)
             for row in rows:
-                cursor.execute(sql, tuple(row))
+                cursor.execute_prepared(parts, tuple(row))
+            return None
+        except QueryAborted:
+            return SQLState.ABORT
+        except Exception:
+            return None
+
+    def insert_batch(self, table, rows, chunk=256):
+        """Execute INSERT for many rows, up to chunk rows per statement."""
+        cursor = self._reset_cursor()
+
+        if not isinstance(rows[0], (list, tuple)):
+            rows = [rows]
+
+        try:
+            _, self._multi_row_insert = cursor.insert_many(
+                f"INSERT INTO {table} VALUES ",
+                rows,
+                chunk=chunk,
+                multi_row=self._multi_row_insert,
+            )
             return None
-        except Exception as e:
-            if "abort" in str(e).lower():
-                return SQLState.ABORT
+        except QueryAborted:
+            return SQLState.ABORT
+        except Exception:
             return None
 
     def update(self, table, row, where=None):
         """Execute UPDATE query."""
-        cursor = RMDBCursor(self.client)
-
-        if not isinstance(row, list):
-            row = [row]
-
-        set_clause = ",".join([f"{col}=%s" for col, val in row])
-        params = [val for col, val in row]
-
-        where_clause = ""
-        if where:
-            if not isinstance(where, list):
-                where = [where]
-            conditions = []
-            for condition in where:
-                if len(condition) == 3:
-                    col_name, operator, value = condition
-                    conditions.append(f"{col_name}{operator}%s")
-                    params.append(value)
-            if conditions:
-                where_clause = "WHERE " + " AND ".join(conditions)
+        cursor = self._reset_cursor()
+
+        set_clause, params = _build_set(row)
+        where_clause, where_params = _build_where(where)
+        params.extend(where_params)
 
         sql = f"UPDATE {table} SET {set_clause} {where_clause};"
 
         try:
-            cursor.execute(sql, tuple(params))
+            cursor.execute(sql, params)
             return None
-        except Exception as e:
-            if "abort" in str(e).lower():
-                return SQLState.ABORT
+        except QueryAborted:
+            return SQLState.ABORT
+        except Exception:
             return None
 
     def delete(self, table, where):
         """Execute DELETE query."""
-        cursor = RMDBCursor(self.client)
-
-        where_clause = ""
-        params = []
-        if where:
-            if not isinstance(where, list):
-                where = [where]
-            conditions = []
-            for condition in where:
-                if len(condition) == 3:
-                    col_name, operator, value = condition
-                    conditions.append(f"{col_name}{operator}%s")
-                    params.append(value)
-            if conditions:
-                where_clause = "WHERE " + " AND ".join(conditions)
+        cursor = self._reset_cursor()
+
+        where_clause, params = _build_where(where)
 
         sql = f"DELETE FROM {table} {where_clause};"
 
         try:
-            cursor.execute(sql, tuple(params))
+            cursor.execute(sql, params)
             return None
-        except Exception as e:
-            if "abort" in str(e).lower():
-                return SQLState.ABORT
+        except QueryAborted:
+            return SQLState.ABORT
+        except Exception:
             return None
@@ -12,6 +12,18 @@ from .database_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+TPCC_TABLES = (
+    "warehouse",
+    "district",
+    "customer",
+    "item",
+    "stock",
+    "orders",
+    "order_line",
+    "new_orders",
+    "history",
+)
+
 
 class SchemaManager:
     """Manages TPC-C database schema creation and validation."""
@@ -60,29 +72,26 @@ class SchemaManager:
             raise
 
     def validate_schema(self) -> bool:
-        """Validate that all required TPC-C tables exist."""
-        required_tables = [
-            "warehouse",
-            "district",
-            "customer",
-            "item",
-            "stock",
-            "orders",
-            "order_line",
-            "new_order",
-            "history",
-        ]
+        """Validate that all required TPC-C tables exist.
 
+        Reads the catalog with one SHOW TABLES; if that yields nothing, each
+        table is probed with a COUNT(*) that returns a row only if it exists.
+        """
         try:
             with self.db.get_cursor() as cursor:
-                for table in required_tables:
-                    cursor.execute(
-                        "SELECT * FROM ?",
-                        (table,),
-                    )
-                    if not cursor.fetchone():
-                        logger.error(f"Required table '{table}' not found")
-                        return False
+                cursor.execute("SHOW TABLES")
+                present = {row[0] for row in cursor.fetchall()}
+                if not present:
+                    for table in TPCC_TABLES:
+                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                        if cursor.fetchone():
+                            present.add(table)
+
+                missing = [table for table in TPCC_TABLES if table not in present]
+                for table in missing:
+                    logger.error("Required table '%s' not found", table)
+                if missing:
+                    return False
 
                 logger.info("Schema validation passed")
                 return True
@@ -92,48 +101,18 @@ class SchemaManager:
             return False
 
     def get_table_counts(self) -> Dict[str, int]:
-        """Get row counts for all TPC-C tables."""
-        tables = [
-            "warehouse",
-            "district",
-            "customer",
-            "item",
-            "stock",
-            "orders",
-            "order_line",
-            "new_order",
-            "history",
-        ]
-
-        counts = {}
-        try:
-            with self.db.get_cursor() as cursor:
-                for table in tables:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    counts[table] = cursor.fetchone()[0]
-        except sqlite3.Error as e:
-            logger.error(f"Failed to get table counts: {e}")
-            raise
-
+        """Get row counts for all TPC-C tables (see DatabaseConnection.count_rows)."""
+        counts = self.db.count_rows(TPCC_TABLES)
+        missing = [table for table in TPCC_TABLES if table not in counts]
+        if missing:
+            raise RuntimeError(f"Failed to get table counts for {missing}")
         return counts
 
     def drop_all_tables(self) -> None:
         """Drop all TPC-C tables (for testing/cleanup)."""
-        tables = [
-            "warehouse",
-            "district",
-            "customer",
-            "item",
-            "stock",
-            "orders",
-            "order_line",
-            "new_order",
-            "history",
-        ]
-
         try:
             with self.db.get_cursor() as cursor:
-                for table in tables:
+                for table in TPCC_TABLES:
                     cursor.execute(f"DROP TABLE IF EXISTS {table}")
                 logger.info("All TPC-C tables dropped successfully")
         except sqlite3.Error as e:
@@ -46,12 +46,12 @@ def test_rmdb_connection():
                         "INSERT INTO warehouse VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
                         (
                             666,
-                            "'Thouse'",
-                            "'123 Main St'",
-                            "'456 Main St'",
-                            "'Test City'",
-                            "'CA'",
-                            "'12345'",
+                            "Thouse",
+                            "123 Main St",
+                            "456 Main St",
+                            "Test City",
+                            "CA",
+                            "12345",
                             0.1,
                             1000.0,
                         ),
@@ -67,7 +67,9 @@ def test_rmdb_connection():
                 executor = RMDBQueryExecutor(db.client)
                 try:
                     # Test with warehouse table
-                    result = executor.select("warehouse", where=[("w_id", "=", 1)])
+                    result = executor.select(
+                        "warehouse", ["w_id", "w_name"], where=[("w_id", "=", 1)]
+                    )
                     if isinstance(result, list):
                         print(f"✓ RMDBQueryExecutor SELECT returned {len(result)} rows")
                     else:
@@ -254,4 +256,6 @@ if __name__ == "__main__":
     print("2. Compatibility usage:")
     print("   from tpcc.database.rmdb_cursor import RMDBQueryExecutor")
     print("   executor = RMDBQueryExecutor(client)")
-    print("   results = executor.select('warehouse', where=[('w_id', '=', 1)])")
+    print(
+        "   results = executor.select('warehouse', ['w_id', 'w_name'], where=[('w_id', '=', 1)])"
+    )
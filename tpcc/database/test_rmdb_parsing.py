@@ -0,0 +1,168 @@
+"""
+Offline tests of RMDB response parsing and reply framing.
+Uses stub clients and sockets, so no RMDB server is needed.
+"""
+
+import sys
+import os
+import socket
+
+# Add tpcc to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from tpcc.database.connection import Client
+from tpcc.database.rmdb_cursor import RMDBCursor, first_cell
+
+
+class StubClient:
+    """Client answering every statement with the same raw response."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.sent = []
+
+    def send_cmd(self, cmd):
+        self.sent.append(cmd)
+        return self.response
+
+
+class StubSocket:
+    """Socket whose recv() returns the given chunks, one per call.
+
+    A chunk that is an exception (e.g. socket.timeout()) is raised instead.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.sent = []
+        self.timeout = None
+
+    def recv(self, size):
+        chunk = self.chunks.pop(0) if self.chunks else b""
+        if isinstance(chunk, BaseException):
+            raise chunk
+        return chunk
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def gettimeout(self):
+        return self.timeout
+
+
+def _cursor(response: str) -> RMDBCursor:
+    cursor = RMDBCursor(StubClient(response))
+    cursor.execute("SELECT a, b FROM t")
+    return cursor
+
+
+def _client(chunks) -> Client:
+    # Client() connects in __init__; set up only what the readers use
+    client = Client.__new__(Client)
+    client.sockfd = StubSocket(chunks)
+    client._pending = b""
+    client._framed = None
+    return client
+
+
+def test_regular_rows():
+    """Well-formed rows are split into stripped cells."""
+    cursor = _cursor("| a | b |\n| 1 | x |\n| 2 |  |\n")
+    assert cursor.description == ("a", "b")
+    assert cursor.fetchall() == [("1", "x"), ("2", "")]
+    assert cursor.rowcount == 2
+
+
+def test_irregular_rows():
+    """Rows whose cell count differs from the header are dropped."""
+    cursor = _cursor("| a | b |\n| 1 | 2 | 3 |\n| 4 | 5 |\n| 6 |\n")
+    assert cursor.fetchall() == [("4", "5")]
+    assert cursor.rowcount == 1
+
+
+def test_cell_containing_pipe():
+    """A "|" inside a cell drops that row without shifting the others."""
+    cursor = _cursor("| a | b |\n| 1 | x|y |\n| 2 | z |\n")
+    assert cursor.fetchall() == [("2", "z")]
+
+
+def test_non_tabular_replies():
+    """Errors and replies without a table carry no rows."""
+    for response in ("", "\n", "Error: no such table\n", "failure\n"):
+        cursor = _cursor(response)
+        assert cursor.fetchall() == []
+        assert cursor.rowcount == 0
+
+
+def test_null_scalars():
+    """NULL, empty and missing first cells are all returned as None."""
+    assert first_cell("| MIN(no_o_id) |\n| NULL |\n") is None
+    assert first_cell("| x |\n|  |\n") is None
+    assert first_cell("| x |\n") is None
+    assert first_cell(None) is None
+    assert first_cell("| MIN(no_o_id) |\n| 3001 |\n") == "3001"
+
+    cursor = RMDBCursor(StubClient("| SUM(ol_amount) |\n| NULL |\n"))
+    assert cursor.execute_scalar("SELECT SUM(ol_amount) FROM order_line") is None
+
+
+def test_reply_split_across_reads():
+    """A reply is read until its NUL terminator, however it is chunked."""
+    client = _client([b"| a |\n| 1", b" |\n| 2 |", b"\n\0", b"| a |", b"\n\0"])
+    assert client.send_cmd("SELECT a FROM t;") == "| a |\n| 1 |\n| 2 |\n"
+    assert client._framed is True
+    assert client.send_cmd("SELECT a FROM t;") == "| a |\n"
+    assert client.sockfd.chunks == []
+    # The grace read of the first reply restores the operation timeout
+    assert client.sockfd.timeout == 300
+
+
+def test_two_replies_in_one_read():
+    """Bytes after a reply's terminator are kept for the next reply."""
+    client = _client([b"| a |\n| 1 |\n\0| a |\n| 2 |\n\0"])
+    client.submit_only("SELECT 1;")
+    client.submit_only("SELECT 2;")
+    assert client.recv_response() == "| a |\n| 1 |\n"
+    assert client._pending == b"| a |\n| 2 |\n\0"
+    # A plain statement afterwards reads the buffered reply, not a new one
+    assert client.send_cmd("SELECT 2;") == "| a |\n| 2 |\n"
+    assert client._pending == b""
+
+
+def test_unframed_server():
+    """If the first reply ends without a NUL, every read is one reply."""
+    client = _client(
+        [b"| a |\n| 1 |\n", socket.timeout(), b"| a |\n| 2 |\n", b"| a |\n"]
+    )
+    assert client.send_cmd("SELECT 1;") == "| a |\n| 1 |\n"
+    assert client._framed is False
+    assert client.send_cmd("SELECT 2;") == "| a |\n| 2 |\n"
+    assert client.sockfd.chunks == [b"| a |\n"]
+
+
+def test_pipelined_requests_are_terminated():
+    """submit_only() NUL-terminates requests so a server can split them."""
+    client = _client([])
+    client.submit_only("SELECT 1;")
+    assert client.sockfd.sent == [b"SELECT 1;\0"]
+
+
+if __name__ == "__main__":
+    tests = [
+        value
+        for name, value in list(globals().items())
+        if name.startswith("test_") and callable(value)
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)
@@ -3,13 +3,71 @@ Consistency Check Executor for TPC-C benchmark.
 Provides comprehensive data validation and statistics collection.
 """
 
+import copy
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ..database.connection_pool import ConnectionPool
 from ..database.database_connection import DatabaseConnection
+from ..database.schema_manager import TPCC_TABLES
 
 logger = logging.getLogger(__name__)
 
+# Per-district new_orders aggregates, shared by the district order and
+# new_orders checks
+_NEW_ORDERS_AGGREGATES_SQL = (
+    "SELECT no_w_id, no_d_id, COUNT(no_o_id), MAX(no_o_id), MIN(no_o_id) "
+    "FROM new_orders GROUP BY no_w_id, no_d_id"
+)
+
+# Every per-district aggregate the three district checks need, from one scan
+# of each table; a district without rows in a table gets -1/0 placeholders
+_DISTRICT_AGGREGATES_SQL = (
+    "SELECT d.d_w_id, d.d_id, d.d_next_o_id, "
+    "COALESCE(o.max_o_id, -1), COALESCE(o.sum_ol_cnt, -1), "
+    "COALESCE(n.cnt_no, 0), COALESCE(n.max_no, -1), COALESCE(n.min_no, -1), "
+    "COALESCE(l.cnt_ol, 0) "
+    "FROM district d "
+    "LEFT JOIN (SELECT o_w_id, o_d_id, MAX(o_id) AS max_o_id, "
+    "SUM(o_ol_cnt) AS sum_ol_cnt FROM orders GROUP BY o_w_id, o_d_id) o "
+    "ON o.o_w_id = d.d_w_id AND o.o_d_id = d.d_id "
+    "LEFT JOIN (SELECT no_w_id, no_d_id, COUNT(no_o_id) AS cnt_no, "
+    "MAX(no_o_id) AS max_no, MIN(no_o_id) AS min_no FROM new_orders "
+    "GROUP BY no_w_id, no_d_id) n "
+    "ON n.no_w_id = d.d_w_id AND n.no_d_id = d.d_id "
+    "LEFT JOIN (SELECT ol_w_id, ol_d_id, COUNT(ol_o_id) AS cnt_ol "
+    "FROM order_line GROUP BY ol_w_id, ol_d_id) l "
+    "ON l.ol_w_id = d.d_w_id AND l.ol_d_id = d.d_id"
+)
+
+# Each query counts the districts that satisfy a consistency rule, so a check
+# passes when the count equals the number of districts (a missing district
+# fails it too) and only one row comes back from the server.
+_DISTRICT_ORDER_MATCHES_SQL = (
+    "SELECT COUNT(*) FROM district d "
+    "WHERE d.d_next_o_id - 1 = (SELECT MAX(o.o_id) FROM orders o "
+    "WHERE o.o_w_id = d.d_w_id AND o.o_d_id = d.d_id) "
+    "AND d.d_next_o_id - 1 = (SELECT MAX(n.no_o_id) FROM new_orders n "
+    "WHERE n.no_w_id = d.d_w_id AND n.no_d_id = d.d_id)"
+)
+_NEW_ORDERS_MATCHES_SQL = (
+    "SELECT COUNT(*) FROM (SELECT COUNT(no_o_id) AS cnt, "
+    "MAX(no_o_id) - MIN(no_o_id) + 1 AS span FROM new_orders "
+    "GROUP BY no_w_id, no_d_id) x WHERE cnt = span"
+)
+_ORDER_LINE_MATCHES_SQL = (
+    "SELECT COUNT(*) FROM (SELECT o_w_id, o_d_id, SUM(o_ol_cnt) AS ol_sum "
+    "FROM orders GROUP BY o_w_id, o_d_id) o "
+    "JOIN (SELECT ol_w_id, ol_d_id, COUNT(ol_o_id) AS ol_cnt FROM order_line "
+    "GROUP BY ol_w_id, ol_d_id) l "
+    "ON o.o_w_id = l.ol_w_id AND o.o_d_id = l.ol_d_id WHERE o.ol_sum = l.ol_cnt"
+)
+
 
 class ConsistencyCheckExecutor:
     """Dedicated executor for TPC-C data consistency validation and statistics."""
@@ -17,49 +75,153 @@ class ConsistencyCheckExecutor:
     # TPC-C constants
     DISTRICTS_PER_WAREHOUSE = 10
     ITEMS_TOTAL = 100000
-
-    def __init__(self, db_connection: DatabaseConnection, scale_factor: int = 1):
+    # Warehouses per foreign key validation batch
+    FK_BATCH_WAREHOUSES = 10
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        scale_factor: int = 1,
+        parallel_checks: bool = True,
+        max_workers: int = 8,
+    ):
         """Initialize Consistency Check Executor.
 
         Args:
             db_connection: Database connection instance
             scale_factor: Number of warehouses in the test
+            parallel_checks: Run independent checks concurrently, each on its
+                own connection; False runs them one after another on
+                db_connection
+            max_workers: Upper bound on concurrent checks (and connections)
         """
         self.db = db_connection
         self.scale_factor = scale_factor
+        self.parallel_checks = parallel_checks
+        # Every (w_id, d_id) pair expected at this scale factor
+        self._wd_pairs: Tuple[Tuple[int, int], ...] = tuple(
+            (w_id, d_id)
+            for w_id in range(1, scale_factor + 1)
+            for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1)
+        )
+        self.max_workers = max_workers
+        # Exact counts from the last full count; updated in place so the
+        # per-check executor copies share it
+        self._last_counts: Dict[str, int] = {}
+        # Per-district query results shared by the checks of one
+        # run_consistency_checks() call, None outside of it
+        self._shared_columns: Optional[Dict[Tuple[str, int], Future]] = None
+        self._shared_lock = threading.Lock()
+        # Whether the server runs the joined district query; updated in place
+        self._capabilities: Dict[str, bool] = {}
+
+    def _run_checks(
+        self, checks: Sequence[Callable[[], Dict[str, bool]]]
+    ) -> Dict[str, bool]:
+        """Run independent check methods and merge their results in order.
+
+        In parallel mode each check runs on a copy of this executor bound to
+        a pooled connection, since one RMDB connection serves one statement
+        at a time. If the pool cannot be opened the checks run serially.
+        Checks may be functools.partial objects wrapping bound methods.
+        """
+        results = {}
+        workers = min(self.max_workers, len(checks))
+        if not self.parallel_checks or workers < 2:
+            for check in checks:
+                results.update(check())
+            return results
 
-    def run_consistency_checks(self) -> Dict[str, bool]:
+        try:
+            pool = ConnectionPool(
+                workers,
+                self.db.host,
+                self.db.port,
+                slow_query_ms=self.db.slow_query_ms,
+            )
+        except Exception as e:
+            logger.warning("Running checks serially, connection pool failed: %s", e)
+            self.parallel_checks = False
+            return self._run_checks(checks)
+
+        def run_pooled(check):
+            with pool.acquire() as db, db.quiet_output():
+                worker = copy.copy(self)
+                worker.db = db
+                if isinstance(check, partial):
+                    method = getattr(worker, check.func.__name__)
+                    return method(*check.args, **check.keywords)
+                return getattr(worker, check.__name__)()
+
+        with pool, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_pooled, check) for check in checks]
+            for future in futures:
+                results.update(future.result())
+        return results
+
+    def run_consistency_checks(
+        self, fail_fast: bool = True, validate_integrity: bool = False
+    ) -> Dict[str, bool]:
         """Run comprehensive consistency checks on loaded TPC-C data.
 
+        Args:
+            fail_fast: Report only the first inconsistent district of each
+                check (and, without the joined district query, evaluate each
+                rule as one counting query); False logs every offending
+                district
+            validate_integrity: Also run the validate_data_integrity() checks,
+                dispatched together with the others so their queries overlap
+
         Returns:
             Dictionary mapping check names to their pass/fail status
         """
         logger.info("Running consistency checks...")
 
-        checks = {}
-
-        # Basic count validations
-        checks.update(self._check_table_counts())
-
-        # Advanced consistency checks
-        checks.update(self._check_district_order_consistency())
-        checks.update(self._check_new_orders_consistency())
-        checks.update(self._check_order_line_consistency())
+        # Basic count validations and advanced consistency checks; checks
+        # that need the same per-district aggregates fetch them only once
+        self._shared_columns = {}
+        try:
+            if self._capabilities.get("joined_district_checks", True):
+                district_checks = [partial(self._check_district_invariants, fail_fast)]
+            else:
+                district_checks = [
+                    partial(self._check_district_order_consistency, fail_fast),
+                    partial(self._check_new_orders_consistency, fail_fast),
+                    partial(self._check_order_line_consistency, fail_fast),
+                ]
+            integrity_checks = (
+                [self._validate_foreign_keys, self._validate_business_rules]
+                if validate_integrity
+                else []
+            )
+            with self.db.quiet_output():
+                checks = self._run_checks(
+                    [self._check_table_counts, *district_checks, *integrity_checks]
+                )
+        finally:
+            self._shared_columns = None
 
         # Summary of results
         passed = sum(1 for v in checks.values() if v)
         total = len(checks)
 
-        logger.info(f"Consistency checks completed: {passed}/{total} checks passed")
+        logger.info("Consistency checks completed: %d/%d checks passed", passed, total)
 
         if passed == total:
             logger.info("All consistency checks passed! ✓")
         else:
             failed_checks = [k for k, v in checks.items() if not v]
-            logger.warning(f"Failed checks: {failed_checks}")
+            logger.warning("Failed checks: %s", failed_checks)
 
         return checks
 
+    def _fetch_all_counts(self) -> Dict[str, int]:
+        """Count every TPC-C table, in a single round-trip when supported."""
+        counts = self.db.count_rows(TPCC_TABLES)
+        self._last_counts.clear()
+        self._last_counts.update(counts)
+        return counts
+
     def _check_table_counts(self) -> Dict[str, bool]:
         """Check table row counts against expected values."""
         checks = {}
@@ -95,130 +257,233 @@ class ConsistencyCheckExecutor:
             ),  # One history record per customer
         ]
 
+        counts = self._fetch_all_counts()
         for table_name, expected in table_checks:
             check_name = f"{table_name}_count"
-            try:
-                result = self.db.execute_query(
-                    f"SELECT COUNT(*) as count_{table_name} FROM {table_name}"
-                )
-                actual = int(result[0][0])
-                checks[check_name] = actual == expected
+            if table_name not in counts:
+                checks[check_name] = False
+                logger.error("%s count check failed", table_name.capitalize())
+                continue
+            actual = counts[table_name]
+            checks[check_name] = actual == expected
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"{table_name.capitalize()} count: {actual}/{expected} {'✓' if checks[check_name] else '✗'}"
+                    "%s count: %d/%d %s",
+                    table_name.capitalize(),
+                    actual,
+                    expected,
+                    "✓" if checks[check_name] else "✗",
                 )
-            except Exception as e:
-                checks[check_name] = False
-                logger.error(f"{table_name.capitalize()} count check failed: {e}")
 
         return checks
 
-    def _check_district_order_consistency(self) -> Dict[str, bool]:
+    def _districts_consistent(self, name: str, query: str) -> Optional[bool]:
+        """Evaluate a consistency rule in SQL with one of the *_MATCHES_SQL queries.
+
+        Returns:
+            Whether every district matches, or None if the server could not
+            run the query and the caller should compare per-district rows
+        """
+        try:
+            value = self.db.execute_scalar(query)
+        except Exception as e:
+            logger.debug("%s check falling back to per-district rows: %s", name, e)
+            return None
+        if value is None:
+            return None
+        matched = int(value)
+        if matched != len(self._wd_pairs):
+            logger.warning(
+                "%s: %d of %d districts inconsistent (run with --check-all for details)",
+                name,
+                len(self._wd_pairs) - matched,
+                len(self._wd_pairs),
+            )
+        return matched == len(self._wd_pairs)
+
+    def _district_columns(
+        self, query: str, width: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Like _fetch_district_columns(), but run each query once per check run.
+
+        Within run_consistency_checks() the first check to ask for a query
+        runs it and concurrent or later checks wait for and reuse its result.
+        """
+        shared = self._shared_columns
+        if shared is None:
+            return self._fetch_district_columns(query, width)
+        with self._shared_lock:
+            future = shared.get((query, width))
+            owner = future is None
+            if owner:
+                future = shared[(query, width)] = Future()
+        if owner:
+            try:
+                future.set_result(self._fetch_district_columns(query, width))
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    def _fetch_district_columns(
+        self, query: str, width: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Run a query whose rows start with (w_id, d_id) and align them to _wd_pairs.
+
+        Args:
+            query: Query returning w_id, d_id and then width integer columns
+            width: Number of columns after (w_id, d_id)
+
+        Returns:
+            (values, found): an int64 array with one row per district holding
+            the remaining columns, and a mask of the districts the query
+            returned a row for
+        """
+        rows = np.array(self.db.execute_query(query), dtype=np.int64)
+        rows = rows.reshape(-1, width + 2)
+        values = np.zeros((len(self._wd_pairs), width), dtype=np.int64)
+        found = np.zeros(len(self._wd_pairs), dtype=bool)
+        w_ids, d_ids = rows[:, 0], rows[:, 1]
+        in_range = (
+            (w_ids >= 1)
+            & (w_ids <= self.scale_factor)
+            & (d_ids >= 1)
+            & (d_ids <= self.DISTRICTS_PER_WAREHOUSE)
+        )
+        index = (
+            (w_ids[in_range] - 1) * self.DISTRICTS_PER_WAREHOUSE + d_ids[in_range] - 1
+        )
+        values[index] = rows[in_range, 2:]
+        found[index] = True
+        return values, found
+
+    @staticmethod
+    def _failed_districts(ok: np.ndarray, fail_fast: bool) -> np.ndarray:
+        """Indices into _wd_pairs of the districts to report as inconsistent."""
+        failed = np.flatnonzero(~ok)
+        return failed[:1] if fail_fast else failed
+
+    def _check_district_invariants(self, fail_fast: bool = True) -> Dict[str, bool]:
+        """Check the district order, new_orders and order_line invariants together.
+
+        One joined query returns every aggregate per district. If the server
+        cannot run it, the three checks run separately instead, now and on
+        later runs.
+        """
+        try:
+            aggregates, has_district = self._fetch_district_columns(
+                _DISTRICT_AGGREGATES_SQL, 7
+            )
+        except Exception as e:
+            logger.debug("Joined district query failed: %s", e)
+            has_district = None
+        if has_district is None or not has_district.any():
+            logger.info("Joined district query not supported; checking separately")
+            self._capabilities["joined_district_checks"] = False
+            checks = {}
+            checks.update(self._check_district_order_consistency(fail_fast))
+            checks.update(self._check_new_orders_consistency(fail_fast))
+            checks.update(self._check_order_line_consistency(fail_fast))
+            return checks
+
+        (
+            next_o_ids,
+            max_o_ids,
+            sum_ol_cnts,
+            count_no_o_ids,
+            max_no_o_ids,
+            min_no_o_ids,
+            ol_counts,
+        ) = aggregates.T
+        has_orders = has_district & (max_o_ids > 0)
+        has_new_orders = has_district & (count_no_o_ids > 0)
+        has_order_lines = has_district & (ol_counts > 0)
+        return {
+            "district_order_consistency": self._district_order_ok(
+                next_o_ids,
+                has_district,
+                max_o_ids,
+                has_orders,
+                max_no_o_ids,
+                has_new_orders,
+                fail_fast,
+            ),
+            "new_orders_consistency": self._new_orders_ok(
+                count_no_o_ids, max_no_o_ids, min_no_o_ids, has_new_orders, fail_fast
+            ),
+            "order_line_consistency": self._order_line_ok(
+                sum_ol_cnts, has_orders, ol_counts, has_order_lines, fail_fast
+            ),
+        }
+
+    def _check_district_order_consistency(
+        self, fail_fast: bool = True
+    ) -> Dict[str, bool]:
         """Check district next order ID consistency."""
         checks = {"district_order_consistency": True}
 
         try:
-            warehouse_count = self.scale_factor
-
-            for w_id in range(1, warehouse_count + 1):
-                for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                    # Get district next_o_id for this specific warehouse and district
-                    district_result = self.db.execute_query(
-                        "SELECT d_next_o_id FROM district WHERE d_w_id = ? AND d_id = ?",
-                        (w_id, d_id),
-                    )
-
-                    if not district_result:
-                        logger.warning(f"District {w_id}-{d_id} not found")
-                        checks["district_order_consistency"] = False
-                        continue
-
-                    d_next_o_id = int(district_result[0][0])
-
-                    # Get max order ID for this warehouse and district
-                    max_order_result = self.db.execute_query(
-                        """
-                        SELECT MAX(o_id) as max_o_id
-                        FROM orders
-                        WHERE o_w_id = ?
-                          AND o_d_id = ?
-                        """,
-                        (w_id, d_id),
-                    )
-
-                    if not max_order_result:
-                        logger.warning(f"Orders {w_id}-{d_id} not found")
-                        checks["district_order_consistency"] = False
-                        continue
-
-                    max_o_id = int(max_order_result[0][0])
-
-                    # Get max new order ID for this warehouse and district
-                    max_new_order_result = self.db.execute_query(
-                        """
-                        SELECT MAX(no_o_id) as max_no_o_id
-                        FROM new_orders
-                        WHERE no_w_id = ?
-                          AND no_d_id = ?
-                        """,
-                        (w_id, d_id),
-                    )
-
-                    if not max_new_order_result:
-                        logger.warning(f"New orders {w_id}-{d_id} not found")
-                        checks["district_order_consistency"] = False
-                        continue
-
-                    max_no_o_id = int(max_new_order_result[0][0])
-
-                    # Check consistency: d_next_o_id - 1 should equal max_o_id and max_no_o_id
-                    expected = max_o_id + 1
-                    consistent = (
-                        d_next_o_id - 1 == max_o_id and d_next_o_id - 1 == max_no_o_id
-                    )
-
-                    if not consistent:
-                        logger.warning(
-                            f"District {w_id}-{d_id}: d_next_o_id={d_next_o_id}, "
-                            f"max_o_id={max_o_id}, max_no_o_id={max_no_o_id}, "
-                            f"expected_next_o_id={expected}"
-                        )
-                        checks["district_order_consistency"] = False
+            if fail_fast:
+                consistent = self._districts_consistent(
+                    "District order consistency", _DISTRICT_ORDER_MATCHES_SQL
+                )
+                if consistent is not None:
+                    checks["district_order_consistency"] = consistent
+                    return checks
+
+            # One scan per table instead of three queries per district
+            next_o_ids, has_district = self._district_columns(
+                "SELECT d_w_id, d_id, d_next_o_id FROM district"
+            )
+            max_o_ids, has_orders = self._district_columns(
+                "SELECT o_w_id, o_d_id, MAX(o_id) FROM orders GROUP BY o_w_id, o_d_id"
+            )
+            # Same query as the new_orders check, which needs COUNT and MIN too
+            no_aggregates, has_new_orders = self._district_columns(
+                _NEW_ORDERS_AGGREGATES_SQL, 3
+            )
+            max_no_o_ids = no_aggregates[:, 1:2]
+
+            checks["district_order_consistency"] = self._district_order_ok(
+                next_o_ids[:, 0],
+                has_district,
+                max_o_ids[:, 0],
+                has_orders,
+                max_no_o_ids[:, 0],
+                has_new_orders,
+                fail_fast,
+            )
 
         except Exception as e:
             checks["district_order_consistency"] = False
-            logger.error(f"District consistency check failed: {e}")
+            logger.error("District consistency check failed: %s", e)
 
         return checks
 
-    def get_database_stats(self) -> Dict[str, Any]:
+    def get_database_stats(self, reuse_counts: bool = False) -> Dict[str, Any]:
         """Get comprehensive database statistics.
 
+        RMDB keeps no catalog row estimates, so statistics are exact counts,
+        i.e. a scan of every table. Callers that know nothing was written
+        since the last count can reuse it instead of scanning again.
+
+        Args:
+            reuse_counts: Return the counts taken by the last table count check
+                (or statistics call) if there are any
+
         Returns:
             Dictionary mapping table names to their row counts
         """
         logger.info("Collecting database statistics...")
 
+        if reuse_counts and self._last_counts:
+            counts = dict(self._last_counts)
+        else:
+            with self.db.quiet_output():
+                counts = self._fetch_all_counts()
         stats = {}
-        tables = [
-            "warehouse",
-            "district",
-            "customer",
-            "item",
-            "stock",
-            "orders",
-            "order_line",
-            "new_orders",
-            "history",
-        ]
-
-        for table in tables:
-            try:
-                result = self.db.execute_query(f"SELECT COUNT(*) FROM {table}")
-                stats[table] = result[0][0]
-                logger.debug(f"Table {table}: {stats[table]} rows")
-            except Exception as e:
-                logger.error(f"Failed to count {table}: {e}")
-                stats[table] = 0
+        for table in TPCC_TABLES:
+            stats[table] = counts.get(table, 0)
+            logger.debug("Table %s: %d rows", table, stats[table])
 
         logger.info("Database statistics collected")
         return stats
@@ -231,61 +496,96 @@ class ConsistencyCheckExecutor:
         """
         logger.info("Performing data integrity validation...")
 
-        validations = {}
-
-        # Check foreign key relationships
-        validations.update(self._validate_foreign_keys())
-
-        # Check data consistency rules
-        validations.update(self._validate_business_rules())
+        # Check foreign key relationships and data consistency rules
+        with self.db.quiet_output():
+            validations = self._run_checks(
+                [self._validate_foreign_keys, self._validate_business_rules]
+            )
 
         logger.info("Data integrity validation completed")
         return validations
 
+    def _exists_by_warehouse_range(self, query: str, w_column: str) -> bool:
+        """Check whether a query returns any row, batched by warehouse range.
+
+        Each batch covers FK_BATCH_WAREHOUSES warehouses and stops at its first
+        row (LIMIT 1); later batches are skipped once one finds a row. A last
+        batch covers w_ids outside 1..scale_factor, so rows referencing
+        nonexistent warehouses are still found.
+
+        Args:
+            query: SELECT 1 query ending in a WHERE clause
+            w_column: Warehouse id column to range over
+
+        Returns:
+            Whether any batch returned a row
+        """
+        step = self.FK_BATCH_WAREHOUSES
+        for lo in range(1, self.scale_factor + 1, step):
+            hi = min(lo + step - 1, self.scale_factor)
+            if self.db.execute_query(
+                f"{query} AND {w_column} BETWEEN ? AND ? LIMIT 1", (lo, hi)
+            ):
+                return True
+        return bool(
+            self.db.execute_query(
+                f"{query} AND ({w_column} < 1 OR {w_column} > ?) LIMIT 1",
+                (self.scale_factor,),
+            )
+        )
+
     def _validate_foreign_keys(self) -> Dict[str, bool]:
         """Validate foreign key relationships."""
         checks = {}
 
         try:
             # Check warehouse references in district
-            result = self.db.execute_query("""
-                SELECT COUNT(*) FROM district d
+            orphans = self._exists_by_warehouse_range(
+                """
+                SELECT 1 FROM district d
                 WHERE NOT EXISTS (
                     SELECT 1 FROM warehouse w WHERE w.w_id = d.d_w_id
-                )
-            """)
-            checks["district_warehouse_fk"] = result[0][0] == 0
+                )""",
+                "d.d_w_id",
+            )
+            checks["district_warehouse_fk"] = not orphans
 
             # Check district references in customer
-            result = self.db.execute_query("""
-                SELECT COUNT(*) FROM customer c
+            orphans = self._exists_by_warehouse_range(
+                """
+                SELECT 1 FROM customer c
                 WHERE NOT EXISTS (
-                    SELECT 1 FROM district d 
+                    SELECT 1 FROM district d
                     WHERE d.d_w_id = c.c_w_id AND d.d_id = c.c_d_id
-                )
-            """)
-            checks["customer_district_fk"] = result[0][0] == 0
+                )""",
+                "c.c_w_id",
+            )
+            checks["customer_district_fk"] = not orphans
 
             # Check warehouse references in stock
-            result = self.db.execute_query("""
-                SELECT COUNT(*) FROM stock s
+            orphans = self._exists_by_warehouse_range(
+                """
+                SELECT 1 FROM stock s
                 WHERE NOT EXISTS (
                     SELECT 1 FROM warehouse w WHERE w.w_id = s.s_w_id
-                )
-            """)
-            checks["stock_warehouse_fk"] = result[0][0] == 0
+                )""",
+                "s.s_w_id",
+            )
+            checks["stock_warehouse_fk"] = not orphans
 
             # Check item references in stock
-            result = self.db.execute_query("""
-                SELECT COUNT(*) FROM stock s
+            orphans = self._exists_by_warehouse_range(
+                """
+                SELECT 1 FROM stock s
                 WHERE NOT EXISTS (
                     SELECT 1 FROM item i WHERE i.i_id = s.s_i_id
-                )
-            """)
-            checks["stock_item_fk"] = result[0][0] == 0
+                )""",
+                "s.s_w_id",
+            )
+            checks["stock_item_fk"] = not orphans
 
         except Exception as e:
-            logger.error(f"Foreign key validation failed: {e}")
+            logger.error("Foreign key validation failed: %s", e)
             checks["foreign_key_validation"] = False
 
         return checks
@@ -297,166 +597,188 @@ class ConsistencyCheckExecutor:
         try:
             # Check that all warehouses have exactly 10 districts
             result = self.db.execute_query("""
-                SELECT w_id, COUNT(*) as district_count
+                SELECT 1
                 FROM district
-                GROUP BY w_id
-                HAVING district_count != 10
+                GROUP BY d_w_id
+                HAVING COUNT(*) != 10
+                LIMIT 1
             """)
             checks["warehouse_district_count"] = len(result) == 0
 
             # Check that all districts have customers
             result = self.db.execute_query("""
-                SELECT d_w_id, d_id
+                SELECT 1
                 FROM district d
                 WHERE NOT EXISTS (
                     SELECT 1 FROM customer c 
                     WHERE c.c_w_id = d.d_w_id AND c.c_d_id = d.d_id
                 )
+                LIMIT 1
             """)
             checks["district_has_customers"] = len(result) == 0
 
         except Exception as e:
-            logger.error(f"Business rule validation failed: {e}")
+            logger.error("Business rule validation failed: %s", e)
             checks["business_rule_validation"] = False
 
         return checks
 
-    def _check_new_orders_consistency(self) -> Dict[str, bool]:
+    def _check_new_orders_consistency(self, fail_fast: bool = True) -> Dict[str, bool]:
         """Check consistency for new_orders table."""
         checks = {"new_orders_consistency": True}
 
         try:
-            warehouse_count = self.scale_factor
-
-            for w_id in range(1, warehouse_count + 1):
-                for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                    # Get new_orders count for this specific warehouse and district
-                    count_new_orders_result = self.db.execute_query(
-                        "SELECT COUNT(no_o_id) as count_no_o_id FROM new_orders WHERE no_w_id = ? AND no_d_id = ?",
-                        (w_id, d_id),
-                    )
-
-                    if not count_new_orders_result:
-                        logger.warning(
-                            f"New orders count_no_o_id with {w_id}-{d_id} not found"
-                        )
-                        checks["new_orders_consistency"] = False
-                        continue
-
-                    count_no_o_id = int(count_new_orders_result[0][0])
-
-                    # Get max order ID for this warehouse and district
-                    max_new_orders_result = self.db.execute_query(
-                        """
-                        SELECT MAX(no_o_id) as max_no_o_id
-                        FROM new_orders
-                        WHERE no_w_id = ?
-                          AND no_d_id = ?
-                        """,
-                        (w_id, d_id),
-                    )
-
-                    if not max_new_orders_result:
-                        logger.warning(
-                            f"New orders max_no_o_id with {w_id}-{d_id} not found"
-                        )
-                        checks["new_orders_consistency"] = False
-                        continue
-
-                    max_no_o_id = int(max_new_orders_result[0][0])
-
-                    # Get min new order ID for this warehouse and district
-                    min_new_orders_result = self.db.execute_query(
-                        """
-                        SELECT MIN(no_o_id) as min_no_o_id
-                        FROM new_orders
-                        WHERE no_w_id = ?
-                          AND no_d_id = ?
-                        """,
-                        (w_id, d_id),
-                    )
-
-                    if not min_new_orders_result:
-                        logger.warning(
-                            f"New orders min_no_o_id with {w_id}-{d_id} not found"
-                        )
-                        checks["new_orders_consistency"] = False
-                        continue
-
-                    min_no_o_id = int(min_new_orders_result[0][0])
-
-                    # Check consistency: new_orders - min_no_o_id + 1 should equal count_no_o_id
-                    expected = max_no_o_id - min_no_o_id + 1
-                    consistent = count_no_o_id == expected
-
-                    if not consistent:
-                        logger.warning(
-                            f"New orders {w_id}-{d_id}: count_no_o_id={count_no_o_id}, "
-                            f"max_no_o_id={max_no_o_id}, min_no_o_id={min_no_o_id}, "
-                            f"expected_count_no_o_id={expected}"
-                        )
-                        checks["new_orders_consistency"] = False
+            if fail_fast:
+                consistent = self._districts_consistent(
+                    "New orders consistency", _NEW_ORDERS_MATCHES_SQL
+                )
+                if consistent is not None:
+                    checks["new_orders_consistency"] = consistent
+                    return checks
+
+            # COUNT, MAX and MIN from a single scan of new_orders
+            aggregates, found = self._district_columns(_NEW_ORDERS_AGGREGATES_SQL, 3)
+            checks["new_orders_consistency"] = self._new_orders_ok(
+                *aggregates.T, found, fail_fast
+            )
 
         except Exception as e:
             checks["new_orders_consistency"] = False
-            logger.error(f"New orders consistency check failed: {e}")
+            logger.error("New orders consistency check failed: %s", e)
 
         return checks
 
-    def _check_order_line_consistency(self) -> Dict[str, bool]:
+    def _check_order_line_consistency(self, fail_fast: bool = True) -> Dict[str, bool]:
         """Check orders order line data consistency."""
         checks = {"order_line_consistency": True}
 
         try:
-            warehouse_count = self.scale_factor
-
-            for w_id in range(1, warehouse_count + 1):
-                for d_id in range(1, self.DISTRICTS_PER_WAREHOUSE + 1):
-                    # Get sum(o_ol_cnt) from orders for this specific warehouse and district
-                    sum_orders_result = self.db.execute_query(
-                        "SELECT SUM(o_ol_cnt) as sum_o_ol_cnt FROM orders WHERE o_w_id = ? AND o_d_id = ?",
-                        (w_id, d_id),
-                    )
-
-                    if not sum_orders_result:
-                        logger.warning(f"Orders {w_id}-{d_id} not found")
-                        checks["order_line_consistency"] = False
-                        continue
-
-                    sum_o_ol_cnt = int(sum_orders_result[0][0])
-
-                    # Get count from order_line for this warehouse and district
-                    count_order_line_result = self.db.execute_query(
-                        """
-                        SELECT COUNT(ol_o_id) as count_ol_o_id
-                        FROM order_line
-                        WHERE ol_w_id = ?
-                          AND ol_d_id = ?
-                        """,
-                        (w_id, d_id),
-                    )
-
-                    if not count_order_line_result:
-                        logger.warning(f"Order line {w_id}-{d_id} not found")
-                        checks["order_line_consistency"] = False
-                        continue
-
-                    count_ol_o_id = int(count_order_line_result[0][0])
-
-                    # Check consistency: sum_o_ol_cnt should equal count_ol_o_id
-                    expected = count_ol_o_id
-                    consistent = sum_o_ol_cnt == count_ol_o_id
-
-                    if not consistent:
-                        logger.warning(
-                            f"Order line {w_id}-{d_id}: sum_o_ol_cnt={sum_o_ol_cnt}, "
-                            f"count_ol_o_id={count_ol_o_id}, "
-                            f"expected_sum_o_ol_cnt={expected}"
-                        )
-                        checks["order_line_consistency"] = False
+            if fail_fast:
+                consistent = self._districts_consistent(
+                    "Order line consistency", _ORDER_LINE_MATCHES_SQL
+                )
+                if consistent is not None:
+                    checks["order_line_consistency"] = consistent
+                    return checks
+
+            sum_ol_cnts, has_orders = self._district_columns(
+                "SELECT o_w_id, o_d_id, SUM(o_ol_cnt) FROM orders "
+                "GROUP BY o_w_id, o_d_id"
+            )
+            ol_counts, has_order_lines = self._district_columns(
+                "SELECT ol_w_id, ol_d_id, COUNT(ol_o_id) FROM order_line "
+                "GROUP BY ol_w_id, ol_d_id"
+            )
+
+            checks["order_line_consistency"] = self._order_line_ok(
+                sum_ol_cnts[:, 0],
+                has_orders,
+                ol_counts[:, 0],
+                has_order_lines,
+                fail_fast,
+            )
 
         except Exception as e:
             checks["order_line_consistency"] = False
-            logger.error(f"Order line consistency check failed: {e}")
+            logger.error("Order line consistency check failed: %s", e)
 
         return checks
+
+    def _district_order_ok(
+        self,
+        next_o_ids: np.ndarray,
+        has_district: np.ndarray,
+        max_o_ids: np.ndarray,
+        has_orders: np.ndarray,
+        max_no_o_ids: np.ndarray,
+        has_new_orders: np.ndarray,
+        fail_fast: bool,
+    ) -> bool:
+        """Check d_next_o_id - 1 == max_o_id == max_no_o_id for every district.
+
+        All arrays are aligned to _wd_pairs; inconsistent districts are logged.
+        """
+        last_o_ids = next_o_ids - 1
+        ok = (
+            has_district
+            & has_orders
+            & has_new_orders
+            & (last_o_ids == max_o_ids)
+            & (last_o_ids == max_no_o_ids)
+        )
+        for i in self._failed_districts(ok, fail_fast):
+            w_id, d_id = self._wd_pairs[i]
+            if not has_district[i]:
+                logger.warning("District %d-%d not found", w_id, d_id)
+            elif not has_orders[i]:
+                logger.warning("Orders %d-%d not found", w_id, d_id)
+            elif not has_new_orders[i]:
+                logger.warning("New orders %d-%d not found", w_id, d_id)
+            else:
+                logger.warning(
+                    "District %d-%d: d_next_o_id=%d, max_o_id=%d, max_no_o_id=%d, "
+                    "expected_next_o_id=%d",
+                    w_id,
+                    d_id,
+                    next_o_ids[i],
+                    max_o_ids[i],
+                    max_no_o_ids[i],
+                    max_o_ids[i] + 1,
+                )
+        return bool(ok.all())
+
+    def _new_orders_ok(
+        self,
+        count_no_o_ids: np.ndarray,
+        max_no_o_ids: np.ndarray,
+        min_no_o_ids: np.ndarray,
+        found: np.ndarray,
+        fail_fast: bool,
+    ) -> bool:
+        """Check max_no_o_id - min_no_o_id + 1 == count_no_o_id for every district."""
+        expected = max_no_o_ids - min_no_o_ids + 1
+        ok = found & (count_no_o_ids == expected)
+        for i in self._failed_districts(ok, fail_fast):
+            w_id, d_id = self._wd_pairs[i]
+            if not found[i]:
+                logger.warning("New orders with %d-%d not found", w_id, d_id)
+            else:
+                logger.warning(
+                    "New orders %d-%d: count_no_o_id=%d, max_no_o_id=%d, "
+                    "min_no_o_id=%d, expected_count_no_o_id=%d",
+                    w_id,
+                    d_id,
+                    count_no_o_ids[i],
+                    max_no_o_ids[i],
+                    min_no_o_ids[i],
+                    expected[i],
+                )
+        return bool(ok.all())
+
+    def _order_line_ok(
+        self,
+        sum_ol_cnts: np.ndarray,
+        has_orders: np.ndarray,
+        ol_counts: np.ndarray,
+        has_order_lines: np.ndarray,
+        fail_fast: bool,
+    ) -> bool:
+        """Check SUM(o_ol_cnt) == COUNT(order_line rows) for every district."""
+        ok = has_orders & has_order_lines & (sum_ol_cnts == ol_counts)
+        for i in self._failed_districts(ok, fail_fast):
+            w_id, d_id = self._wd_pairs[i]
+            if not has_orders[i]:
+                logger.warning("Orders %d-%d not found", w_id, d_id)
+            elif not has_order_lines[i]:
+                logger.warning("Order line %d-%d not found", w_id, d_id)
+            else:
+                logger.warning(
+                    "Order line %d-%d: sum_o_ol_cnt=%d, count_ol_o_id=%d, "
+                    "expected_sum_o_ol_cnt=%d",
+                    w_id,
+                    d_id,
+                    sum_ol_cnts[i],
+                    ol_counts[i],
+                    ol_counts[i],
+                )
+        return bool(ok.all())
@@ -4,9 +4,19 @@ Encapsulates all data loading operations with clean separation of concerns.
 """
 
 import logging
-from typing import Iterator
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
 
+import numpy as np
+
+from ..database.connection_pool import ConnectionPool
 from ..database.database_connection import DatabaseConnection
+from ..database.rmdb_cursor import format_param
+from ..data_generator.tpcc_generator import TpccDataGenerator
 from ..models import (
     Warehouse,
     District,
@@ -21,240 +31,313 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Target table and column order (as in create_tables.sql) for each key of
+# TpccDataGenerator.generate_all_columns(), in load order.
+TABLE_COLUMNS = {
+    "warehouses": (
+        "warehouse",
+        (
+            "w_id",
+            "w_name",
+            "w_street_1",
+            "w_street_2",
+            "w_city",
+            "w_state",
+            "w_zip",
+            "w_tax",
+            "w_ytd",
+        ),
+    ),
+    "districts": (
+        "district",
+        (
+            "d_id",
+            "d_w_id",
+            "d_name",
+            "d_street_1",
+            "d_street_2",
+            "d_city",
+            "d_state",
+            "d_zip",
+            "d_tax",
+            "d_ytd",
+            "d_next_o_id",
+        ),
+    ),
+    "items": ("item", ("i_id", "i_im_id", "i_name", "i_price", "i_data")),
+    "customers": (
+        "customer",
+        (
+            "c_id",
+            "c_d_id",
+            "c_w_id",
+            "c_first",
+            "c_middle",
+            "c_last",
+            "c_street_1",
+            "c_street_2",
+            "c_city",
+            "c_state",
+            "c_zip",
+            "c_phone",
+            "c_since",
+            "c_credit",
+            "c_credit_lim",
+            "c_discount",
+            "c_balance",
+            "c_ytd_payment",
+            "c_payment_cnt",
+            "c_delivery_cnt",
+            "c_data",
+        ),
+    ),
+    "stock": (
+        "stock",
+        (
+            "s_i_id",
+            "s_w_id",
+            "s_quantity",
+            "s_dist_01",
+            "s_dist_02",
+            "s_dist_03",
+            "s_dist_04",
+            "s_dist_05",
+            "s_dist_06",
+            "s_dist_07",
+            "s_dist_08",
+            "s_dist_09",
+            "s_dist_10",
+            "s_ytd",
+            "s_order_cnt",
+            "s_remote_cnt",
+            "s_data",
+        ),
+    ),
+    "orders": (
+        "orders",
+        (
+            "o_id",
+            "o_d_id",
+            "o_w_id",
+            "o_c_id",
+            "o_entry_d",
+            "o_carrier_id",
+            "o_ol_cnt",
+            "o_all_local",
+        ),
+    ),
+    "new_orders": ("new_orders", ("no_o_id", "no_d_id", "no_w_id")),
+    "history": (
+        "history",
+        (
+            "h_c_id",
+            "h_c_d_id",
+            "h_c_w_id",
+            "h_d_id",
+            "h_w_id",
+            "h_date",
+            "h_amount",
+            "h_data",
+        ),
+    ),
+    "order_lines": (
+        "order_line",
+        (
+            "ol_o_id",
+            "ol_d_id",
+            "ol_w_id",
+            "ol_number",
+            "ol_i_id",
+            "ol_supply_w_id",
+            "ol_delivery_d",
+            "ol_quantity",
+            "ol_amount",
+            "ol_dist_info",
+        ),
+    ),
+}
+
+# Per table key: the INSERT statement and a getter turning a model object
+# into its row tuple (model attributes are named after the columns).
+INSERT_SQL = {
+    key: f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+    for key, (table, columns) in TABLE_COLUMNS.items()
+}
+_ROW_GETTERS = {
+    key: attrgetter(*columns) for key, (_, columns) in TABLE_COLUMNS.items()
+}
+
+
+def _column_literals(values: np.ndarray) -> List[str]:
+    """Render a column array as SQL literals, formatting whole arrays at once.
+
+    Produces the same text as format_param() applied to each element.
+    """
+    kind = values.dtype.kind
+    if kind in "iu":
+        return values.astype(np.str_).tolist()
+    if kind == "f":
+        return list(map(float.__repr__, values.tolist()))
+    if kind == "U" and not (np.strings.find(values, "'") >= 0).any():
+        return ["'" + value + "'" for value in values.tolist()]
+    return list(map(format_param, values.tolist()))
+
+
+def render_rows(batch: Dict[str, np.ndarray], columns: Sequence[str]) -> List[str]:
+    """Render a column batch as ``(...)`` VALUES rows in column order."""
+    return [
+        "(" + ", ".join(row) + ")"
+        for row in zip(*(_column_literals(batch[column]) for column in columns))
+    ]
+
+
+T = TypeVar("T")
+
+# Batches generated ahead of the loader by prefetch(); bounds peak memory
+PREFETCH_DEPTH = 8
+_DONE = object()
+
+
+def prefetch(items: Iterable[T], depth: int = PREFETCH_DEPTH) -> Iterator[T]:
+    """Iterate ``items`` on a background thread, up to ``depth`` ahead.
+
+    Lets batch generation overlap with the round trips of the loader that
+    consumes them while keeping at most ``depth`` batches in memory.
+    Exceptions raised by ``items`` are re-raised in the consumer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        """Queue item unless the consumer stopped; return whether it was."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(e)
+
+    producer = threading.Thread(target=produce, name="tpcc-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Consumer stopped early: release a producer blocked on a full queue
+        stop.set()
+
 
 class LoadExecutor:
     """Dedicated executor for loading TPC-C benchmark data."""
 
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(
+        self, db_connection: DatabaseConnection, bulk_load_dir: Optional[str] = None
+    ):
         """Initialize Load Executor.
 
         Args:
             db_connection: Database connection instance
+            bulk_load_dir: Directory shared with the server; if set, column
+                batches are loaded from CSV files written there (see
+                DatabaseConnection.bulk_load) instead of INSERT statements
         """
         self.db = db_connection
+        self.bulk_load_dir = bulk_load_dir
+
+    def _load_objects(self, key: str, objects: Iterator) -> int:
+        """Insert model objects into the table for ``key`` in one transaction.
+
+        Column batches (dicts of arrays, as from generate_all_columns()) are
+        accepted as well and loaded by load_columns() without building rows
+        from attributes.
+        """
+        objects = iter(objects)
+        first = next(objects, None)
+        if first is None:
+            return 0
+        objects = chain((first,), objects)
+        if isinstance(first, dict):
+            return self.load_columns(key, objects)
+        with self.db.transaction():
+            return self.db.execute_many(
+                INSERT_SQL[key], map(_ROW_GETTERS[key], objects)
+            )
 
     def load_warehouses(self, warehouses: Iterator[Warehouse]) -> None:
         """Load warehouse data."""
         logger.info("Loading warehouse data...")
-        with self.db.get_cursor() as cursor:
-            for warehouse in warehouses:
-                cursor.execute(
-                    """
-                    INSERT INTO warehouse
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        warehouse.w_id,
-                        warehouse.w_name,
-                        warehouse.w_street_1,
-                        warehouse.w_street_2,
-                        warehouse.w_city,
-                        warehouse.w_state,
-                        warehouse.w_zip,
-                        warehouse.w_tax,
-                        warehouse.w_ytd,
-                    ),
-                )
+        self._load_objects("warehouses", warehouses)
         logger.info("Warehouse data loaded successfully")
 
     def load_districts(self, districts: Iterator[District]) -> None:
         """Load district data."""
         logger.info("Loading district data...")
-        with self.db.get_cursor() as cursor:
-            for district in districts:
-                cursor.execute(
-                    """
-                    INSERT INTO district
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        district.d_id,
-                        district.d_w_id,
-                        district.d_name,
-                        district.d_street_1,
-                        district.d_street_2,
-                        district.d_city,
-                        district.d_state,
-                        district.d_zip,
-                        district.d_tax,
-                        district.d_ytd,
-                        district.d_next_o_id,
-                    ),
-                )
+        self._load_objects("districts", districts)
         logger.info("District data loaded successfully")
 
     def load_items(self, items: Iterator[Item]) -> None:
         """Load item data."""
         logger.info("Loading item data...")
-        with self.db.get_cursor() as cursor:
-            for item in items:
-                cursor.execute(
-                    """
-                    INSERT INTO item
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (item.i_id, item.i_im_id, item.i_name, item.i_price, item.i_data),
-                )
+        self._load_objects("items", items)
         logger.info("Item data loaded successfully")
 
     def load_customers(self, customers: Iterator[Customer]) -> None:
         """Load customer data."""
         logger.info("Loading customer data...")
-        with self.db.get_cursor() as cursor:
-            for customer in customers:
-                cursor.execute(
-                    """
-                    INSERT INTO customer
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        customer.c_id,
-                        customer.c_d_id,
-                        customer.c_w_id,
-                        customer.c_first,
-                        customer.c_middle,
-                        customer.c_last,
-                        customer.c_street_1,
-                        customer.c_street_2,
-                        customer.c_city,
-                        customer.c_state,
-                        customer.c_zip,
-                        customer.c_phone,
-                        customer.c_since,
-                        customer.c_credit,
-                        customer.c_credit_lim,
-                        customer.c_discount,
-                        customer.c_balance,
-                        customer.c_ytd_payment,
-                        customer.c_payment_cnt,
-                        customer.c_delivery_cnt,
-                        customer.c_data,
-                    ),
-                )
+        self._load_objects("customers", customers)
         logger.info("Customer data loaded successfully")
 
     def load_stock(self, stocks: Iterator[Stock]) -> None:
         """Load stock data."""
         logger.info("Loading stock data...")
-        with self.db.get_cursor() as cursor:
-            for stock in stocks:
-                cursor.execute(
-                    """
-                    INSERT INTO stock
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        stock.s_i_id,
-                        stock.s_w_id,
-                        stock.s_quantity,
-                        stock.s_dist_01,
-                        stock.s_dist_02,
-                        stock.s_dist_03,
-                        stock.s_dist_04,
-                        stock.s_dist_05,
-                        stock.s_dist_06,
-                        stock.s_dist_07,
-                        stock.s_dist_08,
-                        stock.s_dist_09,
-                        stock.s_dist_10,
-                        stock.s_ytd,
-                        stock.s_order_cnt,
-                        stock.s_remote_cnt,
-                        stock.s_data,
-                    ),
-                )
+        self._load_objects("stock", stocks)
         logger.info("Stock data loaded successfully")
 
     def load_orders(self, orders: Iterator[Orders]) -> None:
         """Load orders data."""
         logger.info("Loading orders data...")
-        with self.db.get_cursor() as cursor:
-            for order in orders:
-                cursor.execute(
-                    """
-                    INSERT INTO orders
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        order.o_id,
-                        order.o_d_id,
-                        order.o_w_id,
-                        order.o_c_id,
-                        order.o_entry_d,
-                        order.o_carrier_id,
-                        order.o_ol_cnt,
-                        order.o_all_local,
-                    ),
-                )
+        self._load_objects("orders", orders)
         logger.info("Orders data loaded successfully")
 
     def load_new_orders(self, new_orders: Iterator[NewOrder]) -> None:
         """Load new orders data."""
         logger.info("Loading new orders data...")
-        with self.db.get_cursor() as cursor:
-            for new_order in new_orders:
-                cursor.execute(
-                    """
-                    INSERT INTO new_orders
-                    VALUES (?, ?, ?)
-                    """,
-                    (new_order.no_o_id, new_order.no_d_id, new_order.no_w_id),
-                )
+        self._load_objects("new_orders", new_orders)
         logger.info("New orders data loaded successfully")
 
     def load_history(self, history: Iterator[History]) -> None:
         """Load history data."""
         logger.info("Loading history data...")
-        with self.db.get_cursor() as cursor:
-            for h in history:
-                cursor.execute(
-                    """
-                    INSERT INTO history
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        h.h_c_id,
-                        h.h_c_d_id,
-                        h.h_c_w_id,
-                        h.h_d_id,
-                        h.h_w_id,
-                        h.h_date,
-                        h.h_amount,
-                        h.h_data,
-                    ),
-                )
+        self._load_objects("history", history)
         logger.info("History data loaded successfully")
 
     def load_order_lines(self, order_lines: Iterator[OrderLine]) -> None:
         """Load order line data."""
         logger.info("Loading order line data...")
-        with self.db.get_cursor() as cursor:
-            for ol in order_lines:
-                cursor.execute(
-                    """
-                    INSERT INTO order_line
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        ol.ol_o_id,
-                        ol.ol_d_id,
-                        ol.ol_w_id,
-                        ol.ol_number,
-                        ol.ol_i_id,
-                        ol.ol_supply_w_id,
-                        ol.ol_delivery_d,
-                        ol.ol_quantity,
-                        ol.ol_amount,
-                        ol.ol_dist_info,
-                    ),
-                )
+        self._load_objects("order_lines", order_lines)
         logger.info("Order line data loaded successfully")
 
     def load_all_data(self, data_generators: dict) -> None:
-        """Load all TPC-C data in correct order.
+        """Load all TPC-C data in correct order, each table in one transaction.
 
         Args:
-            data_generators: Dictionary containing data generators for each table
+            data_generators: Dictionary containing data generators for each
+                table, yielding model objects or column batches
         """
         logger.info("Starting comprehensive data loading...")
 
@@ -270,3 +353,124 @@ class LoadExecutor:
         self.load_order_lines(data_generators["order_lines"])
 
         logger.info("All TPC-C data loaded successfully")
+
+    def load_columns(
+        self,
+        key: str,
+        batches: Iterator[Dict[str, np.ndarray]],
+        db: Optional[DatabaseConnection] = None,
+    ) -> int:
+        """Load one table from column batches without building model objects.
+
+        The whole table is inserted in one transaction.
+
+        Args:
+            key: Table key as used by TpccDataGenerator.generate_all_columns()
+            batches: Iterator of dicts mapping column names to arrays
+            db: Connection to load through (defaults to this executor's)
+
+        Returns:
+            Number of rows loaded
+        """
+        table, columns = TABLE_COLUMNS[key]
+        logger.info("Loading %s data...", table)
+
+        db = db or self.db
+        if self.bulk_load_dir is None:
+            rows = chain.from_iterable(render_rows(batch, columns) for batch in batches)
+            with db.transaction():
+                count = db.insert_rows(INSERT_SQL[key], rows)
+        else:
+            count = 0
+            for batch in batches:
+                values = [batch[column].tolist() for column in columns]
+                if not db.bulk_load(table, columns, zip(*values), self.bulk_load_dir):
+                    with db.transaction():
+                        db.insert_rows(INSERT_SQL[key], render_rows(batch, columns))
+                count += len(values[0])
+
+        logger.info("%s data loaded successfully (%d rows)", table, count)
+        return count
+
+    def load_all_columns(
+        self, column_batches: Dict[str, Iterator[Dict[str, np.ndarray]]]
+    ) -> None:
+        """Load all TPC-C tables from column batches in correct order.
+
+        Batches are generated on a background thread (see prefetch()), so
+        the next batch, including the first one of the next table, is built
+        while the current one is being sent.
+
+        Args:
+            column_batches: Result of TpccDataGenerator.generate_all_columns()
+        """
+        logger.info("Starting comprehensive data loading...")
+
+        stream = prefetch(
+            (key, batch) for key in TABLE_COLUMNS for batch in column_batches[key]
+        )
+        for key, batches in groupby(stream, key=itemgetter(0)):
+            self.load_columns(key, map(itemgetter(1), batches))
+
+        logger.info("All TPC-C data loaded successfully")
+
+    def load_all_columns_parallel(
+        self, generator: TpccDataGenerator, pool: ConnectionPool
+    ) -> None:
+        """Load all TPC-C tables, splitting warehouses across pooled connections.
+
+        The global tables (warehouse, item) are independent of each other and
+        are loaded first, concurrently on two pooled connections. The
+        warehouse range is then cut into one contiguous slice per pooled
+        connection, and each slice is generated and loaded by its own worker
+        thread.
+
+        Args:
+            generator: Data generator for the target scale factor
+            pool: Connection pool; its size sets the number of workers
+        """
+        logger.info("Starting parallel data loading with %d workers...", pool.size)
+
+        global_batches = generator.generate_all_columns()
+        with ThreadPoolExecutor(max_workers=min(2, pool.size)) as executor:
+            futures = [
+                executor.submit(self._load_pooled, key, global_batches[key], pool)
+                for key in ("warehouses", "items")
+            ]
+            for future in futures:
+                future.result()
+
+        warehouse_ids = list(range(1, generator.scale_factor + 1))
+        per_worker = -(-len(warehouse_ids) // pool.size)
+        slices = [
+            warehouse_ids[i : i + per_worker]
+            for i in range(0, len(warehouse_ids), per_worker)
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+            futures = [
+                executor.submit(self._load_warehouse_slice, generator, pool, ids)
+                for ids in slices
+            ]
+            for future in futures:
+                future.result()
+
+        logger.info("All TPC-C data loaded successfully")
+
+    def _load_pooled(
+        self, key: str, batches: Iterator[Dict[str, np.ndarray]], pool: ConnectionPool
+    ) -> int:
+        """Load one table through a connection borrowed from ``pool``."""
+        with pool.acquire() as db, db.quiet_output():
+            return self.load_columns(key, batches, db=db)
+
+    def _load_warehouse_slice(
+        self, generator: TpccDataGenerator, pool: ConnectionPool, ids: List[int]
+    ) -> None:
+        """Generate and load the warehouse-scoped tables for ``ids``."""
+        logger.info("Loading warehouses %d-%d...", ids[0], ids[-1])
+        batches = generator.generate_warehouse_columns(ids)
+        with pool.acquire() as db, db.quiet_output():
+            for key in TABLE_COLUMNS:
+                if key in batches:
+                    self.load_columns(key, batches[key], db=db)
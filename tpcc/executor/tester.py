@@ -15,7 +15,7 @@ from .datagen import (
     query_cus_by,
 )
 from .mysql.const import SQLState
-from .record import put_new_order, put_txn
+from .record import flush, put_new_order, put_txn
 
 
 def do_test(driver, lock, txns, txn_prob=None):
@@ -119,6 +119,9 @@ def do_test(driver, lock, txns, txn_prob=None):
             else:
                 put_txn(lock, txn, t2 - t1, True)
 
+    # 等待本进程排队的事务记录写入完毕
+    flush()
+
     # for i in range(txns):
     #     txn = get_choice(txn_prob)
     #     ret = SQLState.ABORT
@@ -4,8 +4,10 @@ Refactored to provide clean separation of concerns and better maintainability.
 """
 
 import logging
-from typing import Dict, Any
+import os
+from typing import Any, Dict, Optional
 
+from ..database.connection_pool import ConnectionPool
 from ..database.database_connection import DatabaseConnection
 from ..database.schema_manager import SchemaManager
 from ..data_generator.tpcc_generator import TpccDataGenerator
@@ -20,30 +22,49 @@ logger = logging.getLogger(__name__)
 class TpccExecutor:
     """Main executor for TPC-C benchmark operations."""
 
-    def __init__(self, db_connection: DatabaseConnection, scale_factor: int = 1):
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        scale_factor: int = 1,
+        bulk_load_dir: Optional[str] = None,
+    ):
         """Initialize TPC-C executor.
 
         Args:
             db_connection: Database connection instance
             scale_factor: Number of warehouses to test
+            bulk_load_dir: Directory shared with the server for CSV bulk
+                loading (None loads with INSERT statements)
         """
         self.db = db_connection
         self.scale_factor = scale_factor
         self.schema_manager = SchemaManager(db_connection)
         self.data_generator = TpccDataGenerator(scale_factor)
-        self.load_executor = LoadExecutor(db_connection)
+        self.load_executor = LoadExecutor(db_connection, bulk_load_dir)
         self.consistency_checker = ConsistencyCheckExecutor(db_connection, scale_factor)
         self.transaction_executor = TransactionExecutor(db_connection, scale_factor)
+        # Set by initialize_database() when index creation waits for load_data()
+        self._indexes_pending = False
+
+    def initialize_database(self, defer_indexes: bool = False) -> None:
+        """Initialize database with schema and data.
 
-    def initialize_database(self) -> None:
-        """Initialize database with schema and data."""
+        Args:
+            defer_indexes: Build the indexes at the end of the next
+                load_data() instead of now, so the load does not maintain
+                them row by row. They are then only created if that load
+                completes, and duplicate keys are not rejected during it.
+        """
         logger.info("Initializing TPC-C database...")
 
         # Create schema
         self.schema_manager.create_schema()
 
         # Create indexes
-        self.schema_manager.create_indexes()
+        if defer_indexes:
+            self._indexes_pending = True
+        else:
+            self.schema_manager.create_indexes()
 
         # We not check Validate schema now
         # if not self.schema_manager.validate_schema():
@@ -51,22 +72,52 @@ class TpccExecutor:
 
         logger.info("Database initialized successfully")
 
-    def load_data(self) -> None:
-        """Load TPC-C data into database."""
+    def load_data(self, workers: int = 1) -> None:
+        """Load TPC-C data into database.
+
+        Args:
+            workers: Number of parallel loader connections (1 loads serially,
+                0 uses one per warehouse up to the number of CPUs)
+        """
         logger.info("Loading TPC-C data...")
 
-        data_generators = self.data_generator.generate_all_data()
-        self.load_executor.load_all_data(data_generators)
+        if workers <= 0:
+            workers = min(self.scale_factor, os.cpu_count() or 1)
+
+        # Nothing reads the server's result file during a load
+        with self.db.quiet_output():
+            if workers > 1:
+                with ConnectionPool(
+                    workers,
+                    self.db.host,
+                    self.db.port,
+                    slow_query_ms=self.db.slow_query_ms,
+                ) as pool:
+                    self.load_executor.load_all_columns_parallel(
+                        self.data_generator, pool
+                    )
+            else:
+                column_batches = self.data_generator.generate_all_columns()
+                self.load_executor.load_all_columns(column_batches)
+
+        if self._indexes_pending:
+            logger.info("Building indexes after load...")
+            self.schema_manager.create_indexes()
+            self._indexes_pending = False
 
         logger.info("TPC-C data loaded successfully")
 
-    def run_consistency_checks(self) -> Dict[str, bool]:
+    def run_consistency_checks(
+        self, fail_fast: bool = True, validate_integrity: bool = False
+    ) -> Dict[str, bool]:
         """Run consistency checks on loaded data."""
-        return self.consistency_checker.run_consistency_checks()
+        return self.consistency_checker.run_consistency_checks(
+            fail_fast, validate_integrity
+        )
 
-    def get_database_stats(self) -> Dict[str, Any]:
+    def get_database_stats(self, reuse_counts: bool = False) -> Dict[str, Any]:
         """Get database statistics."""
-        return self.consistency_checker.get_database_stats()
+        return self.consistency_checker.get_database_stats(reuse_counts)
 
     def run_benchmark(
         self,
@@ -74,6 +125,7 @@ class TpccExecutor:
         transactions_per_thread: int = 100,
         read_write_ratio: float = 0.5,
         duration_seconds: int = 0,
+        execution_mode: str = "thread",
         **kwargs,
     ) -> BenchmarkResult:
         """Run TPC-C benchmark with transaction execution.
@@ -82,25 +134,23 @@ class TpccExecutor:
             num_threads: Number of concurrent threads
             transactions_per_thread: Number of transactions per thread
             read_write_ratio: Ratio of read-write vs read-only transactions
-            duration_seconds: Duration of benchmark in seconds
+            duration_seconds: Run each worker for this many seconds instead of
+                transactions_per_thread transactions (0 to count transactions)
+            execution_mode: "thread" or "process" (one process per worker,
+                or per share of them with num_processes)
             **kwargs: Additional arguments for transaction executor
 
         Returns:
             BenchmarkResult with performance metrics
         """
-        logger.info(f"Starting TPC-C benchmark with {num_threads} threads")
-
-        # Calculate transactions based on duration if provided
-        if duration_seconds > 0:
-            # Estimate transactions based on TPS and duration
-            estimated_tps = 50  # Conservative estimate
-            total_transactions = estimated_tps * duration_seconds
-            transactions_per_thread = max(1, total_transactions // num_threads)
+        logger.info("Starting TPC-C benchmark with %d threads", num_threads)
 
         return self.transaction_executor.run_concurrent_benchmark(
             num_threads=num_threads,
             transactions_per_thread=transactions_per_thread,
             read_write_ratio=read_write_ratio,
+            execution_mode=execution_mode,
+            duration_seconds=duration_seconds,
             **kwargs,
         )
 
@@ -123,7 +173,7 @@ class TpccExecutor:
         results = {}
 
         for threads in thread_counts:
-            logger.info(f"Running test with {threads} threads")
+            logger.info("Running test with %d threads", threads)
             result = self.run_benchmark(
                 num_threads=threads, duration_seconds=duration_seconds, **kwargs
             )
@@ -4,33 +4,247 @@ Provides multi-threaded read-write transaction execution capabilities.
 """
 
 import logging
+import multiprocessing
+import multiprocessing.synchronize
+import os
+import signal
 import threading
 import time
 import random
+import weakref
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from operator import itemgetter
 
+import numpy as np
+
+from tpcc.database.connection_pool import ConnectionPool
 from tpcc.database.database_connection import DatabaseConnection
+from tpcc.database.rmdb_cursor import QueryAborted
 from tpcc.data_generator.tpcc_generator import TpccDataGenerator
 
 logger = logging.getLogger(__name__)
 
+EXECUTION_MODES = ("thread", "process")
+
+
+# (epoch second, its DATETIME literal) last formatted by _now()
+_now_cache: Tuple[int, str] = (0, "")
+
 
-@dataclass
+def _now() -> str:
+    """Current local time as a DATETIME literal (YYYY-MM-DD HH:MM:SS).
+
+    The literal is formatted once per second and shared by all threads.
+    """
+    global _now_cache
+    second = int(time.time())
+    if _now_cache[0] != second:
+        # Replaced as one tuple, so readers never see a mismatched pair
+        _now_cache = (
+            second,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+        )
+    return _now_cache[1]
+
+
+# Transaction types drawn per call when a worker runs for a duration
+MIX_CHUNK = 1024
+# Upper bound of the default thread-mode pool size; past a few dozen
+# connections the server spends more on contention than it gains
+MAX_DEFAULT_POOL_SIZE = 64
+
+
+def transaction_mix(
+    read_write_ratio: float, transaction_probabilities: List[float]
+) -> np.ndarray:
+    """Combine the read-write ratio and per-type weights into one distribution.
+
+    The read-write types (NewOrder, Payment, Delivery) share read_write_ratio
+    of the mass and the read-only types (OrderStatus, StockLevel) the rest,
+    each group split by its weights. A group whose weights are all zero is
+    never drawn.
+
+    Returns:
+        Probability of each of the five transaction types
+    """
+    weights = np.asarray(transaction_probabilities, dtype=np.float64)
+    mix = np.zeros(5)
+    groups = ((slice(0, 3), read_write_ratio), (slice(3, 5), 1 - read_write_ratio))
+    for group, share in groups:
+        total = weights[group].sum()
+        if total > 0:
+            mix[group] = weights[group] / total * share
+    if mix.sum() <= 0:
+        raise ValueError("Transaction mix has no transaction type with weight")
+    return mix / mix.sum()
+
+
+# Stop event shared with the parent, in a benchmark worker process
+_worker_stop: Optional[multiprocessing.synchronize.Event] = None
+
+
+def _init_worker_process(stop_event: multiprocessing.synchronize.Event) -> None:
+    """Set up a benchmark worker process to be stopped by the parent.
+
+    Ctrl+C reaches every process of the terminal's process group; workers
+    ignore it and finish their current transaction once the parent sets
+    stop_event, so an interrupted run still reports their results.
+    """
+    global _worker_stop
+    _worker_stop = stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+# Executors with a benchmark running, asked to stop by Ctrl+C; the handler
+# is installed only once
+_stoppable_executors: "weakref.WeakSet[TransactionExecutor]" = weakref.WeakSet()
+_sigint_handler_installed = False
+
+
+def _handle_sigint(signum, frame) -> None:
+    """Ask running benchmarks to stop; a second Ctrl+C interrupts outright.
+
+    Without a running benchmark, Ctrl+C raises KeyboardInterrupt like the
+    default handler.
+    """
+    executors = list(_stoppable_executors)
+    if not executors or all(executor._stop.is_set() for executor in executors):
+        raise KeyboardInterrupt
+    logger.info("Received interrupt signal, stopping benchmark workers...")
+    for executor in executors:
+        executor._request_stop()
+
+
+def _register_for_sigint(executor: "TransactionExecutor") -> None:
+    """Have Ctrl+C set executor._stop, installing the handler on first use.
+
+    Called when a benchmark starts; the executor is removed from
+    _stoppable_executors when it ends. signal.signal() may only be called
+    from the main thread; benchmarks started elsewhere are registered but
+    rely on an earlier installation.
+    """
+    global _sigint_handler_installed
+    _stoppable_executors.add(executor)
+    if (
+        not _sigint_handler_installed
+        and threading.current_thread() is threading.main_thread()
+    ):
+        signal.signal(signal.SIGINT, _handle_sigint)
+        _sigint_handler_installed = True
+
+
+def _run_worker_process(
+    host: str,
+    port: int,
+    slow_query_ms: Optional[float],
+    pipeline_window: int,
+    scale_factor: int,
+    thread_ids: List[int],
+    transaction_count: int,
+    read_write_ratio: float,
+    transaction_probabilities: List[float],
+    duration_seconds: float = 0,
+) -> List["ThreadStats"]:
+    """Run benchmark workers thread_ids in this process.
+
+    A single worker runs on the process's own connection; several run as
+    threads of the process, sharing a connection pool of their own.
+    """
+    with DatabaseConnection(
+        host, port, pipeline_window=pipeline_window, slow_query_ms=slow_query_ms
+    ) as db:
+        executor = TransactionExecutor(db, scale_factor, stop_event=_worker_stop)
+        if len(thread_ids) == 1:
+            # The worker's only thread uses the process's connection
+            executor._thread_local.db = db
+            stats = executor._execute_thread_transactions(
+                thread_ids[0],
+                transaction_count,
+                read_write_ratio,
+                transaction_probabilities,
+                duration_seconds,
+            )
+            return [stats]
+
+        result = executor.run_concurrent_benchmark(
+            len(thread_ids),
+            transaction_count,
+            read_write_ratio,
+            transaction_probabilities,
+            duration_seconds=duration_seconds,
+        )
+        # Report the workers under their benchmark-wide IDs
+        for thread_id, stats in zip(thread_ids, result.per_thread_results):
+            stats.thread_id = thread_id
+        return result.per_thread_results
+
+
+@dataclass(slots=True)
 class TransactionResult:
     """Result of a single transaction execution."""
 
     transaction_type: int
     success: bool
     execution_time: float
-    timestamp: datetime
+    timestamp: float  # epoch seconds, format with time.localtime when reporting
     thread_id: int
 
 
-@dataclass
+# Latency histogram buckets: bucket i counts times below 2**i microseconds
+LATENCY_BUCKETS = 40
+# Transaction results kept per thread for inspection (reservoir sample)
+SAMPLE_SIZE = 100
+
+
+@dataclass(slots=True)
+class ThreadStats:
+    """Running totals of one worker's transactions.
+
+    Memory stays constant however long the worker runs: latencies go into a
+    log2 histogram and only a uniform sample of SAMPLE_SIZE results is kept.
+    """
+
+    thread_id: int
+    total_transactions: int = 0
+    successful_transactions: int = 0
+    total_execution_time: float = 0.0
+    transaction_breakdown: List[int] = field(default_factory=lambda: [0] * 5)
+    latency_histogram: List[int] = field(
+        default_factory=lambda: [0] * LATENCY_BUCKETS
+    )
+    samples: List[TransactionResult] = field(default_factory=list)
+
+    def record(self, result: TransactionResult, rng: random.Random) -> None:
+        """Add one transaction result; ``rng`` drives the sampling."""
+        self.total_transactions += 1
+        self.successful_transactions += result.success
+        self.total_execution_time += result.execution_time
+        self.transaction_breakdown[result.transaction_type] += 1
+        bucket = int(result.execution_time * 1e6).bit_length()
+        self.latency_histogram[min(bucket, LATENCY_BUCKETS - 1)] += 1
+
+        if len(self.samples) < SAMPLE_SIZE:
+            self.samples.append(result)
+        else:
+            slot = rng.randrange(self.total_transactions)
+            if slot < SAMPLE_SIZE:
+                self.samples[slot] = result
+
+    def latency_percentile(self, q: float) -> float:
+        """Upper bound, in seconds, of the latency bucket holding quantile q."""
+        target = q / 100 * self.total_transactions
+        seen = 0
+        for bucket, count in enumerate(self.latency_histogram):
+            seen += count
+            if count and seen >= target:
+                return (1 << bucket) / 1e6
+        return 0.0
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Aggregated benchmark results."""
 
@@ -41,7 +255,7 @@ class BenchmarkResult:
     throughput_tps: float
     total_duration: float
     transaction_breakdown: Dict[int, int]
-    per_thread_results: List[List[TransactionResult]]
+    per_thread_results: List[ThreadStats]
 
 
 class TransactionExecutor:
@@ -54,19 +268,77 @@ class TransactionExecutor:
     ORDER_STATUS = 3
     STOCK_LEVEL = 4
 
-    def __init__(self, db_connection: DatabaseConnection, scale_factor: int = 1):
+    # Backoff between attempts of a failed transaction, in seconds
+    RETRY_BASE_DELAY = 0.005
+    RETRY_MAX_DELAY = 1.0
+    # Failed attempts are logged at most once per this many seconds
+    FAILURE_LOG_INTERVAL = 1.0
+
+    # New-Order stock reads by district, which selects the s_dist_XX column:
+    # one row by key, and several items of one supply warehouse via IN (...)
+    STOCK_SELECT_BY_DID = {
+        d_id: f"SELECT s_quantity, s_dist_{d_id:02d}, s_ytd, s_order_cnt, "
+        "s_remote_cnt, s_data FROM stock WHERE s_i_id = ? AND s_w_id = ?"
+        for d_id in range(1, 11)
+    }
+    STOCK_SELECT_IN_BY_DID = {
+        d_id: f"SELECT s_i_id, s_quantity, s_dist_{d_id:02d}, s_ytd, s_order_cnt, "
+        "s_remote_cnt, s_data FROM stock WHERE s_w_id = ? AND s_i_id IN ({})"
+        for d_id in range(1, 11)
+    }
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        scale_factor: int = 1,
+        stop_event: Optional[multiprocessing.synchronize.Event] = None,
+    ):
         """Initialize TPC-C transaction executor.
 
         Args:
             db_connection: Database connection instance
             scale_factor: Number of warehouses to test
+            stop_event: Event set by another process to stop this executor's
+                benchmarks (used in worker processes); by default a private
+                one is set by Ctrl+C
         """
         self.db = db_connection
         self.scale_factor = scale_factor
-        self.data_generator = TpccDataGenerator(scale_factor)
 
-        # Thread-local storage for database connections
+        # Thread-local storage for database connections and data generators
         self._thread_local = threading.local()
+        # Shared connections for thread-mode benchmark runs; while set,
+        # each transaction borrows one instead of using a thread-local one
+        self.pool: Optional[ConnectionPool] = None
+        # Optional SQL features, switched off when the server rejects them
+        self._capabilities: Dict[str, bool] = {}
+        # (i_price, i_name, i_original) by i_id (see _item_entry()), shared
+        # by all worker threads; the item table is never modified after
+        # loading
+        self._item_cache: Dict[int, tuple] = {}
+        # Set by Ctrl+C, or by the parent of a worker process; workers finish
+        # their current transaction and return
+        self._stop = threading.Event() if stop_event is None else stop_event
+        self._stop_is_shared = stop_event is not None
+        # Stop event of the worker processes of a running process-mode run
+        self._process_stop: Optional[multiprocessing.synchronize.Event] = None
+        # Rate limit of the failed-attempt warning (see _log_failed_attempt())
+        self._last_failure_log = 0.0
+        self._unlogged_failures = 0
+
+    @property
+    def data_generator(self) -> TpccDataGenerator:
+        """This thread's data generator, drawing from its own random.Random.
+
+        Worker threads never share random state, so their draws are
+        independent and the random module's generator is left alone.
+        """
+        try:
+            return self._thread_local.data_generator
+        except AttributeError:
+            generator = TpccDataGenerator(self.scale_factor, rng=random.Random())
+            self._thread_local.data_generator = generator
+            return generator
 
     def _get_thread_db_connection(self) -> DatabaseConnection:
         """Get thread-local database connection."""
@@ -77,21 +349,30 @@ class TransactionExecutor:
             while retry_count < max_retries:
                 try:
                     self._thread_local.db = DatabaseConnection(
-                        host=self.db.host, port=self.db.port
+                        host=self.db.host,
+                        port=self.db.port,
+                        pipeline_window=self.db.pipeline_window,
+                        slow_query_ms=self.db.slow_query_ms,
                     )
                     self._thread_local.db.connect()
                     logger.debug(
-                        f"Created database connection for thread {threading.current_thread().name}"
+                        "Created database connection for thread %s",
+                        threading.current_thread().name,
                     )
                     break
                 except Exception as e:
                     retry_count += 1
                     logger.warning(
-                        f"Failed to create database connection (attempt {retry_count}/{max_retries}): {e}"
+                        "Failed to create database connection (attempt %d/%d): %s",
+                        retry_count,
+                        max_retries,
+                        e,
                     )
                     if retry_count >= max_retries:
                         logger.error(
-                            f"Failed to create database connection after {max_retries} attempts: {e}"
+                            "Failed to create database connection after %d attempts: %s",
+                            max_retries,
+                            e,
                         )
                         raise
                     time.sleep(0.1 * retry_count)  # Exponential backoff
@@ -110,96 +391,136 @@ class TransactionExecutor:
             TransactionResult with execution details
         """
         start_time = time.time()
-        timestamp = datetime.now()
-        retry_delay = 0.1  # 100ms
         max_execution_time = 60  # 60 second timeout per transaction
         attempt = 0
 
-        db = self._get_thread_db_connection()
-
         while True:
-            if transaction_type == self.NEW_ORDER:
-                success = self._execute_new_order(db)
-            elif transaction_type == self.PAYMENT:
-                success = self._execute_payment(db)
-            elif transaction_type == self.DELIVERY:
-                success = self._execute_delivery(db)
-            elif transaction_type == self.ORDER_STATUS:
-                success = self._execute_order_status(db)
-            elif transaction_type == self.STOCK_LEVEL:
-                success = self._execute_stock_level(db)
+            if self.pool is not None:
+                # Held from BEGIN to COMMIT/ROLLBACK of this attempt only
+                with self.pool.acquire() as db:
+                    success = self._dispatch_transaction(transaction_type, db)
             else:
-                raise ValueError(f"Unknown transaction type: {transaction_type}")
+                db = self._get_thread_db_connection()
+                success = self._dispatch_transaction(transaction_type, db)
 
             execution_time = time.time() - start_time
 
             if execution_time > max_execution_time:
                 logger.warning(
-                    f"Transaction type {transaction_type} took {execution_time:.2f}s, exceeding timeout"
+                    "Transaction type %d took %.2fs, exceeding timeout",
+                    transaction_type,
+                    execution_time,
                 )
 
-            if not success:
+            # During shutdown a failed attempt is reported, not retried
+            if not success and not self._stop.is_set():
                 attempt += 1
                 execution_time = time.time() - start_time
 
-                # Check for deadlock or timeout specific errors
-                # error_msg = str(e).lower()
-                # is_deadlock = (
-                #     "deadlock" in error_msg
-                #     or "timeout" in error_msg
-                #     or "lock" in error_msg
-                # )
-
-                logger.warning(f"Transaction attempt {attempt} failed")
-                # if is_deadlock:
-                #     logger.info(
-                #         "Detected potential deadlock, will retry with longer delay"
-                #     )
-
-                # Exponential backoff with longer delay for deadlocks
-                # delay = retry_delay * attempt
-                # time.sleep(delay)
+                self._log_failed_attempt(attempt)
+
+                # Capped exponential backoff, jittered so that transactions
+                # aborted by the same conflict do not retry in lockstep
+                delay = min(
+                    self.RETRY_MAX_DELAY,
+                    self.RETRY_BASE_DELAY * 2 ** min(attempt, 16),
+                )
+                time.sleep(delay * self.data_generator.random.random_float(0.5, 1.5))
                 continue
 
             if attempt > 0:
-                logger.debug(f"Transaction succeeded after {attempt + 1} attempts")
+                logger.debug("Transaction succeeded after %d attempts", attempt + 1)
 
             return TransactionResult(
                 transaction_type=transaction_type,
                 success=success,
                 execution_time=execution_time,
-                timestamp=timestamp,
+                timestamp=start_time,
                 thread_id=thread_id,
             )
 
+    def _log_failed_attempt(self, attempt: int) -> None:
+        """Warn about a failed attempt, at most once per FAILURE_LOG_INTERVAL.
+
+        Under heavy contention every worker fails repeatedly; the failures in
+        between are counted and reported with the next warning.
+        """
+        now = time.monotonic()
+        if now - self._last_failure_log < self.FAILURE_LOG_INTERVAL:
+            self._unlogged_failures += 1
+            return
+        logger.warning(
+            "Transaction attempt %d failed (%d other failed attempts since "
+            "the last report)",
+            attempt,
+            self._unlogged_failures,
+        )
+        self._last_failure_log = now
+        self._unlogged_failures = 0
+
+    def _dispatch_transaction(
+        self, transaction_type: int, db: DatabaseConnection
+    ) -> bool:
+        """Run one attempt of a transaction of the given type on ``db``."""
+        if transaction_type == self.NEW_ORDER:
+            return self._execute_new_order(db)
+        elif transaction_type == self.PAYMENT:
+            return self._execute_payment(db)
+        elif transaction_type == self.DELIVERY:
+            return self._execute_delivery(db)
+        elif transaction_type == self.ORDER_STATUS:
+            return self._execute_order_status(db)
+        elif transaction_type == self.STOCK_LEVEL:
+            return self._execute_stock_level(db)
+        else:
+            raise ValueError(f"Unknown transaction type: {transaction_type}")
+
     def _execute_new_order(self, db: DatabaseConnection) -> bool:
         """Execute NewOrder transaction with complete TPC-C logic."""
-        w_id = self.data_generator.get_random_warehouse_id()
-        d_id = self.data_generator.get_random_district_id()
-        c_id = self.data_generator.get_random_customer_id()
+        gen = self.data_generator
+        w_id = gen.get_random_warehouse_id()
+        d_id = gen.get_random_district_id()
+        c_id = gen.get_random_customer_id()
 
         # Generate order line items
-        ol_cnt = self.data_generator.get_random_order_line_count()
-        ol_i_id = [self.data_generator.get_random_item_id() for _ in range(ol_cnt)]
-        ol_supply_w_id = [
-            w_id
-            if random.random() < 0.99
-            else self.data_generator.get_random_warehouse_id()
-            for _ in range(ol_cnt)
-        ]
-        ol_quantity = [self.data_generator.get_random_quantity() for _ in range(ol_cnt)]
+        ol_cnt = gen.get_random_order_line_count()
+        ol_i_id, ol_supply_w_id, ol_quantity = gen.get_random_order_lines(
+            w_id, ol_cnt
+        )
+        all_local = ol_supply_w_id.count(w_id) == ol_cnt
 
         try:
-            # Start transaction
-            db.execute_update("BEGIN")
-
-            # Phase 1: Get warehouse, district, and customer info
-            # Get district info: tax and next order ID
-            district_info = db.execute_query(
-                "SELECT d_tax, d_next_o_id FROM district WHERE d_id = ? AND d_w_id = ?",
-                (d_id, w_id),
+            # Phase 1: Get warehouse, district, and customer info and take
+            # the next order ID. RMDB has no UPDATE ... RETURNING, so the
+            # district is read and incremented by two statements; neither
+            # depends on the other's result, so they are pipelined together
+            # with BEGIN and the customer/warehouse read (one round-trip with
+            # --pipeline-window 4 or more, otherwise sent one by one). If the
+            # district is missing, the UPDATE matched no row and is rolled back
+            _, district_info, _, customer_info = db.execute_pipelined(
+                [
+                    ("BEGIN", ()),
+                    (
+                        "SELECT d_tax, d_next_o_id FROM district WHERE d_id = ? AND d_w_id = ?",
+                        (d_id, w_id),
+                    ),
+                    (
+                        "UPDATE district SET d_next_o_id = d_next_o_id+1 WHERE d_id = ? AND d_w_id = ?",
+                        (d_id, w_id),
+                    ),
+                    (
+                        """SELECT c_discount, c_last, c_credit, w_tax
+                           FROM customer,
+                                warehouse
+                           WHERE c_w_id = w_id
+                             AND c_d_id = ?
+                             AND c_id = ?
+                             AND w_id = ?""",
+                        (d_id, c_id, w_id),
+                    ),
+                ]
             )
-            if not district_info:
+            if not district_info or not customer_info:
                 db.execute_update("ROLLBACK")
                 return False
 
@@ -207,36 +528,13 @@ class TransactionExecutor:
             d_tax = float(d_tax)
             o_id = int(d_next_o_id)
 
-            # Update next order ID
-            db.execute_update(
-                "UPDATE district SET d_next_o_id = d_next_o_id+1 WHERE d_id = ? AND d_w_id = ?",
-                (d_id, w_id),
-            )
-
-            # Get customer and warehouse info
-            customer_info = db.execute_query(
-                """SELECT c_discount, c_last, c_credit, w_tax
-                   FROM customer,
-                        warehouse
-                   WHERE c_w_id = w_id
-                     AND c_d_id = ?
-                     AND c_id = ?
-                     AND w_id = ?""",
-                (d_id, c_id, w_id),
-            )
-            if not customer_info:
-                db.execute_update("ROLLBACK")
-                return False
-
             c_discount, c_last, c_credit, w_tax = customer_info[0]
             c_discount = float(c_discount)
             w_tax = float(w_tax)
 
             # Phase 2: Create order and new order
-            o_entry_d = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            o_all_local = (
-                1 if all(supply_w_id == w_id for supply_w_id in ol_supply_w_id) else 0
-            )
+            o_entry_d = _now()
+            o_all_local = int(all_local)
 
             # Insert order
             db.execute_update(
@@ -252,32 +550,71 @@ class TransactionExecutor:
             )
 
             # Phase 3: Process order lines
-            total_amount = 0
-            for ol_number in range(1, ol_cnt + 1):
-                # Get item info
-                item_info = db.execute_query(
-                    "SELECT i_price, i_name, i_data FROM item WHERE i_id = ?",
-                    (ol_i_id[ol_number - 1],),
+            # Items come from the item cache, and stock rows are read with one
+            # IN (...) query per supply warehouse, in s_w_id order like the
+            # updates below; lines missing from a batched read are looked up
+            # individually
+            items = self._get_items(db, ol_i_id)
+            stocks = {}
+            for supply_w_id in sorted(set(ol_supply_w_id)):
+                found = self._batched_lookup(
+                    db,
+                    "stock_in_list",
+                    self.STOCK_SELECT_IN_BY_DID[d_id],
+                    (supply_w_id,),
+                    sorted(
+                        i_id
+                        for i_id, line_w_id in zip(ol_i_id, ol_supply_w_id)
+                        if line_w_id == supply_w_id
+                    ),
                 )
-                if not item_info:
-                    db.execute_update("ROLLBACK")
-                    return False
+                for i_id, row in found.items():
+                    stocks[i_id, supply_w_id] = row
 
-                i_price, i_name, i_data = item_info[0]
-                i_price = float(i_price)
+            # Per-line statements are prepared once and bound per item
+            item_stmt = db.prepare(
+                "SELECT i_price, i_name, i_data FROM item WHERE i_id = ?"
+            )
+            stock_stmt = db.prepare(self.STOCK_SELECT_BY_DID[d_id])
+            stock_updates = []
+            order_lines = []
+            total_amount = 0
+            # Stock rows are read and updated in (s_w_id, s_i_id) order so
+            # concurrent New-Orders lock them in the same order, which reduces
+            # deadlocks (the server's lock order within one IN (...) read is
+            # its own);
+            # order lines keep their ol_number from the original order
+            for ol_number in sorted(
+                range(1, ol_cnt + 1),
+                key=lambda n: (ol_supply_w_id[n - 1], ol_i_id[n - 1]),
+            ):
+                i_id = ol_i_id[ol_number - 1]
+                supply_w_id = ol_supply_w_id[ol_number - 1]
+                quantity = ol_quantity[ol_number - 1]
 
-                # Get stock info
-                stock_info = db.execute_query(
-                    f"SELECT s_quantity, s_dist_{d_id:02d}, s_ytd, s_order_cnt, s_remote_cnt, s_data "
-                    "FROM stock WHERE s_i_id = ? AND s_w_id = ?",
-                    (ol_i_id[ol_number - 1], ol_supply_w_id[ol_number - 1]),
-                )
-                if not stock_info:
-                    db.execute_update("ROLLBACK")
-                    return False
+                # Get item info
+                item_info = items.get(i_id)
+                if item_info is None:
+                    item_info = item_stmt.query((i_id,))
+                    if not item_info:
+                        db.execute_update("ROLLBACK")
+                        return False
+                    item_info = self._item_entry(item_info[0])
+                    self._item_cache[i_id] = item_info
+
+                i_price, i_name, i_original = item_info
+
+                # Get stock info; an item ordered twice sees its first update
+                stock_info = stocks.get((i_id, supply_w_id))
+                if stock_info is None:
+                    stock_info = stock_stmt.query((i_id, supply_w_id))
+                    if not stock_info:
+                        db.execute_update("ROLLBACK")
+                        return False
+                    stock_info = stock_info[0]
 
                 s_quantity, s_dist, s_ytd, s_order_cnt, s_remote_cnt, s_data = (
-                    stock_info[0]
+                    stock_info
                 )
                 s_quantity = int(s_quantity)
                 s_ytd = float(s_ytd)
@@ -285,56 +622,67 @@ class TransactionExecutor:
                 s_remote_cnt = int(s_remote_cnt)
 
                 # Update stock quantity
-                if s_quantity >= ol_quantity[ol_number - 1] + 10:
-                    s_quantity -= ol_quantity[ol_number - 1]
+                if s_quantity >= quantity + 10:
+                    s_quantity -= quantity
                 else:
-                    s_quantity = s_quantity - ol_quantity[ol_number - 1] + 91
+                    s_quantity = s_quantity - quantity + 91
 
-                s_ytd += ol_quantity[ol_number - 1]
+                s_ytd += quantity
                 s_order_cnt += 1
-                if ol_supply_w_id[ol_number - 1] != w_id:
+                if supply_w_id != w_id:
                     s_remote_cnt += 1
 
-                # Update stock
-                db.execute_update(
-                    "UPDATE stock SET s_quantity = ?, s_ytd = ?, s_order_cnt = ?, s_remote_cnt = ? "
-                    "WHERE s_i_id = ? AND s_w_id = ?",
+                stock_updates.append(
                     (
-                        s_quantity,
-                        s_ytd,
-                        s_order_cnt,
-                        s_remote_cnt,
-                        ol_i_id[ol_number - 1],
-                        ol_supply_w_id[ol_number - 1],
-                    ),
+                        "UPDATE stock SET s_quantity = ?, s_ytd = ?, s_order_cnt = ?, s_remote_cnt = ? "
+                        "WHERE s_i_id = ? AND s_w_id = ?",
+                        (s_quantity, s_ytd, s_order_cnt, s_remote_cnt, i_id, supply_w_id),
+                    )
+                )
+                stocks[i_id, supply_w_id] = (
+                    s_quantity,
+                    s_dist,
+                    s_ytd,
+                    s_order_cnt,
+                    s_remote_cnt,
+                    s_data,
                 )
 
                 # Calculate order line amount
-                ol_amount = ol_quantity[ol_number - 1] * i_price
+                ol_amount = quantity * i_price
                 brand_generic = (
-                    "B" if "ORIGINAL" in i_data and "ORIGINAL" in s_data else "G"
+                    "B" if i_original and "ORIGINAL" in s_data else "G"
                 )
 
-                # Insert order line
-                db.execute_update(
-                    """INSERT INTO order_line
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                order_lines.append(
                     (
                         o_id,
                         d_id,
                         w_id,
                         ol_number,
-                        ol_i_id[ol_number - 1],
-                        ol_supply_w_id[ol_number - 1],
+                        i_id,
+                        supply_w_id,
                         "1970-01-01 00:00:00",
-                        ol_quantity[ol_number - 1],
+                        quantity,
                         ol_amount,
                         s_dist,
-                    ),
+                    )
                 )
 
                 total_amount += ol_amount
 
+            # Stock updates keep the (s_w_id, s_i_id) order of the loop and
+            # are pipelined, in one round-trip per --pipeline-window
+            # statements (one each at the default window of 1)
+            db.execute_pipelined(stock_updates)
+
+            # Insert all order lines with one multi-row INSERT
+            order_lines.sort(key=itemgetter(3))
+            db.execute_many(
+                "INSERT INTO order_line VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                order_lines,
+            )
+
             # Calculate final amount with discounts and taxes
             total_amount = total_amount * (1 - c_discount) * (1 + w_tax + d_tax)
 
@@ -342,68 +690,172 @@ class TransactionExecutor:
             db.execute_update("COMMIT")
             return True
 
+        except QueryAborted as e:
+            # Conflict with a concurrent transaction; the caller retries
+            logger.debug("New order transaction aborted: %s", e)
+            db.execute_update("ROLLBACK")
+            return False
         except Exception as e:
-            logger.error(f"New order transaction failed: {e}")
+            logger.error("New order transaction failed: %s", e)
             db.execute_update("ROLLBACK")
             return False
 
+    def _in_list_query(
+        self, db: DatabaseConnection, capability: str, query: str, params: tuple
+    ) -> list:
+        """Run an ``IN (...)`` lookup unless the server rejected it before.
+
+        Args:
+            db: Connection to query
+            capability: Key in _capabilities of this kind of lookup
+            query: SELECT with its IN list placeholders filled in
+            params: Parameters of the query
+
+        Returns:
+            Rows of the query. Empty if the server rejects it, after which
+            this kind of lookup is no longer tried.
+        """
+        if not self._capabilities.get(capability, True):
+            return []
+        rows = db.try_query(query, params)
+        if rows is None:
+            logger.warning(
+                "Server rejected IN (...) lookup %s; using one per key", capability
+            )
+            self._capabilities[capability] = False
+            return []
+        return rows
+
+    def _batched_lookup(
+        self,
+        db: DatabaseConnection,
+        capability: str,
+        query: str,
+        params: tuple,
+        keys: List[int],
+    ) -> Dict[int, tuple]:
+        """Fetch rows for several integer keys with one ``IN (...)`` query.
+
+        Args:
+            db: Connection to query
+            capability: Key in _capabilities of this kind of lookup
+            query: SELECT whose first column is the key, with ``{}`` where the
+                IN list placeholders go
+            params: Parameters preceding the IN list
+            keys: Keys to look up; duplicates are sent once
+
+        Returns:
+            Remaining columns of each row found, by key. Empty if the server
+            rejects the IN list (see _in_list_query()).
+        """
+        keys = list(dict.fromkeys(keys))
+        rows = self._in_list_query(
+            db,
+            capability,
+            query.format(", ".join("?" * len(keys))),
+            params + tuple(keys),
+        )
+        return {int(row[0]): row[1:] for row in rows}
+
+    def _get_items(self, db: DatabaseConnection, i_ids: List[int]) -> Dict[int, tuple]:
+        """Return the cached item rows of i_ids, reading the misses at once.
+
+        Items not cached yet are read with one ``IN (...)`` query and kept;
+        any the query misses are left out for the caller to look up.
+        """
+        cache = self._item_cache
+        missing = [i_id for i_id in i_ids if i_id not in cache]
+        if missing:
+            rows = self._batched_lookup(
+                db,
+                "item_in_list",
+                "SELECT i_id, i_price, i_name, i_data FROM item WHERE i_id IN ({})",
+                (),
+                missing,
+            )
+            # Each insertion is atomic, so concurrent readers need no lock
+            cache.update(
+                (i_id, self._item_entry(row)) for i_id, row in rows.items()
+            )
+        return {i_id: cache[i_id] for i_id in i_ids if i_id in cache}
+
+    @staticmethod
+    def _item_entry(row: tuple) -> tuple:
+        """Item cache entry (i_price, i_name, i_original) of an item row.
+
+        i_data is only ever tested for "ORIGINAL", so the cache keeps the
+        result of that test instead of the string.
+        """
+        i_price, i_name, i_data = row
+        return float(i_price), i_name, "ORIGINAL" in i_data
+
     def _execute_payment(self, db: DatabaseConnection) -> bool:
         """Execute Payment transaction."""
-        w_id = self.data_generator.get_random_warehouse_id()
-        d_id = self.data_generator.get_random_district_id()
-        c_w_id, c_d_id = self.data_generator.get_payment_customer_warehouse(w_id, d_id)
-        amount = self.data_generator.get_random_payment_amount()
+        gen = self.data_generator
+        w_id = gen.get_random_warehouse_id()
+        d_id = gen.get_random_district_id()
+        c_w_id, c_d_id = gen.get_payment_customer_warehouse(w_id, d_id)
+        amount = gen.get_random_payment_amount()
 
         # Determine customer selection method (60% by ID, 40% by last name)
-        if random.random() < 0.6:
-            c_id = self.data_generator.get_random_customer_id()
+        if gen.random.random_unit() < 0.6:
+            c_id = gen.get_random_customer_id()
             customer_query = c_id
             by_id = True
         else:
-            c_last = self.data_generator.get_random_customer_last_name()
+            c_last = gen.get_random_customer_last_name()
             customer_query = c_last
             by_id = False
 
         try:
-            db.execute_update("BEGIN")
-
-            # Step 1: Update warehouse YTD
-            warehouse_result = db.execute_query(
-                "SELECT w_name, w_street_1, w_street_2, w_city, w_state, w_zip, w_ytd "
-                "FROM warehouse WHERE w_id = ?",
-                (w_id,),
-            )
-
-            if not warehouse_result:
-                db.execute_update("ROLLBACK")
-                return False
-
-            w_name, w_street_1, w_street_2, w_city, w_state, w_zip, w_ytd = (
-                warehouse_result[0]
-            )
-
-            db.execute_update(
-                "UPDATE warehouse SET w_ytd = w_ytd+? WHERE w_id = ?", (amount, w_id)
-            )
-
-            # Step 2: Update district YTD
-            district_result = db.execute_query(
-                "SELECT d_name, d_street_1, d_street_2, d_city, d_state, d_zip, d_ytd "
-                "FROM district WHERE d_w_id = ? AND d_id = ?",
-                (w_id, d_id),
+            # Steps 1-2: Read warehouse and district with one join, pipelined
+            # with BEGIN (one round-trip only with --pipeline-window above 1)
+            _, warehouse_district = db.execute_pipelined(
+                [
+                    ("BEGIN", ()),
+                    (
+                        "SELECT w_name, w_street_1, w_street_2, w_city, w_state, w_zip, w_ytd, "
+                        "d_name, d_street_1, d_street_2, d_city, d_state, d_zip, d_ytd "
+                        "FROM warehouse, district WHERE w_id = ? AND d_w_id = w_id AND d_id = ?",
+                        (w_id, d_id),
+                    ),
+                ]
             )
 
-            if not district_result:
+            if not warehouse_district:
                 db.execute_update("ROLLBACK")
                 return False
 
-            d_name, d_street_1, d_street_2, d_city, d_state, d_zip, d_ytd = (
-                district_result[0]
-            )
-
-            db.execute_update(
-                "UPDATE district SET d_ytd = d_ytd+? WHERE d_w_id = ? AND d_id = ?",
-                (amount, w_id, d_id),
+            (
+                w_name,
+                w_street_1,
+                w_street_2,
+                w_city,
+                w_state,
+                w_zip,
+                w_ytd,
+                d_name,
+                d_street_1,
+                d_street_2,
+                d_city,
+                d_state,
+                d_zip,
+                d_ytd,
+            ) = warehouse_district[0]
+
+            # Update warehouse and district YTD; with a pipeline window above
+            # 1 both go out in one round-trip
+            db.execute_pipelined(
+                [
+                    (
+                        "UPDATE warehouse SET w_ytd = w_ytd+? WHERE w_id = ?",
+                        (amount, w_id),
+                    ),
+                    (
+                        "UPDATE district SET d_ytd = d_ytd+? WHERE d_w_id = ? AND d_id = ?",
+                        (amount, w_id, d_id),
+                    ),
+                ]
             )
 
             # Step 3: Get customer information and update
@@ -464,10 +916,11 @@ class TransactionExecutor:
             new_payment_cnt = int(c_payment_cnt) + 1
 
             if c_credit == "BC":
-                # Bad credit: update c_data with payment info
+                # Bad credit: prepend payment info to c_data, keeping only
+                # the first 300 characters, so at most that much of c_data
+                # is copied
                 payment_info = f"{c_id}{c_d_id}{c_w_id}{d_id}{w_id}{amount:.2f}"
-                new_data = payment_info + str(c_data)
-                new_data = new_data[:300]  # Truncate to 300 characters
+                new_data = payment_info + c_data[: 300 - len(payment_info)]
 
                 db.execute_update(
                     "UPDATE customer SET c_balance = ?, c_ytd_payment = ?, c_payment_cnt = ?, c_data = ? "
@@ -497,111 +950,207 @@ class TransactionExecutor:
                     ),
                 )
 
-            # Step 5: Insert history record
+            # Step 5: Insert history record, pipelined with COMMIT (one
+            # round-trip only with --pipeline-window above 1)
             h_data = w_name[:10] + "    " + d_name[:10]
-            db.execute_update(
-                "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    c_id,
-                    c_d_id,
-                    c_w_id,
-                    d_id,
-                    w_id,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    amount,
-                    h_data,
-                ),
+            db.execute_pipelined(
+                [
+                    (
+                        "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            c_id,
+                            c_d_id,
+                            c_w_id,
+                            d_id,
+                            w_id,
+                            _now(),
+                            amount,
+                            h_data,
+                        ),
+                    ),
+                    ("COMMIT", ()),
+                ]
             )
-
-            db.execute_update("COMMIT")
             return True
 
+        except QueryAborted as e:
+            # Conflict with a concurrent transaction; the caller retries
+            logger.debug("Payment transaction aborted: %s", e)
+            db.execute_update("ROLLBACK")
+            return False
         except Exception as e:
-            logger.error(f"Payment transaction failed: {e}")
+            logger.error("Payment transaction failed: %s", e)
             db.execute_update("ROLLBACK")
             return False
 
     def _execute_delivery(self, db: DatabaseConnection) -> bool:
         """Execute Delivery transaction."""
-        w_id = self.data_generator.get_random_warehouse_id()
-        o_carrier_id = self.data_generator.get_random_carrier_id()
+        gen = self.data_generator
+        w_id = gen.get_random_warehouse_id()
+        o_carrier_id = gen.get_random_carrier_id()
+        delivery_date = _now()
 
         try:
             db.execute_update("BEGIN")
 
-            for d_id in range(1, 11):  # 10 districts per warehouse
-                # Step 1: Find the oldest undelivered order (min o_id from new_orders)
-                new_order_result = db.execute_query(
-                    "SELECT MIN(no_o_id) FROM new_orders WHERE no_d_id = ? AND no_w_id = ?",
-                    (d_id, w_id),
-                )
-
-                if not new_order_result:
-                    continue  # No undelivered orders for this district
-
-                o_id = int(new_order_result[0][0])
-
-                # Step 2: Remove the order from new_orders
-                db.execute_update(
-                    "DELETE FROM new_orders WHERE no_o_id = ? AND no_d_id = ? AND no_w_id = ?",
-                    (o_id, d_id, w_id),
-                )
-
-                # Step 3: Update the order with carrier_id
-                db.execute_update(
-                    "UPDATE orders SET o_carrier_id = ? WHERE o_id = ? AND o_d_id = ? AND o_w_id = ?",
-                    (o_carrier_id, o_id, d_id, w_id),
-                )
-
-                # Step 4: Update all order_lines with delivery date
-                delivery_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                db.execute_update(
-                    "UPDATE order_line SET ol_delivery_d = ? WHERE ol_o_id = ? AND ol_d_id = ? AND ol_w_id = ?",
-                    (delivery_date, o_id, d_id, w_id),
-                )
+            # Step 1: Find the oldest undelivered order of every district
+            oldest = self._oldest_new_orders(db, w_id)
+            if not oldest:
+                db.execute_update("COMMIT")
+                return True
+
+            # Step 2: Read the customers and totals of all those orders at once
+            o_ids = list(oldest.values())
+            customers = self._delivery_lookup(
+                db,
+                "order_in_list",
+                "SELECT o_d_id, o_id, o_c_id FROM orders "
+                "WHERE o_w_id = ? AND o_id IN ({})",
+                w_id,
+                o_ids,
+            )
+            totals = self._delivery_lookup(
+                db,
+                "order_line_in_list",
+                "SELECT ol_d_id, ol_o_id, SUM(ol_amount) FROM order_line "
+                "WHERE ol_w_id = ? AND ol_o_id IN ({}) GROUP BY ol_d_id, ol_o_id",
+                w_id,
+                o_ids,
+            )
 
-                # Step 5: Get customer ID and calculate order total
-                order_result = db.execute_query(
-                    "SELECT o_c_id FROM orders WHERE o_id = ? AND o_d_id = ? AND o_w_id = ?",
-                    (o_id, d_id, w_id),
-                )
-                if not order_result:
+            # The writes of all districts depend only on the reads above, so
+            # they are collected and pipelined, with COMMIT, after the last
+            # district; this saves round-trips only with --pipeline-window
+            # above 1, otherwise they are sent one by one as before
+            writes = []
+            for d_id, o_id in oldest.items():
+                # Customer ID and order total, if the batched reads missed them
+                o_c_id = customers.get((d_id, o_id))
+                if o_c_id is None:
+                    o_c_id = db.execute_scalar(
+                        "SELECT o_c_id FROM orders WHERE o_id = ? AND o_d_id = ? AND o_w_id = ?",
+                        (o_id, d_id, w_id),
+                    )
+                if o_c_id is None:
                     db.execute_update("ROLLBACK")
                     return False
 
-                o_c_id = int(order_result[0][0])
+                o_c_id = int(o_c_id)
 
-                # Calculate total amount for this order
-                total_result = db.execute_query(
-                    "SELECT SUM(ol_amount) FROM order_line WHERE ol_o_id = ? AND ol_d_id = ? AND ol_w_id = ?",
-                    (o_id, d_id, w_id),
-                )
-                if not total_result:
+                order_total = totals.get((d_id, o_id))
+                if order_total is None:
+                    order_total = db.execute_scalar(
+                        "SELECT SUM(ol_amount) FROM order_line WHERE ol_o_id = ? AND ol_d_id = ? AND ol_w_id = ?",
+                        (o_id, d_id, w_id),
+                    )
+                if order_total is None:
                     db.execute_update("ROLLBACK")
                     return False
 
-                order_total = float(total_result[0][0])
+                order_total = float(order_total)
 
-                # Step 6: Update customer balance and delivery count
-                db.execute_update(
-                    "UPDATE customer SET c_balance = c_balance+?, c_delivery_cnt = c_delivery_cnt+1 "
-                    "WHERE c_id = ? AND c_d_id = ? AND c_w_id = ?",
-                    (order_total, o_c_id, d_id, w_id),
-                )
+                writes += [
+                    # Step 3: Remove the order from new_orders
+                    (
+                        "DELETE FROM new_orders WHERE no_o_id = ? AND no_d_id = ? AND no_w_id = ?",
+                        (o_id, d_id, w_id),
+                    ),
+                    # Step 4: Update the order with carrier_id
+                    (
+                        "UPDATE orders SET o_carrier_id = ? WHERE o_id = ? AND o_d_id = ? AND o_w_id = ?",
+                        (o_carrier_id, o_id, d_id, w_id),
+                    ),
+                    # Step 5: Update all order_lines with delivery date
+                    (
+                        "UPDATE order_line SET ol_delivery_d = ? WHERE ol_o_id = ? AND ol_d_id = ? AND ol_w_id = ?",
+                        (delivery_date, o_id, d_id, w_id),
+                    ),
+                    # Step 6: Update customer balance and delivery count
+                    (
+                        "UPDATE customer SET c_balance = c_balance+?, c_delivery_cnt = c_delivery_cnt+1 "
+                        "WHERE c_id = ? AND c_d_id = ? AND c_w_id = ?",
+                        (order_total, o_c_id, d_id, w_id),
+                    ),
+                ]
 
-            db.execute_update("COMMIT")
+            writes.append(("COMMIT", ()))
+            db.execute_pipelined(writes)
             return True
 
+        except QueryAborted as e:
+            # Conflict with a concurrent transaction; the caller retries
+            logger.debug("Delivery transaction aborted: %s", e)
+            db.execute_update("ROLLBACK")
+            return False
         except Exception as e:
-            logger.error(f"Delivery transaction failed: {e}")
+            logger.error("Delivery transaction failed: %s", e)
             db.execute_update("ROLLBACK")
             return False
 
+    def _oldest_new_orders(self, db: DatabaseConnection, w_id: int) -> Dict[int, int]:
+        """Return the oldest undelivered order ID of each district of w_id.
+
+        Read with one GROUP BY query; districts without undelivered orders
+        are left out. If the server rejects that query, each district is
+        checked with its own MIN query, now and on later calls.
+        """
+        if self._capabilities.get("grouped_delivery", True):
+            rows = db.try_query(
+                "SELECT no_d_id, MIN(no_o_id) FROM new_orders "
+                "WHERE no_w_id = ? GROUP BY no_d_id",
+                (w_id,),
+            )
+            if rows is not None:
+                return {int(d_id): int(o_id) for d_id, o_id in sorted(rows)}
+            logger.warning(
+                "Server rejected grouped Delivery query; using one per district"
+            )
+            self._capabilities["grouped_delivery"] = False
+
+        oldest = {}
+        for d_id in range(1, 11):  # 10 districts per warehouse
+            min_no_o_id = db.execute_scalar(
+                "SELECT MIN(no_o_id) FROM new_orders WHERE no_d_id = ? AND no_w_id = ?",
+                (d_id, w_id),
+            )
+            if min_no_o_id is not None:
+                oldest[d_id] = int(min_no_o_id)
+        return oldest
+
+    def _delivery_lookup(
+        self,
+        db: DatabaseConnection,
+        capability: str,
+        query: str,
+        w_id: int,
+        o_ids: List[int],
+    ) -> Dict[Tuple[int, int], str]:
+        """Read one value per (d_id, o_id) order of w_id with an IN (...) query.
+
+        Args:
+            db: Connection to query
+            capability: Key in _capabilities of this kind of lookup
+            query: SELECT of district ID, order ID and value, with ``{}``
+                where the IN list of order IDs goes
+            w_id: Warehouse ID, the query's first parameter
+            o_ids: Order IDs to look up
+
+        Returns:
+            Value by (d_id, o_id); orders of other districts that happen to
+            share an order ID are included and simply never looked up
+        """
+        keys = list(dict.fromkeys(o_ids))
+        rows = self._in_list_query(
+            db, capability, query.format(", ".join("?" * len(keys))), (w_id, *keys)
+        )
+        return {(int(d_id), int(o_id)): value for d_id, o_id, value in rows}
+
     def _execute_order_status(self, db: DatabaseConnection) -> bool:
         """Execute OrderStatus transaction."""
-        w_id = self.data_generator.get_random_warehouse_id()
-        d_id = self.data_generator.get_random_district_id()
-        c_id = self.data_generator.get_random_customer_id()
+        gen = self.data_generator
+        w_id = gen.get_random_warehouse_id()
+        d_id = gen.get_random_district_id()
+        c_id = gen.get_random_customer_id()
 
         try:
             query = """
@@ -619,9 +1168,10 @@ class TransactionExecutor:
 
     def _execute_stock_level(self, db: DatabaseConnection) -> bool:
         """Execute StockLevel transaction."""
-        w_id = self.data_generator.get_random_warehouse_id()
-        d_id = self.data_generator.get_random_district_id()
-        threshold = self.data_generator.get_random_stock_threshold()
+        gen = self.data_generator
+        w_id = gen.get_random_warehouse_id()
+        d_id = gen.get_random_district_id()
+        threshold = gen.get_random_stock_threshold()
 
         try:
             query = """
@@ -635,20 +1185,16 @@ class TransactionExecutor:
         except Exception:
             return False
 
-    def _select_transaction_type(self, transaction_probabilities: List[float]) -> int:
-        """Select transaction type based on probabilities."""
-        import random
-
-        return random.choices(
-            range(len(transaction_probabilities)), weights=transaction_probabilities
-        )[0]
-
     def run_concurrent_benchmark(
         self,
         num_threads: int,
         transactions_per_thread: int,
         read_write_ratio: float = 0.5,
         transaction_probabilities: Optional[List[float]] = None,
+        execution_mode: str = "thread",
+        duration_seconds: float = 0,
+        pool_size: Optional[int] = None,
+        num_processes: Optional[int] = None,
     ) -> BenchmarkResult:
         """Run concurrent benchmark with specified threads and transactions.
 
@@ -657,87 +1203,148 @@ class TransactionExecutor:
             transactions_per_thread: Number of transactions per thread
             read_write_ratio: Ratio of read-write vs read-only transactions (0.0-1.0)
             transaction_probabilities: Probabilities for each transaction type
+            execution_mode: "thread" runs the workers as threads of this
+                process; "process" runs each in its own process so that
+                statement rendering and result parsing are not serialized
+                on the GIL
+            duration_seconds: If positive, each worker runs transactions until
+                this many seconds have passed and transactions_per_thread is
+                ignored
+            pool_size: Connections shared by the worker threads in thread
+                mode (default: num_threads, capped at 2 * CPUs + 1 and at
+                MAX_DEFAULT_POOL_SIZE); each transaction borrows one for its
+                duration
+            num_processes: In process mode, the number of processes the
+                workers are split across, each running its share as threads
+                (default: one process per worker)
 
         Returns:
-            BenchmarkResult with aggregated metrics
+            BenchmarkResult with aggregated metrics; after Ctrl+C, the
+            results of the transactions completed before the workers stopped
         """
-        import signal
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
 
         if transaction_probabilities is None:
             # Default TPC-C mix: 45% NewOrder, 43% Payment, 4% each for others
             transaction_probabilities = [0.45, 0.43, 0.04, 0.04, 0.04]
 
-        logger.info(f"Starting concurrent benchmark with {num_threads} threads")
-        logger.info(f"Transactions per thread: {transactions_per_thread}")
-        logger.info(f"Read-write ratio: {read_write_ratio}")
-        logger.info("Press Ctrl+C to cancel benchmark and clean up resources")
+        logger.info(
+            "Starting concurrent benchmark with %d %s workers",
+            num_threads,
+            execution_mode,
+        )
+        if duration_seconds > 0:
+            logger.info("Duration: %ss per thread", duration_seconds)
+        else:
+            logger.info("Transactions per thread: %d", transactions_per_thread)
+        logger.info("Read-write ratio: %s", read_write_ratio)
+        logger.info("Press Ctrl+C to stop the benchmark and report completed transactions")
 
         start_time = time.time()
-        all_results = []
-
-        def signal_handler(signum, frame):
-            logger.info("Received interrupt signal, cancelling benchmark...")
-            # Close all thread connections
-            self.close_thread_connections()
-            # Force exit the process immediately
-            import os
-
-            os._exit(0)
-
-        # Set up signal handler for graceful shutdown
-        signal.signal(signal.SIGINT, signal_handler)
-
-        # Use ThreadPoolExecutor for better thread management
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = []
-
-            # Submit tasks for each thread
-            for thread_id in range(num_threads):
-                # Submit all transactions for this thread as a batch
-                future = executor.submit(
-                    self._execute_thread_transactions,
-                    thread_id,
-                    transactions_per_thread,
-                    read_write_ratio,
-                    transaction_probabilities,
+        if not self._stop_is_shared:
+            # A shared event is set and cleared by the process that owns it
+            self._stop.clear()
+            _register_for_sigint(self)
+        try:
+            if execution_mode == "process":
+                num_processes = min(num_processes or num_threads, num_threads)
+                mp_context = multiprocessing.get_context()
+                self._process_stop = mp_context.Event()
+                executor = ProcessPoolExecutor(
+                    max_workers=num_processes,
+                    mp_context=mp_context,
+                    initializer=_init_worker_process,
+                    initargs=(self._process_stop,),
                 )
-                futures.append(future)
-
-        # Collect results and flatten the nested list structure
-        all_results = []
-        for future in as_completed(futures):
-            thread_results = future.result()
-            all_results.extend(thread_results)
+            else:
+                if pool_size is None:
+                    pool_size = min(
+                        num_threads,
+                        2 * (os.cpu_count() or 1) + 1,
+                        MAX_DEFAULT_POOL_SIZE,
+                    )
+                self.pool = ConnectionPool(
+                    pool_size,
+                    self.db.host,
+                    self.db.port,
+                    slow_query_ms=self.db.slow_query_ms,
+                    pipeline_window=self.db.pipeline_window,
+                )
+                # Use ThreadPoolExecutor for better thread management
+                executor = ThreadPoolExecutor(max_workers=num_threads)
+            with executor:
+                futures = []
+
+                if execution_mode == "process":
+                    # Workers are dealt round-robin to the processes; each
+                    # process returns the ThreadStats of its workers
+                    for process_id in range(num_processes):
+                        future = executor.submit(
+                            _run_worker_process,
+                            self.db.host,
+                            self.db.port,
+                            self.db.slow_query_ms,
+                            self.db.pipeline_window,
+                            self.scale_factor,
+                            list(range(process_id, num_threads, num_processes)),
+                            transactions_per_thread,
+                            read_write_ratio,
+                            transaction_probabilities,
+                            duration_seconds,
+                        )
+                        futures.append(future)
+                else:
+                    # Submit all transactions for each thread as a batch
+                    for thread_id in range(num_threads):
+                        future = executor.submit(
+                            self._execute_thread_transactions,
+                            thread_id,
+                            transactions_per_thread,
+                            read_write_ratio,
+                            transaction_probabilities,
+                            duration_seconds,
+                        )
+                        futures.append(future)
+
+                # Fold each worker's totals as soon as it finishes
+                per_thread_results = [None] * num_threads
+                transaction_breakdown = dict.fromkeys(range(5), 0)
+                total_transactions = 0
+                successful_transactions = 0
+                total_execution_time = 0.0
+                for future in as_completed(futures):
+                    worker_stats = future.result()
+                    if isinstance(worker_stats, ThreadStats):
+                        worker_stats = [worker_stats]
+                    for stats in worker_stats:
+                        per_thread_results[stats.thread_id] = stats
+                        for txn_type, count in enumerate(stats.transaction_breakdown):
+                            transaction_breakdown[txn_type] += count
+                        total_transactions += stats.total_transactions
+                        successful_transactions += stats.successful_transactions
+                        total_execution_time += stats.total_execution_time
+
+            if self._stop.is_set():
+                logger.info("Benchmark cancelled, reporting completed transactions")
+        finally:
+            # Also after a worker error or a second Ctrl+C
+            self.close_thread_connections()
+            _stoppable_executors.discard(self)
+            self._process_stop = None
 
         total_duration = time.time() - start_time
 
-        # Aggregate results
-        total_transactions = len(all_results)
-        successful_transactions = sum(1 for r in all_results if r.success)
         failed_transactions = total_transactions - successful_transactions
 
-        # Calculate per-transaction type breakdown
-        transaction_breakdown = {}
-        for txn_type in range(5):
-            transaction_breakdown[txn_type] = sum(
-                1 for r in all_results if r.transaction_type == txn_type
-            )
-
         # Calculate performance metrics
         avg_response_time = (
-            sum(r.execution_time for r in all_results) / total_transactions
-            if total_transactions > 0
-            else 0
+            total_execution_time / total_transactions if total_transactions > 0 else 0
         )
         throughput_tps = (
             total_transactions / total_duration if total_duration > 0 else 0
         )
 
-        # Group results by thread
-        per_thread_results = [[] for _ in range(num_threads)]
-        for result in all_results:
-            per_thread_results[result.thread_id].append(result)
-
         return BenchmarkResult(
             total_transactions=total_transactions,
             successful_transactions=successful_transactions,
@@ -755,30 +1362,52 @@ class TransactionExecutor:
         transaction_count: int,
         read_write_ratio: float,
         transaction_probabilities: List[float],
-    ) -> List[TransactionResult]:
-        """Execute a batch of transactions for a single thread."""
-        results = []
-
-        for _ in range(transaction_count):
-            # Select transaction type based on read-write ratio
-            if random.random() < read_write_ratio:
-                # Read-write transactions (NewOrder, Payment, Delivery)
-                txn_type = self._select_transaction_type(
-                    transaction_probabilities[:3] + [0.0, 0.0]
-                )
-            else:
-                # Read-only transactions (OrderStatus, StockLevel)
-                txn_type = self._select_transaction_type(
-                    [0.0, 0.0, 0.0] + transaction_probabilities[3:]
-                )
+        duration_seconds: float = 0,
+    ) -> ThreadStats:
+        """Execute a batch of transactions for a single thread.
+
+        With a positive duration_seconds, transactions are run until that
+        many seconds have passed instead of transaction_count of them.
+        Transaction types are drawn up front (see transaction_mix()), in
+        chunks when running for a duration.
+        """
+        stats = ThreadStats(thread_id)
+        sample_rng = random.Random()
+        mix = transaction_mix(read_write_ratio, transaction_probabilities)
+        rng = np.random.default_rng()
+
+        if duration_seconds > 0:
+            stop_at = time.monotonic() + duration_seconds
+
+            def timed_types():
+                while True:
+                    for txn_type in rng.choice(5, size=MIX_CHUNK, p=mix).tolist():
+                        if time.monotonic() >= stop_at:
+                            return
+                        yield txn_type
+
+            txn_types = timed_types()
+        else:
+            txn_types = rng.choice(5, size=transaction_count, p=mix).tolist()
+
+        for txn_type in txn_types:
+            if self._stop.is_set():
+                break
+            stats.record(self._execute_transaction(txn_type, thread_id), sample_rng)
 
-            result = self._execute_transaction(txn_type, thread_id)
-            results.append(result)
+        return stats
 
-        return results
+    def _request_stop(self) -> None:
+        """Stop the running benchmark's workers, including worker processes."""
+        self._stop.set()
+        if self._process_stop is not None:
+            self._process_stop.set()
 
     def close_thread_connections(self):
-        """Close all thread-local database connections."""
+        """Close the benchmark connection pool and this thread's connection."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
         if hasattr(self._thread_local, "db"):
             self._thread_local.db.close()
             del self._thread_local.db
@@ -35,7 +35,46 @@ def main():
     parser.add_argument(
         "--init", action="store_true", help="Initialize database with schema and data"
     )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=1,
+        help="Number of parallel connections used by --init to load data "
+        "(0: one per warehouse, up to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--bulk-load-dir",
+        type=str,
+        default=None,
+        help="Directory shared with the server; --init loads tables from CSV "
+        "files written there with RMDB's LOAD statement",
+    )
+    parser.add_argument(
+        "--slow-query-ms",
+        type=float,
+        default=None,
+        help="Log statements slower than this many milliseconds",
+    )
+    parser.add_argument(
+        "--pipeline-window",
+        type=int,
+        default=1,
+        help="Statements the benchmark keeps in flight per connection where "
+        "a transaction sends several independent ones (default: 1, no "
+        "pipelining); values above 1 need a server that queues back-to-back "
+        "NUL-terminated requests",
+    )
     parser.add_argument("--check", action="store_true", help="Run consistency checks")
+    parser.add_argument(
+        "--check-all",
+        action="store_true",
+        help="With --check, report every inconsistent district instead of the first",
+    )
+    parser.add_argument(
+        "--check-integrity",
+        action="store_true",
+        help="With --check, also validate foreign keys and business rules",
+    )
     parser.add_argument("--stats", action="store_true", help="Show database statistics")
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
@@ -51,6 +90,24 @@ def main():
         default=1,
         help="Number of concurrent threads for benchmark",
     )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Connections shared by the benchmark threads "
+        "(default: --threads, capped at 2 * CPUs + 1 and at 64)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="?",
+        const=0,
+        default=None,
+        metavar="N",
+        help="Run the benchmark workers in N processes instead of threads of "
+        "this one, splitting --threads between them (without N: one process "
+        "per worker)",
+    )
     parser.add_argument(
         "--transactions", type=int, default=100, help="Transactions per thread"
     )
@@ -76,18 +133,28 @@ def main():
 
     try:
         # Initialize database connection
-        with DatabaseConnection(args.host, args.port) as db:
-            executor = TpccExecutor(db, args.scale)
+        with DatabaseConnection(
+            args.host,
+            args.port,
+            pipeline_window=args.pipeline_window,
+            slow_query_ms=args.slow_query_ms,
+        ) as db:
+            executor = TpccExecutor(db, args.scale, args.bulk_load_dir)
 
             if args.init:
                 logger.info(
                     f"Initializing TPC-C benchmark with scale factor {args.scale}"
                 )
-                executor.initialize_database()
-                executor.load_data()
+                # The load is followed right away, so its indexes are built
+                # once at the end instead of maintained row by row
+                executor.initialize_database(defer_indexes=True)
+                executor.load_data(workers=args.load_workers)
 
             if args.check:
-                checks = executor.run_consistency_checks()
+                checks = executor.run_consistency_checks(
+                    fail_fast=not args.check_all,
+                    validate_integrity=args.check_integrity,
+                )
                 if not all(checks.values()):
                     logger.error("Some consistency checks failed")
                     sys.exit(1)
@@ -95,7 +162,8 @@ def main():
                     logger.info("All consistency checks passed")
 
             if args.stats:
-                stats = executor.get_database_stats()
+                # --check has just counted every table; nothing ran since
+                stats = executor.get_database_stats(reuse_counts=args.check)
                 logger.info("Database Statistics:")
                 for table, count in stats.items():
                     logger.info(f"  {table}: {count:,}")
@@ -108,6 +176,9 @@ def main():
                     transactions_per_thread=args.transactions,
                     read_write_ratio=args.rw_ratio,
                     transaction_probabilities=args.txn_probs,
+                    execution_mode=("thread" if args.processes is None else "process"),
+                    pool_size=args.pool_size,
+                    num_processes=args.processes or None,
                 )
 
                 # Print results
@@ -5,7 +5,7 @@ Customer model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     """Customer entity representing a customer within a district."""
 
@@ -5,7 +5,7 @@ District model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class District:
     """District entity representing a district within a warehouse."""
 
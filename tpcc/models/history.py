@@ -5,7 +5,7 @@ History model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class History:
     """History entity representing transaction history for customers."""
 
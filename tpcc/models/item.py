@@ -5,7 +5,7 @@ Item model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Item entity representing a catalog item."""
 
@@ -5,7 +5,7 @@ NewOrder model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class NewOrder:
     """NewOrder entity representing pending orders for delivery."""
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderLine:
     """OrderLine entity representing individual items within an order."""
 
@@ -5,7 +5,7 @@ Orders model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Orders:
     """Orders entity representing customer orders."""
 
@@ -5,7 +5,7 @@ Stock model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     """Stock entity representing inventory for an item in a warehouse."""
 
@@ -5,7 +5,7 @@ Warehouse model for TPC-C benchmark.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Warehouse:
     """Warehouse entity representing a warehouse in the TPC-C benchmark."""
 
@@ -1 +1 @@
-from .record import analysis, build_db, put_new_order, put_txn
+from .record import analysis, build_db, flush, put_new_order, put_txn
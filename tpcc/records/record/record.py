@@ -1,5 +1,9 @@
+import atexit
+import os
+import queue
 import sqlite3
-from ..config import DB_FILE
+import threading
+from ...config.settings import DB_FILE
 
 NewOrder = 0
 Payment = 1
@@ -14,13 +18,143 @@ name = {
     StockLevel: "StockLevel",
 }
 
+# Connection of this process, opened on first use. The recording functions
+# are called from the benchmark's worker processes, and an SQLite connection
+# must not be used across fork(), so it is reopened when the pid changes.
+_conn = None
+_conn_pid = None
+
+# Recording statements, kept as constants so every call hits the
+# connection's prepared statement cache.
+# flush() adds a process's totals in SQL instead of reading the row back
+_ADD_TOTALS_SQL = (
+    "update test_result set avg = avg + ?, total = total + ?, "
+    "success = success + ? where txn = ?;"
+)
+# new_order_txn.no is the table's rowid, so SQLite numbers each row one past
+# the largest no without a max() query
+_PUT_NEW_ORDER_SQL = "insert into new_order_txn(time) values(?);"
+
+# put_txn() only adds to this process's in-memory totals, [summed time,
+# count, successes] per transaction type, which flush() writes out.
+_totals = None
+_totals_pid = None
+_totals_lock = threading.Lock()
+
+# put_new_order() only queues its row; a writer thread of the process
+# commits up to BATCH queued rows at a time. The writers of all
+# processes take turns through SQLite's own write lock, waiting up to
+# BUSY_TIMEOUT seconds for it.
+BATCH = 256
+BUSY_TIMEOUT = 60
+_queue = None
+_writer = None
+_writer_pid = None
+
+
+def _open():
+    # Autocommit: single statements commit by themselves and batches are
+    # wrapped in explicit transactions, instead of the sqlite3 module
+    # opening transactions implicitly before DML
+    conn = sqlite3.connect(DB_FILE, timeout=BUSY_TIMEOUT, isolation_level=None)
+    # WAL lets analysis() read while workers write, and with
+    # synchronous=normal a commit does not wait for an fsync
+    conn.execute("pragma journal_mode=wal;")
+    conn.execute("pragma synchronous=normal;")
+    return conn
+
+
+def _connection():
+    global _conn, _conn_pid
+    if _conn is None or _conn_pid != os.getpid():
+        _conn = _open()
+        _conn_pid = os.getpid()
+    return _conn
+
+
+def _write_events(events):
+    conn = _open()
+    done = False
+    while not done:
+        batch = [events.get()]
+        while len(batch) < BATCH:
+            try:
+                batch.append(events.get_nowait())
+            except queue.Empty:
+                break
+        # None is flush()'s request to stop after the events before it
+        if batch[-1] is None:
+            batch.pop()
+            done = True
+        # Events are (statement, parameters); each statement's rows go out
+        # with one executemany()
+        rows = {}
+        for sql, params in batch:
+            rows.setdefault(sql, []).append(params)
+        if rows:
+            # IMMEDIATE takes the write lock up front rather than upgrading
+            # to it, which could fail with SQLITE_BUSY
+            conn.execute("begin immediate;")
+            for sql, params in rows.items():
+                conn.executemany(sql, params)
+            conn.execute("commit;")
+    conn.close()
+
+
+def _put(sql, params):
+    global _queue, _writer, _writer_pid
+    if _writer is None or _writer_pid != os.getpid():
+        # First event of this process (or since flush()): start its writer
+        _queue = queue.SimpleQueue()
+        _writer = threading.Thread(target=_write_events, args=(_queue,), daemon=True)
+        _writer_pid = os.getpid()
+        _writer.start()
+    _queue.put((sql, params))
+
+
+# Waits until this process's queued events are committed and adds its
+# totals to test_result. Worker processes must call it before exiting:
+# multiprocessing skips atexit there.
+def flush():
+    global _writer, _totals
+    pid = os.getpid()
+    if _writer is not None and _writer_pid == pid:
+        _queue.put(None)
+        _writer.join()
+        _writer = None
+
+    with _totals_lock:
+        if _totals is None or _totals_pid != pid:
+            return
+        totals, _totals = _totals, None
+    conn = _connection()
+    conn.execute("begin immediate;")
+    conn.executemany(
+        _ADD_TOTALS_SQL,
+        [
+            (time, total, success, txn)
+            for txn, (time, total, success) in enumerate(totals)
+        ],
+    )
+    conn.execute("commit;")
+
+
+atexit.register(flush)
+
 
 def build_db():
-    conn = sqlite3.connect(DB_FILE)
+    global _conn
+    # The database file is new (clean() removes the result directory), so a
+    # connection to the previous one must not be reused
+    _conn = None
+    conn = _connection()
     cursor = conn.cursor()
-    cursor.execute("create table new_order_txn(no integer, time real);")
+    cursor.execute("begin;")
+    # Integer primary keys make both tables' lookups rowid B-tree searches
+    cursor.execute("create table new_order_txn(no integer primary key, time real);")
     cursor.execute(
-        "create table test_result(txn integer, avg real, total integer, success integer);"
+        "create table test_result(txn integer primary key, avg real, "
+        "total integer, success integer);"
     )
     cursor.executemany(
         "insert into test_result(txn, avg, total, success) values(?,?,?,?);",
@@ -33,56 +167,46 @@ def build_db():
         ],
     )
     cursor.execute("insert into new_order_txn(no, time) values(?,?);", (0, 0))
-    conn.commit()
-    conn.close()
+    cursor.execute("commit;")
 
 
+# lock is no longer needed and only kept for existing callers; recording
+# never blocks on other workers
 def put_new_order(lock, time):
-    lock.acquire()
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("begin transaction;")
-    cursor.execute("select no from new_order_txn order by no desc;")
-    no = cursor.fetchone()[0]
-    cursor.execute("insert into new_order_txn(no,time) values(?,?);", (no + 1, time))
-    conn.commit()
-    conn.close()
-    lock.release()
+    _put(_PUT_NEW_ORDER_SQL, (time,))
 
 
 def put_txn(lock, txn, time, success):
-    lock.acquire()
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("begin transaction;")
-    cursor.execute("select avg, total, success from test_result where txn = ?", (txn,))
-    avg, total, success_ = cursor.fetchone()
-    if not success:
-        success = 0
-    cursor.execute(
-        "update test_result set avg = ?,total = ?, success = ? where txn=?;",
-        (avg + time, total + 1, success_ + success, txn),
-    )
-    conn.commit()
-    conn.close()
-    lock.release()
+    global _totals, _totals_pid
+    with _totals_lock:
+        if _totals is None or _totals_pid != os.getpid():
+            _totals = [[0.0, 0, 0] for _ in name]
+            _totals_pid = os.getpid()
+        totals = _totals[txn]
+        totals[0] += time
+        totals[1] += 1
+        if success:
+            totals[2] += 1
 
 
 def analysis():
-    conn = sqlite3.connect(DB_FILE)
+    flush()
+    conn = _connection()
     cursor = conn.cursor()
-    cursor.execute("select * from test_result;")
-    rows = cursor.fetchall()
-    result = [{} for i in range(5)]
-    for row in rows:
-        if row[2] != 0:
-            result[row[0]]["avg"] = row[1] / row[2]
-        else:
-            result[row[0]]["avg"] = 0
-        result[row[0]]["total"] = row[2]
-        result[row[0]]["success"] = row[3]
-        result[row[0]]["name"] = name[row[0]]
-    cursor.execute("select * from new_order_txn;")
+    # avg holds the summed time until here; the division is done in SQL
+    cursor.execute(
+        "select txn, case when total = 0 then 0 else avg / total end, "
+        "total, success from test_result order by txn;"
+    )
+    result = [
+        {"avg": avg, "total": total, "success": success, "name": name[txn]}
+        for txn, avg, total, success in cursor.fetchall()
+    ]
+    # Rows are committed in batches per process, so no follows commit order;
+    # number them by time so each is the count of New-Orders done by then
+    cursor.execute(
+        "select row_number() over (order by time, no) - 1, time "
+        "from new_order_txn order by time, no;"
+    )
     new_order_result = cursor.fetchall()
-    conn.close()
     return result, new_order_result